@@ -0,0 +1,79 @@
+"""
+API Response Encoding
+
+Some list endpoints (image choices, media exports, galleries, recent assets)
+return several megabytes of JSON. FastAPI runs such payloads through
+jsonable_encoder() and json.dumps(), which is slow for large lists of plain
+dicts, and sends them uncompressed.
+
+Features:
+- FastJSONResponse: serializes with orjson when installed (compact json.dumps
+  otherwise) and skips jsonable_encoder
+- ApiCompressionMiddleware: gzip for /api responses above a size threshold,
+  leaving images, the Web UI and already encoded responses alone
+"""
+
+import json
+import logging
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize an API payload to JSON bytes
+
+    Payloads orjson cannot handle natively (e.g. Path or datetime subclasses
+    with custom encoders) fall back to FastAPI's encoder, so the output
+    matches the default response.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            content = jsonable_encoder(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse using dumps() instead of the standard library encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class ApiCompressionMiddleware:
+    """Gzip compression for /api responses of at least 'minimum_size' bytes"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 4096,
+        compresslevel: int = 6,
+        path_prefix: str = "/api/",
+    ):
+        self.app = app
+        self.path_prefix = path_prefix
+        # GZipMiddleware already skips responses that carry a Content-Encoding
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size, compresslevel=compresslevel)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.path_prefix):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -0,0 +1,121 @@
+"""
+Asset Filename Classifier
+
+Classifies an asset filename in a single pass: which gallery bucket it belongs
+to (posters, backgrounds, seasons, titlecards) and what kind of media it shows
+(episode, season, background, poster). Replaces the chain of is_*_file()
+checks and determine_media_type() regexes that ran for every scanned file.
+
+Naming conventions recognised (case insensitive, .jpg/.jpeg/.png/.webp/.tbn):
+- Folder-based:  poster.ext, background.ext, Season01.ext, S01E01.ext
+- File-based:    Name_background.ext, Name_Season01.ext, Name_S01E01.ext
+- Anything else with a valid extension is a poster
+
+benchmark_asset_classifier.py checks the results against the previous
+implementation.
+"""
+
+import re
+from typing import Optional, Tuple
+
+# Extensions (without dot) accepted by the gallery buckets
+ASSET_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "tbn"})
+
+# Media kinds derived from the filename alone
+KIND_EPISODE = "episode"
+KIND_SEASON = "season"
+KIND_BACKGROUND = "background"
+KIND_POSTER = "poster"
+KIND_OTHER = "other"
+
+# Kinds whose media type depends on the library type (movie/show)
+LIBRARY_KINDS = frozenset({KIND_BACKGROUND, KIND_POSTER})
+
+# Last "_"-separated token of the stem; group index selects the table row
+_TOKEN_RE = re.compile(r"(background)|(season\d+)|(s\d+e\d+)")
+
+# Reserved folder-based prefixes that keep a file out of the posters bucket
+# even when the rest of the name is not a valid asset (e.g. background.old.jpg)
+_RESERVED_PREFIX_RE = re.compile(r"(?:background|season\d+|s\d+e\d+)\.")
+
+# token group -> (bucket, kind without prefix, kind with "Name_" prefix)
+_TOKEN_TABLE = {
+    1: ("backgrounds", KIND_BACKGROUND, KIND_OTHER),
+    2: ("seasons", KIND_SEASON, KIND_OTHER),
+    3: ("titlecards", KIND_EPISODE, KIND_EPISODE),
+}
+
+# Library folder name hints used when the library type is unknown
+_SHOW_FOLDER_HINTS = ("show", "series", "tv", "serien")
+_MOVIE_FOLDER_HINTS = ("movie", "film", "kino")
+
+# kind -> (show type, movie type, fallback type)
+_MEDIA_TYPES = {
+    KIND_BACKGROUND: ("Show Background", "Movie Background", "Background"),
+    KIND_POSTER: ("Show", "Movie", "Movie"),
+}
+
+
+def classify(filename: str) -> Tuple[Optional[str], str]:
+    """
+    Classify an asset filename
+
+    Args:
+        filename: File name without directory
+
+    Returns:
+        (bucket, kind) - bucket is "posters", "backgrounds", "seasons",
+        "titlecards" or None; kind is one of the KIND_* constants
+    """
+    name = filename.lower()
+    stem, dot, ext = name.rpartition(".")
+    if not dot or ext not in ASSET_EXTENSIONS:
+        return None, KIND_OTHER
+
+    prefix, separator, token = stem.rpartition("_")
+    match = _TOKEN_RE.fullmatch(token)
+    if match:
+        bucket, kind, prefixed_kind = _TOKEN_TABLE[match.lastindex]
+        return bucket, prefixed_kind if separator else kind
+
+    kind = KIND_POSTER if stem == "poster" else KIND_OTHER
+    if _RESERVED_PREFIX_RE.match(name):
+        return None, kind
+    return "posters", kind
+
+
+def media_type(
+    kind: str, library_type: Optional[str] = None, library_folder: Optional[str] = None
+) -> str:
+    """
+    Resolve the media type shown in the gallery for a classified file
+
+    Args:
+        kind: KIND_* constant returned by classify()
+        library_type: "movie" or "show" if known (only used for LIBRARY_KINDS)
+        library_folder: Library folder name, used as a hint if the type is unknown
+    """
+    if kind == KIND_EPISODE:
+        return "Episode"
+    if kind == KIND_SEASON:
+        return "Season"
+
+    types = _MEDIA_TYPES.get(kind)
+    if types is None:
+        return "Movie"
+
+    show_type, movie_type, fallback = types
+    if library_type == "show":
+        return show_type
+    if library_type == "movie":
+        return movie_type
+
+    # Guess from folder name if the library type is unknown
+    if library_folder:
+        folder_lower = library_folder.lower()
+        if any(k in folder_lower for k in _SHOW_FOLDER_HINTS):
+            return show_type
+        if any(k in folder_lower for k in _MOVIE_FOLDER_HINTS):
+            return movie_type
+
+    return fallback
@@ -0,0 +1,372 @@
+"""
+Database module for the persistent asset index (asset_index.db)
+Stores the asset cache on disk so the Web UI can serve it right after a
+restart and reconcile it with the assets directory in the background.
+Also holds details derived from the image files - the low-quality
+placeholder and the pixel size/format - each valid as long as the file's
+mtime matches.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+import logging
+import threading
+from typing import Iterable, Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+LOOKUP_CHUNK_SIZE = 500
+
+# Tables with per-file data that is removed together with the file's index row
+ASSET_DETAIL_TABLES = ("asset_placeholders", "asset_dimensions")
+
+# Bump when the table layout changes; older indexes are dropped and rebuilt
+SCHEMA_VERSION = "1"
+
+
+class AssetIndexDB:
+    """Database class for the persisted asset index"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the database
+
+        Args:
+            db_path: Path to the database file
+        """
+        self.db_path = db_path
+        self.lock = threading.RLock()  # Thread-safety lock
+
+    def _get_connection(self):
+        """Helper to create a new connection"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def initialize(self):
+        """Create the tables if they don't exist (drops outdated layouts)"""
+        logger.info("=" * 60)
+        logger.info("INITIALIZING ASSET INDEX DATABASE")
+        logger.debug(f"Database path: {self.db_path}")
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "CREATE TABLE IF NOT EXISTS asset_index_meta (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                cursor.execute(
+                    "SELECT value FROM asset_index_meta WHERE key = 'schema_version'"
+                )
+                row = cursor.fetchone()
+                if row and row[0] != SCHEMA_VERSION:
+                    logger.info(
+                        f"Asset index schema changed ({row[0]} -> {SCHEMA_VERSION}), rebuilding"
+                    )
+                    cursor.execute("DROP TABLE IF EXISTS asset_index")
+                    cursor.execute("DROP TABLE IF EXISTS asset_directories")
+                    cursor.execute("DROP TABLE IF EXISTS asset_placeholders")
+                    cursor.execute("DROP TABLE IF EXISTS asset_dimensions")
+                    cursor.execute("DELETE FROM asset_index_meta")
+
+                # One row per image file, keyed by path relative to the assets directory
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS asset_index (
+                        path TEXT PRIMARY KEY,
+                        size INTEGER NOT NULL,
+                        ctime REAL NOT NULL,
+                        mtime REAL NOT NULL,
+                        type TEXT
+                    ) WITHOUT ROWID
+                    """
+                )
+                # Directory snapshots used by the incremental scanner
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS asset_directories (
+                        path TEXT PRIMARY KEY,
+                        mtime_ns INTEGER NOT NULL,
+                        subdirs TEXT NOT NULL
+                    ) WITHOUT ROWID
+                    """
+                )
+                # Placeholder images, generated in the background after scans
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS asset_placeholders (
+                        path TEXT PRIMARY KEY,
+                        mtime REAL NOT NULL,
+                        data BLOB NOT NULL
+                    ) WITHOUT ROWID
+                    """
+                )
+                # Pixel size and format from the image headers (format '' = unreadable)
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS asset_dimensions (
+                        path TEXT PRIMARY KEY,
+                        mtime REAL NOT NULL,
+                        width INTEGER NOT NULL,
+                        height INTEGER NOT NULL,
+                        format TEXT NOT NULL
+                    ) WITHOUT ROWID
+                    """
+                )
+                cursor.execute(
+                    "INSERT OR REPLACE INTO asset_index_meta (key, value) VALUES ('schema_version', ?)",
+                    (SCHEMA_VERSION,),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        logger.info("Asset index database initialization complete")
+        logger.info("=" * 60)
+
+    def load(self, root: str) -> Optional[Dict]:
+        """
+        Load the persisted index
+
+        Args:
+            root: Assets directory the index must belong to
+
+        Returns:
+            dict with 'last_scanned', 'assets' {path: (size, ctime, mtime)},
+            'types' {path: type} and 'directories' {path: (mtime_ns, subdirs)},
+            or None if there is no usable index for this root
+        """
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT key, value FROM asset_index_meta")
+                meta = dict(cursor.fetchall())
+
+                if meta.get("root") != root:
+                    if meta.get("root"):
+                        logger.info(
+                            f"Asset index belongs to {meta.get('root')}, not {root} - ignoring it"
+                        )
+                    return None
+
+                directories = {
+                    path: (mtime_ns, json.loads(subdirs))
+                    for path, mtime_ns, subdirs in cursor.execute(
+                        "SELECT path, mtime_ns, subdirs FROM asset_directories"
+                    )
+                }
+                if not directories:
+                    return None
+
+                assets = {}
+                types = {}
+                for path, size, ctime, mtime, type_ in cursor.execute(
+                    "SELECT path, size, ctime, mtime, type FROM asset_index"
+                ):
+                    assets[path] = (size, ctime, mtime)
+                    types[path] = type_
+
+                return {
+                    "last_scanned": float(meta.get("last_scanned") or 0),
+                    "assets": assets,
+                    "types": types,
+                    "directories": directories,
+                }
+            finally:
+                conn.close()
+
+    def save_full(
+        self,
+        root: str,
+        last_scanned: float,
+        assets: Iterable[Tuple[str, int, float, float, Optional[str]]],
+        directories: Iterable[Tuple[str, int, list]],
+    ):
+        """Replace the whole index in a single transaction"""
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM asset_index")
+                cursor.execute("DELETE FROM asset_directories")
+                cursor.executemany(
+                    "INSERT INTO asset_index (path, size, ctime, mtime, type) VALUES (?, ?, ?, ?, ?)",
+                    assets,
+                )
+                cursor.executemany(
+                    "INSERT INTO asset_directories (path, mtime_ns, subdirs) VALUES (?, ?, ?)",
+                    ((path, mtime_ns, json.dumps(subdirs)) for path, mtime_ns, subdirs in directories),
+                )
+                for table in ASSET_DETAIL_TABLES:
+                    cursor.execute(
+                        f"DELETE FROM {table} WHERE path NOT IN (SELECT path FROM asset_index)"
+                    )
+                self._write_meta(cursor, root, last_scanned)
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+    def save_changes(
+        self,
+        root: str,
+        last_scanned: float,
+        upserts: Iterable[Tuple[str, int, float, float, Optional[str]]],
+        deletes: Iterable[str],
+        directory_upserts: Iterable[Tuple[str, int, list]],
+        directory_deletes: Iterable[str],
+    ):
+        """Apply an incremental scan result in a single transaction"""
+        deletes = list(deletes)
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "DELETE FROM asset_index WHERE path = ?", ((path,) for path in deletes)
+                )
+                for table in ASSET_DETAIL_TABLES:
+                    cursor.executemany(
+                        f"DELETE FROM {table} WHERE path = ?", ((path,) for path in deletes)
+                    )
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO asset_index (path, size, ctime, mtime, type) VALUES (?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                cursor.executemany(
+                    "DELETE FROM asset_directories WHERE path = ?",
+                    ((path,) for path in directory_deletes),
+                )
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO asset_directories (path, mtime_ns, subdirs) VALUES (?, ?, ?)",
+                    (
+                        (path, mtime_ns, json.dumps(subdirs))
+                        for path, mtime_ns, subdirs in directory_upserts
+                    ),
+                )
+                self._write_meta(cursor, root, last_scanned)
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+    def get_placeholder_mtimes(self) -> Dict[str, float]:
+        """{path: mtime} of all stored placeholders"""
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                return dict(conn.execute("SELECT path, mtime FROM asset_placeholders"))
+            finally:
+                conn.close()
+
+    def get_placeholders(self, assets: Iterable[Tuple[str, float]]) -> Dict[str, bytes]:
+        """
+        Placeholders of the given assets
+
+        Args:
+            assets: (path, mtime) pairs; placeholders of another mtime are outdated
+
+        Returns:
+            {path: image data} of the assets with a current placeholder
+        """
+        return {
+            path: row[0]
+            for path, row in self._get_current("asset_placeholders", ("data",), assets).items()
+        }
+
+    def save_placeholders(self, placeholders: Iterable[Tuple[str, float, bytes]]):
+        """Store (path, mtime, data) placeholders, replacing outdated ones"""
+        self._save_details(
+            "INSERT OR REPLACE INTO asset_placeholders (path, mtime, data) VALUES (?, ?, ?)",
+            placeholders,
+        )
+
+    def get_dimensions(self, assets: Iterable[Tuple[str, float]]) -> Dict[str, Tuple[int, int, str]]:
+        """
+        Pixel size and format of the given assets
+
+        Args:
+            assets: (path, mtime) pairs; entries of another mtime are outdated
+
+        Returns:
+            {path: (width, height, format)} of the assets with current entries
+        """
+        return self._get_current("asset_dimensions", ("width", "height", "format"), assets)
+
+    def save_dimensions(self, dimensions: Iterable[Tuple[str, float, int, int, str]]):
+        """Store (path, mtime, width, height, format) entries, replacing outdated ones"""
+        self._save_details(
+            "INSERT OR REPLACE INTO asset_dimensions (path, mtime, width, height, format) "
+            "VALUES (?, ?, ?, ?, ?)",
+            dimensions,
+        )
+
+    def _get_current(
+        self, table: str, columns: Tuple[str, ...], assets: Iterable[Tuple[str, float]]
+    ) -> Dict[str, tuple]:
+        """{path: column values} of the rows in 'table' that match the given mtimes"""
+        wanted: Dict[str, float] = dict(assets)
+        if not wanted:
+            return {}
+
+        paths: List[str] = list(wanted)
+        found = {}
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                for start in range(0, len(paths), LOOKUP_CHUNK_SIZE):
+                    chunk = paths[start : start + LOOKUP_CHUNK_SIZE]
+                    rows = conn.execute(
+                        f"SELECT path, mtime, {', '.join(columns)} FROM {table} "
+                        f"WHERE path IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                    for path, mtime, *values in rows:
+                        if mtime == wanted[path]:
+                            found[path] = tuple(values)
+            finally:
+                conn.close()
+        return found
+
+    def _save_details(self, statement: str, rows: Iterable[tuple]):
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                conn.executemany(statement, rows)
+                conn.commit()
+            except sqlite3.Error:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _write_meta(cursor, root: str, last_scanned: float):
+        cursor.executemany(
+            "INSERT OR REPLACE INTO asset_index_meta (key, value) VALUES (?, ?)",
+            [("root", root), ("last_scanned", str(last_scanned))],
+        )
+
+    def close(self):
+        """Close connection - connections are opened per operation."""
+        pass
+
+
+def init_asset_index_db(db_path: Path) -> AssetIndexDB:
+    """
+    Initialize the asset index database
+    """
+    db = AssetIndexDB(db_path)
+    db.initialize()
+    return db
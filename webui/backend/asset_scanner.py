@@ -0,0 +1,562 @@
+"""
+Assets Directory Scanner
+
+Walks the assets directory and remembers what every directory looked like
+during the previous scan, so the periodic cache refresh can skip subtrees that
+did not change instead of re-stat()ing every image on (slow) network storage.
+
+Features:
+- Per-directory snapshot (mtime, subdirectories, image files with stat data)
+- os.scandir based walk that reuses DirEntry data instead of Path objects
+- Top-level library folders are walked in parallel by a bounded thread pool
+- Incremental scans only re-list directories whose mtime changed
+- Returns added / modified / removed files so callers can merge deltas
+- Snapshots are only committed once the caller applied the result
+- Full rescan on demand (ignores all snapshots)
+- Targeted re-listing of directories reported by filesystem events
+- Directory name index (rootfolder -> directories) kept in sync on commit
+- Snapshots can be restored from the persisted asset index
+- Optional I/O throttle (operation budget, latency feedback, busy backoff)
+  and cancellation for background scans
+
+Note: A directory's mtime only changes when entries are created, deleted or
+renamed inside it. Files overwritten in place keep their directory mtime, so
+callers should still schedule a full rescan from time to time.
+"""
+
+import errno
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from stat import S_ISDIR
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Image extensions picked up by the asset cache
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Directory names that are never descended into (Synology index folders)
+SKIP_DIR_NAMES = {"@eaDir"}
+
+# Snapshot mtime of a directory whose listing failed (never matches, so it is retried)
+UNLISTED_MTIME = -1
+
+# stat() errors meaning the directory no longer exists; anything else (EIO,
+# ESTALE on network shares, ...) may be transient and keeps what is known
+GONE_ERRNOS = (errno.ENOENT, errno.ENOTDIR)
+
+# (size, ctime, mtime) as reported by stat()
+FileStat = Tuple[int, float, float]
+
+
+class ScanCancelled(Exception):
+    """Raised inside a throttled scan when its cancel event is set"""
+
+
+class ScanThrottle:
+    """
+    Paces a scan to a budget of filesystem operations per second
+
+    Every directory costs one stat(), plus one listing and one stat() per
+    image file when it is re-listed. The scanner reports each directory's
+    operations and how long they took. The allowed rate drops when the
+    average latency per operation exceeds target_latency (the storage is
+    struggling) and recovers slowly once it is fast again. While is_busy()
+    returns True (e.g. a Posterizarr run is active) the rate is scaled by
+    busy_factor. Shared by all worker threads of a scan.
+    """
+
+    def __init__(
+        self,
+        ops_per_second: float,
+        target_latency: float = 0.02,
+        is_busy: Optional[Callable[[], bool]] = None,
+        busy_factor: float = 0.25,
+        cancel_event: Optional[threading.Event] = None,
+    ):
+        """
+        Args:
+            ops_per_second: Operation budget, 0 disables pacing (cancellation still works)
+            target_latency: Average seconds per operation above which the rate is reduced
+            is_busy: Checked about once per second, slows the scan down while True
+            busy_factor: Fraction of the rate used while is_busy() is True
+            cancel_event: Set to abort the scan with ScanCancelled
+        """
+        self.max_rate = float(ops_per_second)
+        self.min_rate = max(1.0, self.max_rate / 20)
+        self.rate = self.max_rate
+        self.target_latency = target_latency
+        self.is_busy = is_busy
+        self.busy_factor = busy_factor
+        self.cancel_event = cancel_event or threading.Event()
+
+        self.lock = threading.Lock()
+        self.latency = 0.0  # Moving average of seconds per operation
+        self.next_slot = 0.0  # perf_counter() time at which the budget allows more work
+        self.busy = False
+        self.busy_checked = 0.0
+        self.ops = 0
+        self.slept = 0.0
+
+    def pace(self, ops: int, elapsed: float):
+        """
+        Account for 'ops' operations that took 'elapsed' seconds and sleep
+        as long as needed to stay within the budget
+
+        Raises:
+            ScanCancelled: If the cancel event is set
+        """
+        if self.cancel_event.is_set():
+            raise ScanCancelled()
+        if self.max_rate <= 0 or ops <= 0:
+            return
+
+        now = time.perf_counter()
+        with self.lock:
+            self.ops += ops
+            self.latency = 0.8 * self.latency + 0.2 * (elapsed / ops)
+            if self.latency > self.target_latency:
+                self.rate = max(self.min_rate, self.rate * 0.7)
+            elif self.latency < self.target_latency / 2:
+                self.rate = min(self.max_rate, self.rate * 1.05)
+
+            if self.is_busy is not None and now - self.busy_checked >= 1.0:
+                self.busy_checked = now
+                try:
+                    self.busy = bool(self.is_busy())
+                except Exception:
+                    self.busy = False
+
+            rate = self.rate * (self.busy_factor if self.busy else 1.0)
+            self.next_slot = max(self.next_slot, now) + ops / rate
+            delay = self.next_slot - now
+
+        if delay > 0:
+            self.slept += delay
+            if self.cancel_event.wait(delay):
+                raise ScanCancelled()
+
+    def status(self) -> dict:
+        return {
+            "ops_per_second": self.max_rate,
+            "current_rate": round(self.rate * (self.busy_factor if self.busy else 1.0), 1),
+            "latency_ms": round(self.latency * 1000, 3),
+            "busy": self.busy,
+            "ops": self.ops,
+            "slept_seconds": round(self.slept, 2),
+        }
+
+
+class DirectorySnapshot:
+    """State of a single directory as seen by the last scan"""
+
+    __slots__ = ("mtime_ns", "subdirs", "files")
+
+    def __init__(self, mtime_ns: int, subdirs: List[str], files: Dict[str, FileStat]):
+        self.mtime_ns = mtime_ns
+        self.subdirs = subdirs  # Names of child directories
+        self.files = files  # {filename: (size, ctime, mtime)}
+
+
+class ScanResult:
+    """
+    Outcome of a scan pass
+
+    For a full scan, ``added`` contains every image file and ``modified`` /
+    ``removed`` are empty. Paths are relative to the scan root and always use
+    forward slashes.
+    """
+
+    def __init__(self, full: bool):
+        self.full = full
+        self.added: Dict[str, FileStat] = {}
+        self.modified: Dict[str, Tuple[FileStat, FileStat]] = {}  # path -> (old, new)
+        self.removed: Dict[str, FileStat] = {}  # path -> old stat
+        self.snapshots: Dict[str, DirectorySnapshot] = {}
+        self.listed_dirs: List[str] = []  # Directories whose snapshot was rebuilt
+        self.removed_dirs: List[str] = []  # Directories that no longer exist
+        self.dirs_total = 0
+        self.dirs_listed = 0
+        self.files_total = 0  # Image files in all walked directories
+        self.files_stated = 0  # Image files stat()ed in re-listed directories
+        self.errors = 0
+        self.duration = 0.0  # Seconds spent walking
+        self.stat_seconds = 0.0  # Time in stat() calls, summed over worker threads
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files_total / self.duration if self.duration > 0 else 0.0
+
+    def merge(self, other: "ScanResult"):
+        """Fold the result of a subtree walk into this one"""
+        self.added.update(other.added)
+        self.modified.update(other.modified)
+        self.removed.update(other.removed)
+        self.snapshots.update(other.snapshots)
+        self.listed_dirs.extend(other.listed_dirs)
+        self.dirs_total += other.dirs_total
+        self.dirs_listed += other.dirs_listed
+        self.files_total += other.files_total
+        self.files_stated += other.files_stated
+        self.errors += other.errors
+        self.stat_seconds += other.stat_seconds
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class AssetScanner:
+    """Incremental directory walker for the assets directory"""
+
+    def __init__(self, root: Path, workers: int = 1):
+        """
+        Args:
+            root: Assets directory
+            workers: Number of top-level library folders walked in parallel
+        """
+        self.root = Path(root)
+        self.workers = max(1, int(workers))
+        self.snapshots: Dict[str, DirectorySnapshot] = {}
+        self.directories_by_name: Dict[str, List[str]] = {}  # {folder name: [rel_dir, ...]}
+
+    @property
+    def has_snapshot(self) -> bool:
+        """True once a scan has been committed"""
+        return bool(self.snapshots)
+
+    def reset(self):
+        """Forget all snapshots so the next scan is a full one"""
+        self.snapshots = {}
+        self.directories_by_name = {}
+
+    def scan(self, full: bool = False, throttle: Optional[ScanThrottle] = None) -> ScanResult:
+        """
+        Walk the assets directory
+
+        The root directory is handled first; each of its subdirectories (the
+        library folders) is then walked as an independent subtree, in parallel
+        when more than one worker is configured.
+
+        Args:
+            full: Ignore previous snapshots and re-list every directory
+            throttle: Paces the walk and allows cancelling it
+
+        Returns:
+            ScanResult with the file deltas and the new snapshots. The
+            snapshots are not stored until commit() is called.
+
+        Raises:
+            ScanCancelled: If the throttle's cancel event was set (nothing is stored)
+        """
+        start_time = time.perf_counter()
+        previous = {} if full else self.snapshots
+        result = ScanResult(full=full or not previous)
+
+        self._walk("", previous, result, recurse=False, throttle=throttle)
+        root_snapshot = result.snapshots.get("")
+        libraries = list(root_snapshot.subdirs) if root_snapshot is not None else []
+
+        if self.workers > 1 and len(libraries) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.workers, len(libraries)),
+                thread_name_prefix="AssetScan",
+            ) as pool:
+                for partial in pool.map(
+                    lambda name: self._walk_subtree(name, previous, result.full, throttle),
+                    libraries,
+                ):
+                    result.merge(partial)
+        else:
+            for name in libraries:
+                self._walk(name, previous, result, throttle=throttle)
+
+        # Directories that vanished since the last scan
+        for rel_dir, old in previous.items():
+            if rel_dir not in result.snapshots:
+                result.removed_dirs.append(rel_dir)
+                for filename, stat in old.files.items():
+                    result.removed[_join(rel_dir, filename)] = stat
+
+        result.duration = time.perf_counter() - start_time
+        return result
+
+    def scan_directories(self, rel_dirs: Iterable[str]) -> ScanResult:
+        """
+        Re-list directories reported by the assets watcher
+
+        Each directory is re-listed regardless of its mtime (so files replaced
+        in place are picked up). New subdirectories are walked completely,
+        vanished ones are dropped with their whole subtree. Directories that
+        were not reported are trusted as they are and not stat()ed.
+
+        Args:
+            rel_dirs: Directories relative to the root ("" is the root itself)
+
+        Returns:
+            ScanResult whose snapshots cover the whole tree, ready for commit()
+        """
+        start_time = time.perf_counter()
+        result = ScanResult(full=False)
+        snapshots = dict(self.snapshots)
+        result.snapshots = snapshots
+        relisted: Set[str] = set()
+
+        # Parents first, so a new directory is walked once from its parent
+        for rel_dir in sorted(set(rel_dirs), key=lambda d: (d.count("/"), d)):
+            if rel_dir in relisted:
+                continue
+            parent = rel_dir.rpartition("/")[0]
+            if rel_dir and parent not in snapshots:
+                # Not reachable from a known directory; the next scan picks it up
+                continue
+
+            abs_dir = os.path.join(self.root, rel_dir) if rel_dir else str(self.root)
+            old = snapshots.get(rel_dir)
+            try:
+                st = os.stat(abs_dir)
+                mtime_ns = st.st_mtime_ns
+                is_dir = S_ISDIR(st.st_mode)
+            except OSError as e:
+                if e.errno not in GONE_ERRNOS:
+                    logger.debug(f"[AssetScanner] Cannot stat {abs_dir}: {e}")
+                    result.errors += 1
+                    if old is not None:
+                        snapshots[rel_dir] = self._unlisted(old)
+                    continue
+                is_dir = False
+            if not is_dir:
+                if rel_dir in snapshots:
+                    self._drop_tree(rel_dir, snapshots, result)
+                continue
+
+            snapshot = self._list_directory(abs_dir, mtime_ns, result)
+            if snapshot is None:
+                if old is not None:
+                    snapshots[rel_dir] = self._unlisted(old)
+                continue
+            result.dirs_total += 1
+            result.dirs_listed += 1
+            result.files_stated += len(snapshot.files)
+            result.files_total += len(snapshot.files)
+            result.listed_dirs.append(rel_dir)
+            relisted.add(rel_dir)
+            self._diff_files(rel_dir, old, snapshot, result)
+            snapshots[rel_dir] = snapshot
+
+            old_subdirs = set(old.subdirs) if old is not None else set()
+            for name in old_subdirs.difference(snapshot.subdirs):
+                self._drop_tree(_join(rel_dir, name), snapshots, result)
+            for name in snapshot.subdirs:
+                child = _join(rel_dir, name)
+                if child not in snapshots:
+                    # New directory (created or moved in): walk it completely
+                    before = len(result.listed_dirs)
+                    self._walk(child, {}, result)
+                    relisted.update(result.listed_dirs[before:])
+
+        result.duration = time.perf_counter() - start_time
+        return result
+
+    def commit(self, result: ScanResult):
+        """Store the snapshots of a scan once its result has been applied"""
+        self._set_snapshots(result.snapshots)
+
+    def restore(
+        self,
+        directories: Dict[str, Tuple[int, List[str]]],
+        files: Dict[str, FileStat],
+    ):
+        """
+        Rebuild snapshots from persisted data
+
+        Args:
+            directories: {rel_dir: (mtime_ns, subdirs)}
+            files: {rel_path: (size, ctime, mtime)}
+        """
+        snapshots = {
+            rel_dir: DirectorySnapshot(mtime_ns, list(subdirs), {})
+            for rel_dir, (mtime_ns, subdirs) in directories.items()
+        }
+        for rel_path, stat in files.items():
+            rel_dir, _, filename = rel_path.rpartition("/")
+            snapshot = snapshots.get(rel_dir)
+            if snapshot is not None:
+                snapshot.files[filename] = stat
+        self._set_snapshots(snapshots)
+
+    def find_directories(self, name: str) -> List[str]:
+        """Directories (relative paths) whose folder name is 'name'"""
+        return self.directories_by_name.get(name, [])
+
+    def directory_files(self, rel_dir: str) -> Dict[str, FileStat]:
+        """Image files of a directory as seen by the last committed scan"""
+        snapshot = self.snapshots.get(rel_dir)
+        return snapshot.files if snapshot is not None else {}
+
+    def _set_snapshots(self, snapshots: Dict[str, DirectorySnapshot]):
+        directories_by_name: Dict[str, List[str]] = {}
+        for rel_dir in snapshots:
+            if rel_dir:
+                directories_by_name.setdefault(rel_dir.rpartition("/")[2], []).append(rel_dir)
+        for rel_dirs in directories_by_name.values():
+            rel_dirs.sort()
+        self.snapshots = snapshots
+        self.directories_by_name = directories_by_name
+
+    def _walk_subtree(
+        self,
+        rel_dir: str,
+        previous: Dict[str, DirectorySnapshot],
+        full: bool,
+        throttle: Optional[ScanThrottle] = None,
+    ) -> ScanResult:
+        """Walk one library folder into a private result (runs in a worker thread)"""
+        result = ScanResult(full=full)
+        self._walk(rel_dir, previous, result, throttle=throttle)
+        return result
+
+    def _walk(
+        self,
+        start: str,
+        previous: Dict[str, DirectorySnapshot],
+        result: ScanResult,
+        recurse: bool = True,
+        throttle: Optional[ScanThrottle] = None,
+    ):
+        """Depth-first walk from 'start', re-listing only directories whose mtime changed"""
+        stack = [start]
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = os.path.join(self.root, rel_dir) if rel_dir else str(self.root)
+            op_start = time.perf_counter()
+            ops = 1
+
+            # stat() before listing, so a change during listing is picked up next time
+            try:
+                mtime_ns = os.stat(abs_dir).st_mtime_ns
+            except OSError as e:
+                logger.debug(f"[AssetScanner] Cannot stat {abs_dir}: {e}")
+                result.errors += 1
+                if e.errno in GONE_ERRNOS:
+                    continue
+                mtime_ns = None
+
+            old = previous.get(rel_dir)
+            if old is not None and old.mtime_ns == mtime_ns:
+                # Directory unchanged: reuse listing, only descend into children
+                snapshot = old
+            else:
+                snapshot = None
+                if mtime_ns is not None:
+                    snapshot = self._list_directory(abs_dir, mtime_ns, result)
+                if snapshot is not None:
+                    ops += 1 + len(snapshot.files)
+                    result.dirs_listed += 1
+                    result.files_stated += len(snapshot.files)
+                    result.listed_dirs.append(rel_dir)
+                else:
+                    # stat() or listing failed: keep the known contents, retried next pass
+                    snapshot = self._unlisted(old or self.snapshots.get(rel_dir))
+                    if snapshot is None:
+                        continue  # Never listed; nothing to keep
+                # Unchanged for a kept listing, except that a full scan reports its files
+                self._diff_files(rel_dir, old, snapshot, result)
+
+            result.dirs_total += 1
+            result.files_total += len(snapshot.files)
+            result.snapshots[rel_dir] = snapshot
+            if recurse:
+                for name in snapshot.subdirs:
+                    stack.append(f"{rel_dir}/{name}" if rel_dir else name)
+
+            if throttle is not None:
+                throttle.pace(ops, time.perf_counter() - op_start)
+
+    @staticmethod
+    def _drop_tree(
+        rel_dir: str, snapshots: Dict[str, DirectorySnapshot], result: ScanResult
+    ):
+        """Remove a directory and everything below it from the snapshots"""
+        prefix = rel_dir + "/"
+        for path in [p for p in snapshots if p == rel_dir or p.startswith(prefix) or not rel_dir]:
+            old = snapshots.pop(path)
+            result.removed_dirs.append(path)
+            for filename, stat in old.files.items():
+                result.removed[_join(path, filename)] = stat
+
+    @staticmethod
+    def _unlisted(known: Optional[DirectorySnapshot]) -> Optional[DirectorySnapshot]:
+        """
+        Snapshot for a directory that could not be listed
+
+        Keeps the last known contents (a transient error must not look like
+        all files were deleted) with an mtime that never matches, so the next
+        pass lists the directory again.
+        """
+        if known is None:
+            return None
+        return DirectorySnapshot(UNLISTED_MTIME, list(known.subdirs), dict(known.files))
+
+    def _list_directory(
+        self, abs_dir: str, mtime_ns: int, result: ScanResult
+    ) -> Optional[DirectorySnapshot]:
+        """List a directory with os.scandir and stat its image files (None if it cannot be listed)"""
+        subdirs: List[str] = []
+        files: Dict[str, FileStat] = {}
+        stat_seconds = 0.0
+        clock = time.perf_counter
+
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name in SKIP_DIR_NAMES:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(name)
+                        elif name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                            stat_start = clock()
+                            st = entry.stat()
+                            stat_seconds += clock() - stat_start
+                            files[name] = (st.st_size, st.st_ctime, st.st_mtime)
+                    except OSError as e:
+                        logger.debug(f"[AssetScanner] Cannot stat {entry.path}: {e}")
+                        result.errors += 1
+        except OSError as e:
+            logger.warning(f"[AssetScanner] Cannot list directory {abs_dir}: {e}")
+            result.errors += 1
+            return None
+
+        result.stat_seconds += stat_seconds
+        return DirectorySnapshot(mtime_ns, subdirs, files)
+
+    @staticmethod
+    def _diff_files(
+        rel_dir: str,
+        old: Optional[DirectorySnapshot],
+        new: DirectorySnapshot,
+        result: ScanResult,
+    ):
+        """Record added / modified / removed files of a re-listed directory"""
+        old_files = old.files if old is not None else {}
+
+        for filename, stat in new.files.items():
+            previous_stat = old_files.get(filename)
+            if previous_stat is None:
+                result.added[_join(rel_dir, filename)] = stat
+            elif previous_stat != stat:
+                result.modified[_join(rel_dir, filename)] = (previous_stat, stat)
+
+        for filename, stat in old_files.items():
+            if filename not in new.files:
+                result.removed[_join(rel_dir, filename)] = stat
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
@@ -0,0 +1,452 @@
+"""
+Compact In-Memory Asset Records
+
+The gallery buckets of the asset cache hold one entry per image file. A plain
+dict per file (seven keys, a pre-built URL and the file name duplicated from
+the path) costs several hundred bytes each; AssetRecord keeps only the fields
+that cannot be derived and builds the rest when an entry is serialized.
+
+Records still support item access (record["path"], record.get("url")) so code
+written against the old dict entries keeps working.
+
+AssetIndex holds the lookups built once per scan next to the bucket lists:
+path -> record, folder prefix ranges and per-library slices. It also answers
+the filtered, sorted and keyset-paginated gallery queries.
+"""
+
+import base64
+import heapq
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+# Public URL prefix of the assets directory mount
+ASSETS_URL_PREFIX = "/poster_assets/"
+# Grid-sized thumbnail of an asset (DEFAULT_THUMBNAIL_WIDTH of thumbnail_service)
+THUMBNAIL_URL_PREFIX = "/thumbnails/poster_assets/300/"
+
+# Keys of the serialized entry, in API order
+ASSET_FIELDS = (
+    "path",
+    "name",
+    "size",
+    "url",
+    "thumbnail_url",
+    "created",
+    "modified",
+    "type",
+    "width",
+    "height",
+    "format",
+)
+_ASSET_FIELD_SET = frozenset(ASSET_FIELDS)
+
+
+class AssetRecord:
+    """Single image in the asset cache"""
+
+    __slots__ = ("path", "size", "created", "modified", "type", "width", "height", "format")
+
+    def __init__(self, path: str, size: int, created: float, modified: float, type: str):
+        self.path = path  # Relative to the assets directory, forward slashes
+        self.size = size
+        self.created = created  # Creation time (Unix timestamp)
+        self.modified = modified  # Modification time (Unix timestamp)
+        # Media type (Movie, Show, Season, Episode, Background); interned so
+        # records loaded from the index share one string per type
+        self.type = sys.intern(type) if type else type
+        # Pixel size and image format, filled in after the scan from the file
+        # header; format is None until read and "" if the header is unreadable
+        self.width = 0
+        self.height = 0
+        self.format: Optional[str] = None
+
+    def set_dimensions(self, width: int, height: int, format: str):
+        self.width = width
+        self.height = height
+        self.format = sys.intern(format)
+
+    @property
+    def has_dimensions(self) -> bool:
+        return bool(self.format)
+
+    @property
+    def name(self) -> str:
+        return self.path.rpartition("/")[2]
+
+    @property
+    def url(self) -> str:
+        # URL encode the path to handle special characters like #
+        return ASSETS_URL_PREFIX + quote(self.path, safe="/") + version_query(self.modified)
+
+    @property
+    def thumbnail_url(self) -> str:
+        return THUMBNAIL_URL_PREFIX + quote(self.path, safe="/") + version_query(self.modified)
+
+    def __getitem__(self, key: str):
+        if key not in _ASSET_FIELD_SET:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        if key not in _ASSET_FIELD_SET:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return ASSET_FIELDS
+
+    def to_dict(self) -> dict:
+        """Serialize to the API representation"""
+        path = self.path
+        encoded_path = quote(path, safe="/") + version_query(self.modified)
+        return {
+            "path": path,
+            "name": path.rpartition("/")[2],
+            "size": self.size,
+            "url": ASSETS_URL_PREFIX + encoded_path,
+            "thumbnail_url": THUMBNAIL_URL_PREFIX + encoded_path,
+            "created": self.created,
+            "modified": self.modified,
+            "type": self.type,
+            "width": self.width,
+            "height": self.height,
+            "format": self.format,
+        }
+
+    def __repr__(self) -> str:
+        return f"AssetRecord({self.path!r}, type={self.type!r})"
+
+
+def version_query(modified: float) -> str:
+    """
+    Cache busting query of an asset URL ("?t=<mtime in ms>"). The URL changes
+    whenever the file does, so static mounts serve it as immutable.
+    """
+    return f"?t={int(modified * 1000)}"
+
+
+def parse_aspect(value: str) -> float:
+    """
+    Aspect ratio from "16:9", "2:3" or "1.78"
+
+    Raises:
+        ValueError: If the value is not a positive ratio
+    """
+    width, sep, height = value.partition(":")
+    ratio = float(width) / float(height) if sep else float(width)
+    if not ratio > 0:
+        raise ValueError(f"Invalid aspect ratio: {value}")
+    return ratio
+
+
+def records_to_dicts(records: Iterable[AssetRecord]) -> List[dict]:
+    """Serialize a list of records for a JSON response"""
+    return [record.to_dict() for record in records]
+
+
+# Query sort options -> record attribute ("name" is the folder/file path order)
+QUERY_SORTS = {"name": "path", "mtime": "modified", "size": "size"}
+
+
+class InvalidCursor(ValueError):
+    """Raised for cursors that are malformed or belong to another sort order"""
+
+
+def encode_cursor(sort: str, descending: bool, key: tuple) -> str:
+    """Opaque cursor pointing after 'key' ((sort value, path)) in a sort order"""
+    payload = json.dumps({"s": sort, "d": descending, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, descending: bool) -> tuple:
+    """Return the (sort value, path) key of a cursor created for the same sort order"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        value, path = payload["k"]
+        cursor_sort, cursor_descending = payload["s"], payload["d"]
+    except Exception:
+        raise InvalidCursor("Malformed cursor")
+    if cursor_sort != sort or cursor_descending != descending:
+        raise InvalidCursor("Cursor belongs to a different sort order")
+    if not isinstance(path, str) or (sort != "name" and not isinstance(value, (int, float))):
+        raise InvalidCursor("Malformed cursor")
+    return value, path
+
+
+class DimensionFilter:
+    """Pixel size, aspect ratio and format conditions of a gallery query"""
+
+    def __init__(
+        self,
+        min_width: Optional[int] = None,
+        max_width: Optional[int] = None,
+        min_height: Optional[int] = None,
+        max_height: Optional[int] = None,
+        aspect: Optional[float] = None,
+        not_aspect: Optional[float] = None,
+        aspect_tolerance: float = 0.01,
+        formats: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            min_width / max_width / min_height / max_height: Inclusive pixel ranges
+            aspect: Only images with this width/height ratio
+            not_aspect: Only images whose ratio differs from this one
+            aspect_tolerance: Allowed relative deviation of a matching ratio
+            formats: Only these formats ("JPEG", "PNG", "WEBP", ...)
+        """
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+        self.aspect = aspect
+        self.not_aspect = not_aspect
+        self.aspect_tolerance = aspect_tolerance
+        self.formats = frozenset(f.upper() for f in formats) if formats else None
+
+    @property
+    def active(self) -> bool:
+        return any(
+            value is not None
+            for value in (
+                self.min_width,
+                self.max_width,
+                self.min_height,
+                self.max_height,
+                self.aspect,
+                self.not_aspect,
+                self.formats,
+            )
+        )
+
+    def _same_aspect(self, record: AssetRecord, ratio: float) -> bool:
+        return abs(record.width / record.height - ratio) <= ratio * self.aspect_tolerance
+
+    def matches(self, record: AssetRecord) -> bool:
+        if not record.format:
+            return False
+        if self.min_width is not None and record.width < self.min_width:
+            return False
+        if self.max_width is not None and record.width > self.max_width:
+            return False
+        if self.min_height is not None and record.height < self.min_height:
+            return False
+        if self.max_height is not None and record.height > self.max_height:
+            return False
+        if self.formats is not None and record.format not in self.formats:
+            return False
+        if self.aspect is not None and not self._same_aspect(record, self.aspect):
+            return False
+        if self.not_aspect is not None and self._same_aspect(record, self.not_aspect):
+            return False
+        return True
+
+
+class AssetIndex:
+    """
+    Read-only lookups over the gallery buckets of one cache generation
+
+    Built after a scan from the sorted bucket lists and swapped together with
+    them, so it never has to be updated in place. Because the lists are sorted
+    by path, every folder is a contiguous range that is found with a binary
+    search instead of filtering the whole list.
+    """
+
+    __slots__ = ("by_path", "_buckets", "_paths", "_libraries")
+
+    def __init__(self, buckets: Optional[Dict[str, List[AssetRecord]]] = None):
+        """
+        Args:
+            buckets: {bucket: records sorted by path}
+        """
+        buckets = buckets or {}
+        self._buckets = dict(buckets)
+        self._paths = {
+            bucket: [record.path for record in records] for bucket, records in buckets.items()
+        }
+        self.by_path: Dict[str, AssetRecord] = {
+            record.path: record for records in buckets.values() for record in records
+        }
+
+        # {library: {bucket: (start, end)}} ranges into the sorted bucket lists
+        self._libraries: Dict[str, Dict[str, tuple]] = {}
+        for bucket, paths in self._paths.items():
+            start = 0
+            while start < len(paths):
+                library = paths[start].split("/", 1)[0]
+                end = self._prefix_end(paths, library, start)
+                self._libraries.setdefault(library, {})[bucket] = (start, end)
+                start = end
+
+    @staticmethod
+    def _prefix_end(paths: List[str], library: str, start: int) -> int:
+        """End of the range of paths inside 'library' (or the single root file)"""
+        if "/" in paths[start]:
+            # "0" is the character after "/", so it bounds every "<library>/..." path
+            return bisect_left(paths, library + "0", start)
+        return start + 1
+
+    def get(self, path: str) -> Optional[AssetRecord]:
+        return self.by_path.get(path)
+
+    def folder(self, bucket: str, folder_path: str) -> List[AssetRecord]:
+        """Records of one bucket below a folder ("Movies" or "Movies/Action")"""
+        paths = self._paths.get(bucket)
+        if not paths:
+            return []
+        prefix = folder_path.strip("/")
+        start = bisect_left(paths, prefix + "/")
+        end = bisect_left(paths, prefix + "0", start)
+        return self._buckets[bucket][start:end]
+
+    def library(self, library: str, bucket: str) -> List[AssetRecord]:
+        """Records of one bucket in a top-level library folder"""
+        start, end = self.library_range(library, bucket)
+        return self._buckets[bucket][start:end] if end > start else []
+
+    def library_range(self, library: str, bucket: str) -> Tuple[int, int]:
+        """(start, end) positions of a library folder in a bucket list, (0, 0) if absent"""
+        return self._libraries.get(library, {}).get(bucket, (0, 0))
+
+    def query(
+        self,
+        buckets: Iterable[str],
+        folder: Optional[str] = None,
+        media_types: Optional[Iterable[str]] = None,
+        modified_from: Optional[float] = None,
+        modified_to: Optional[float] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        dimensions: Optional[DimensionFilter] = None,
+        sort: str = "name",
+        descending: bool = False,
+        limit: int = 100,
+        after: Optional[tuple] = None,
+    ) -> Tuple[List[AssetRecord], Optional[tuple]]:
+        """
+        Filtered, sorted page of records
+
+        Sorting by name walks the path-sorted lists from the cursor position
+        and stops after one page. Sorting by mtime or size selects the page
+        with a bounded heap, so memory and serialization stay O(limit).
+
+        Args:
+            buckets: Buckets to include ("posters", "backgrounds", ...)
+            folder: Only records below this folder ("Movies" or "Movies/Title")
+            media_types: Only these media types ("Movie", "Show", ...)
+            modified_from / modified_to: Inclusive mtime range (Unix timestamps)
+            min_size / max_size: Inclusive size range in bytes
+            dimensions: Pixel size, aspect ratio and format filters; records
+                whose header has not been read yet never match
+            sort: "name", "mtime" or "size"
+            descending: Reverse the sort order
+            limit: Page size
+            after: Key of the last record of the previous page (see decode_cursor)
+
+        Returns:
+            (records, key of the last record if there are more results, else None)
+        """
+        attribute = QUERY_SORTS[sort]
+        accept = _build_filter(
+            media_types, modified_from, modified_to, min_size, max_size, dimensions
+        )
+
+        if sort == "name":
+            key = lambda record: record.path
+            after_key = after[1] if after is not None else None
+            sources = [self._path_range(b, folder, after_key, descending) for b in buckets]
+            ordered = heapq.merge(*sources, key=key, reverse=descending)
+            page = list(islice(filter(accept, ordered), limit + 1))
+        else:
+            get_value = attrgetter(attribute)
+            key = lambda record: (get_value(record), record.path)
+            candidates = (
+                record
+                for bucket in buckets
+                for record in self._folder_records(bucket, folder)
+                if accept(record)
+            )
+            if after is not None:
+                after_key = tuple(after)
+                if descending:
+                    candidates = (r for r in candidates if key(r) < after_key)
+                else:
+                    candidates = (r for r in candidates if key(r) > after_key)
+            select = heapq.nlargest if descending else heapq.nsmallest
+            page = select(limit + 1, candidates, key=key)
+
+        if len(page) > limit:
+            page = page[:limit]
+            last = page[-1]
+            return page, (getattr(last, attribute), last.path)
+        return page, None
+
+    def _folder_records(self, bucket: str, folder: Optional[str]) -> List[AssetRecord]:
+        if folder:
+            return self.folder(bucket, folder)
+        return self._buckets.get(bucket, [])
+
+    def _path_range(
+        self, bucket: str, folder: Optional[str], after_path: Optional[str], descending: bool
+    ) -> Iterator[AssetRecord]:
+        """Records of a bucket in path order, starting after a cursor path"""
+        paths = self._paths.get(bucket)
+        if not paths:
+            return iter(())
+        records = self._buckets[bucket]
+        start, end = 0, len(paths)
+        if folder:
+            prefix = folder.strip("/")
+            start = bisect_left(paths, prefix + "/")
+            end = bisect_left(paths, prefix + "0", start)
+        if descending:
+            if after_path is not None:
+                end = min(end, bisect_left(paths, after_path, start, end))
+            return (records[i] for i in range(end - 1, start - 1, -1))
+        if after_path is not None:
+            start = max(start, bisect_right(paths, after_path, start, end))
+        return (records[i] for i in range(start, end))
+
+    @property
+    def libraries(self) -> List[str]:
+        return sorted(self._libraries)
+
+    def __len__(self) -> int:
+        return len(self.by_path)
+
+
+def _build_filter(
+    media_types: Optional[Iterable[str]],
+    modified_from: Optional[float],
+    modified_to: Optional[float],
+    min_size: Optional[int],
+    max_size: Optional[int],
+    dimensions: Optional[DimensionFilter] = None,
+) -> Callable[[AssetRecord], bool]:
+    """Combine the query filters into one predicate"""
+    checks = []
+    if media_types:
+        wanted = frozenset(media_types)
+        checks.append(lambda r: r.type in wanted)
+    if modified_from is not None:
+        checks.append(lambda r: r.modified >= modified_from)
+    if modified_to is not None:
+        checks.append(lambda r: r.modified <= modified_to)
+    if min_size is not None:
+        checks.append(lambda r: r.size >= min_size)
+    if max_size is not None:
+        checks.append(lambda r: r.size <= max_size)
+    if dimensions is not None and dimensions.active:
+        checks.append(dimensions.matches)
+
+    if not checks:
+        return lambda r: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda r: all(check(r) for check in checks)
@@ -0,0 +1,292 @@
+"""
+Assets Directory Watcher for Live Gallery Updates
+
+Watches the assets directory with watchdog (inotify on Linux) and reports the
+directories whose image files changed, so the asset cache can be patched
+within a second instead of waiting for the next periodic scan.
+
+Features:
+- Recursive watch on the assets directory
+- Create / modify / delete / move events of image files and directories
+- Events are batched per directory and debounced before they are applied
+- Polling fallback (incremental scans) when filesystem events are unavailable
+- Thread-safe background monitoring
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Set
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from asset_scanner import IMAGE_EXTENSIONS, SKIP_DIR_NAMES
+
+logger = logging.getLogger(__name__)
+
+# Event types that can change the asset cache ("closed" = file written and closed)
+RELEVANT_EVENT_TYPES = {"created", "deleted", "modified", "moved", "closed"}
+
+WATCH_MODES = ("auto", "polling", "off")
+
+
+class AssetsWatcher:
+    """
+    File system watcher for the assets directory
+    Collects changed directories and hands them to a callback in batches
+    """
+
+    def __init__(
+        self,
+        assets_dir: Path,
+        on_changes: Callable[[Set[str]], None],
+        on_poll: Callable[[], None],
+        mode: str = "auto",
+        debounce_seconds: float = 0.5,
+        max_delay_seconds: float = 2.0,
+        poll_interval: int = 60,
+    ):
+        """
+        Initialize the assets watcher
+
+        Args:
+            assets_dir: Path to the assets directory to watch
+            on_changes: Called with the changed directories (relative, "/" separated)
+            on_poll: Called every poll_interval seconds in polling mode
+            mode: "auto" (events, polling if they are unavailable), "polling" or "off"
+            debounce_seconds: Quiet time before a batch of events is applied
+            max_delay_seconds: Apply a batch after this long even if events keep coming
+            poll_interval: Seconds between polls in polling mode
+        """
+        self.assets_dir = Path(assets_dir)
+        self.on_changes = on_changes
+        self.on_poll = on_poll
+        self.mode = mode if mode in WATCH_MODES else "auto"
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.poll_interval = poll_interval
+
+        self.observer: Any = None  # watchdog.observers.Observer instance
+        self.worker: Optional[threading.Thread] = None
+        self.is_running = False
+        self.using_polling = False
+
+        self.lock = threading.Lock()
+        self.pending: Set[str] = set()  # Directories with unapplied changes
+        self.wakeup = threading.Event()
+        self.stop_event = threading.Event()
+
+        self.events_received = 0
+        self.batches_applied = 0
+
+        logger.info(f"AssetsWatcher initialized for directory: {self.assets_dir} (mode: {self.mode})")
+
+    def start(self):
+        """Start watching the assets directory"""
+        if self.is_running:
+            logger.warning("AssetsWatcher is already running")
+            return
+
+        if self.mode == "off":
+            logger.info("AssetsWatcher disabled, relying on periodic cache refreshes")
+            return
+
+        if not self.assets_dir.is_dir():
+            logger.error(f"Assets directory does not exist: {self.assets_dir}")
+            return
+
+        self.stop_event.clear()
+        self.using_polling = self.mode == "polling"
+
+        if not self.using_polling:
+            try:
+                self.observer = Observer()
+                self.observer.schedule(
+                    AssetsFileHandler(self), str(self.assets_dir), recursive=True
+                )
+                self.observer.start()
+            except Exception as e:
+                # e.g. inotify watch limit reached or unsupported filesystem
+                logger.warning(
+                    f"Filesystem events unavailable for {self.assets_dir} ({e}), "
+                    f"falling back to polling every {self.poll_interval}s"
+                )
+                self.observer = None
+                self.using_polling = True
+
+        target = self._poll_loop if self.using_polling else self._apply_loop
+        self.worker = threading.Thread(target=target, daemon=True, name="AssetsWatcher")
+        self.worker.start()
+        self.is_running = True
+
+        logger.info(
+            f"[OK] AssetsWatcher started ({'polling' if self.using_polling else 'events'}): {self.assets_dir}"
+        )
+
+    def stop(self):
+        """Stop watching the assets directory"""
+        if not self.is_running:
+            return
+
+        try:
+            self.stop_event.set()
+            self.wakeup.set()
+            if self.observer:
+                self.observer.stop()
+                self.observer.join(timeout=5)
+                self.observer = None
+            if self.worker:
+                self.worker.join(timeout=5)
+            self.is_running = False
+            logger.info("AssetsWatcher stopped")
+        except Exception as e:
+            logger.error(f"Error stopping AssetsWatcher: {e}", exc_info=True)
+
+    def status(self) -> dict:
+        with self.lock:
+            pending = len(self.pending)
+        return {
+            "running": self.is_running,
+            "mode": self.mode,
+            "polling": self.using_polling,
+            "assets_dir": str(self.assets_dir),
+            "debounce_seconds": self.debounce_seconds,
+            "poll_interval": self.poll_interval,
+            "events_received": self.events_received,
+            "batches_applied": self.batches_applied,
+            "pending_directories": pending,
+        }
+
+    def mark_changed(self, rel_dirs: Iterable[str]):
+        """Queue directories for the next batch"""
+        with self.lock:
+            self.pending.update(rel_dirs)
+            self.events_received += 1
+        self.wakeup.set()
+
+    def _apply_loop(self):
+        """Worker thread: wait for events, debounce, then apply the batch"""
+        while not self.stop_event.is_set():
+            self.wakeup.wait()
+            if self.stop_event.is_set():
+                break
+
+            # Wait until no new events arrived for debounce_seconds (bounded by max_delay_seconds)
+            deadline = time.monotonic() + self.max_delay_seconds
+            self.wakeup.clear()
+            while (
+                time.monotonic() < deadline
+                and self.wakeup.wait(self.debounce_seconds)
+                and not self.stop_event.is_set()
+            ):
+                self.wakeup.clear()
+
+            with self.lock:
+                batch, self.pending = self.pending, set()
+            if not batch or self.stop_event.is_set():
+                continue
+
+            try:
+                self.on_changes(batch)
+                self.batches_applied += 1
+            except Exception as e:
+                logger.error(f"[AssetsWatcher] Error applying {len(batch)} changed directories: {e}")
+
+    def _poll_loop(self):
+        """Worker thread for polling mode: run incremental scans at a fixed interval"""
+        while not self.stop_event.wait(self.poll_interval):
+            try:
+                self.on_poll()
+                self.batches_applied += 1
+            except Exception as e:
+                logger.error(f"[AssetsWatcher] Error during polling scan: {e}")
+
+    def relative_dir(self, path: str) -> Optional[str]:
+        """Path relative to the assets directory, or None if outside or skipped"""
+        try:
+            rel = os.path.relpath(path, self.assets_dir)
+        except ValueError:
+            return None
+        if rel == ".":
+            return ""
+        rel = rel.replace(os.sep, "/")
+        if rel.startswith("../") or rel == "..":
+            return None
+        if any(part in SKIP_DIR_NAMES for part in rel.split("/")):
+            return None
+        return rel
+
+
+class AssetsFileHandler(FileSystemEventHandler):
+    """File system event handler for the assets directory"""
+
+    def __init__(self, watcher: AssetsWatcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        if event.event_type not in RELEVANT_EVENT_TYPES:
+            return
+
+        try:
+            changed = set()
+            paths = [event.src_path]
+            if event.event_type == "moved":
+                paths.append(event.dest_path)
+
+            for path in paths:
+                path = os.fsdecode(path)
+                if event.is_directory:
+                    if event.event_type in ("modified", "closed"):
+                        # Changes inside the directory arrive as file events
+                        continue
+                    # The directory itself and the parent listing it
+                    rel = self.watcher.relative_dir(path)
+                    if rel is None:
+                        continue
+                    changed.add(rel)
+                    if rel:
+                        changed.add(rel.rpartition("/")[0])
+                elif path.lower().endswith(IMAGE_EXTENSIONS):
+                    rel = self.watcher.relative_dir(os.path.dirname(path))
+                    if rel is not None:
+                        changed.add(rel)
+
+            if changed:
+                logger.debug(f"[AssetsWatcher] {event.event_type}: {event.src_path}")
+                self.watcher.mark_changed(changed)
+
+        except Exception as e:
+            logger.error(f"[AssetsWatcher] Error processing event for {event.src_path}: {e}")
+
+
+def create_assets_watcher(
+    assets_dir: Path,
+    on_changes: Callable[[Set[str]], None],
+    on_poll: Callable[[], None],
+    mode: str = "auto",
+    poll_interval: int = 60,
+) -> AssetsWatcher:
+    """
+    Factory function to create an AssetsWatcher
+
+    Args:
+        assets_dir: Path to the assets directory
+        on_changes: Called with a set of changed directories
+        on_poll: Called periodically when filesystem events are unavailable
+        mode: "auto", "polling" or "off"
+        poll_interval: Seconds between polls in polling mode
+
+    Returns:
+        Configured AssetsWatcher instance (not started)
+    """
+    return AssetsWatcher(
+        assets_dir=assets_dir,
+        on_changes=on_changes,
+        on_poll=on_poll,
+        mode=mode,
+        poll_interval=poll_interval,
+    )
@@ -0,0 +1,80 @@
+"""
+Throughput benchmark for large API payloads
+
+Serializes a gallery-sized payload the way FastAPI does by default
+(jsonable_encoder + JSONResponse) and with FastJSONResponse, then reports the
+time per response and the payload size with and without gzip - the numbers
+behind the API_JSON_ENCODER and API_COMPRESSION settings.
+
+Usage:
+    python benchmark_api_responses.py [count] [rounds]   (default: 50000 5)
+"""
+
+import gzip
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from api_responses import ORJSON_AVAILABLE, FastJSONResponse
+from asset_store import AssetRecord, records_to_dicts
+from benchmark_asset_store import generate_files
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def default_response(payload) -> bytes:
+    """What FastAPI does with a returned dict"""
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def fast_response(payload) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+def measure(label: str, render, payload, rounds: int) -> bytes:
+    body = render(payload)
+    start_time = time.perf_counter()
+    for _ in range(rounds):
+        render(payload)
+    elapsed = (time.perf_counter() - start_time) / rounds
+
+    start_time = time.perf_counter()
+    compressed = gzip.compress(body, compresslevel=6)
+    gzip_time = time.perf_counter() - start_time
+
+    logger.info(
+        f"{label:>8}: {elapsed * 1000:8.1f} ms/response, "
+        f"{len(body) / 1024 / 1024:6.2f} MB, gzip {len(compressed) / 1024 / 1024:5.2f} MB "
+        f"({gzip_time * 1000:.0f} ms)"
+    )
+    return body
+
+
+def run_benchmark(count: int, rounds: int):
+    logger.info(f"Building a payload of {count} assets (orjson installed: {ORJSON_AVAILABLE})...")
+    records = [AssetRecord(*entry) for entry in generate_files(count)]
+    payload = {"success": True, "images": records_to_dicts(records), "count": count}
+
+    default_body = measure("default", default_response, payload, rounds)
+    fast_body = measure("fast", fast_response, payload, rounds)
+
+    # Both encoders must produce the same document
+    if json.loads(default_body) != json.loads(fast_body):
+        logger.error("Fast encoder output differs from the default response")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sys.exit(0 if run_benchmark(total, rounds) else 1)
@@ -0,0 +1,279 @@
+"""
+Benchmark for the asset filename classifier
+
+Classifies a synthetic list of filenames with asset_classifier and with the
+previous is_*_file() / determine_media_type() implementation (kept below as a
+reference copy) and verifies both produce identical buckets and media types.
+
+Usage:
+    python benchmark_asset_classifier.py [count]   (default: 1000000)
+"""
+
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from asset_classifier import LIBRARY_KINDS, classify, media_type
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Library folders of the synthetic tree and their type in the media export DB
+LIBRARY_TYPES = {
+    "Movies": "movie",
+    "TV Shows": "show",
+    "4K Filme": None,
+    "Serien": None,
+    "Anime": None,
+    "Collections": None,
+}
+
+
+def get_library_type(library_folder: str) -> Optional[str]:
+    return LIBRARY_TYPES.get(library_folder)
+
+
+# ============================================================================
+# REFERENCE IMPLEMENTATION (previous main.py code, unchanged)
+# ============================================================================
+
+
+def is_poster_file(filename: str) -> bool:
+    lower_name = filename.lower()
+    valid_extensions = (".jpg", ".jpeg", ".png", ".webp", ".tbn")
+
+    if not lower_name.endswith(valid_extensions):
+        return False
+
+    if lower_name.startswith("background."):
+        return False
+    if re.match(r"^season\d+\.", lower_name):
+        return False
+    if re.match(r"^s\d+e\d+\.", lower_name):
+        return False
+
+    if re.search(r"_background\.(jpg|jpeg|png|webp|tbn)$", lower_name):
+        return False
+    if re.search(r"_season\d+\.(jpg|jpeg|png|webp|tbn)$", lower_name):
+        return False
+    if re.search(r"_s\d+e\d+\.(jpg|jpeg|png|webp|tbn)$", lower_name):
+        return False
+
+    return True
+
+
+def is_background_file(filename: str) -> bool:
+    lower_name = filename.lower()
+
+    if re.match(r"^background\.(jpg|jpeg|png|webp|tbn)$", lower_name):
+        return True
+
+    if re.search(r"_background\.(jpg|jpeg|png|webp|tbn)$", lower_name):
+        return True
+
+    return False
+
+
+def is_season_file(filename: str) -> bool:
+    if re.match(r"^season\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
+        return True
+
+    if re.search(r"_season\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
+        return True
+
+    return False
+
+
+def is_titlecard_file(filename: str) -> bool:
+    if re.match(r"^s\d+e\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
+        return True
+
+    if re.search(r"_s\d+e\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
+        return True
+
+    return False
+
+
+def legacy_bucket(filename: str) -> Optional[str]:
+    if is_poster_file(filename):
+        return "posters"
+    if is_background_file(filename):
+        return "backgrounds"
+    if is_season_file(filename):
+        return "seasons"
+    if is_titlecard_file(filename):
+        return "titlecards"
+    return None
+
+
+def legacy_media_type(filename: str, library_folder: str = None) -> str:
+    name = filename.lower()
+    ext_pattern = r"\.(jpg|jpeg|png|webp|tbn)$"
+
+    if re.match(r"^s\d+e\d+" + ext_pattern, name) or re.match(
+        r".*_s\d+e\d+" + ext_pattern, name
+    ):
+        logger.debug(
+            f"[MediaType] {filename} in {library_folder} -> Episode (pattern match)"
+        )
+        return "Episode"
+
+    if re.match(r"^season\d+" + ext_pattern, name):
+        logger.debug(
+            f"[MediaType] {filename} in {library_folder} -> Season (pattern match)"
+        )
+        return "Season"
+
+    library_type = None
+    if library_folder:
+        library_type = get_library_type(library_folder)
+        logger.debug(
+            f"[MediaType] Library '{library_folder}' type from DB: {library_type}"
+        )
+
+    if re.match(r"^background" + ext_pattern, name):
+        if library_type == "show":
+            logger.debug(f"[MediaType] {filename} -> Show Background (library_type=show)")
+            return "Show Background"
+        elif library_type == "movie":
+            logger.debug(f"[MediaType] {filename} -> Movie Background (library_type=movie)")
+            return "Movie Background"
+
+        if library_folder:
+            folder_lower = library_folder.lower()
+            if any(k in folder_lower for k in ["show", "series", "tv", "serien"]):
+                return "Show Background"
+            if any(k in folder_lower for k in ["movie", "film", "kino"]):
+                return "Movie Background"
+
+        return "Background"
+
+    if re.match(r"^poster" + ext_pattern, name):
+        if library_type == "show":
+            logger.debug(f"[MediaType] {filename} -> Show (library_type=show)")
+            return "Show"
+        elif library_type == "movie":
+            logger.debug(f"[MediaType] {filename} -> Movie (library_type=movie)")
+            return "Movie"
+
+        if library_folder:
+            folder_lower = library_folder.lower()
+            if any(k in folder_lower for k in ["show", "series", "tv", "serien"]):
+                return "Show"
+            if any(k in folder_lower for k in ["movie", "film", "kino"]):
+                return "Movie"
+
+    logger.debug(f"[MediaType] {filename} in {library_folder} -> Movie (default)")
+    return "Movie"
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+
+def _random_case(rng: random.Random, text: str) -> str:
+    choice = rng.random()
+    if choice < 0.6:
+        return text
+    if choice < 0.8:
+        return text.capitalize()
+    if choice < 0.9:
+        return text.upper()
+    return "".join(c.upper() if rng.random() < 0.5 else c for c in text)
+
+
+def generate_filenames(count: int, seed: int = 42) -> list:
+    """Build (library_folder, filename) pairs covering all naming conventions"""
+    rng = random.Random(seed)
+    extensions = ["jpg", "jpg", "jpg", "jpeg", "png", "webp", "tbn", "txt", "nfo", "jpg.bak"]
+    titles = ["The Matrix (1999)", "Breaking Bad", "Dune_Part Two", "Alien.Romulus", "Show_1"]
+    libraries = list(LIBRARY_TYPES)
+
+    def stem() -> str:
+        season = rng.randint(0, 30)
+        episode = rng.randint(0, 120)
+        title = rng.choice(titles)
+        return rng.choice(
+            [
+                "poster",
+                "background",
+                f"season{season:02d}",
+                f"s{season:02d}e{episode:02d}",
+                f"{title}",
+                f"{title}_background",
+                f"{title}_season{season}",
+                f"{title}_s{season}e{episode}",
+                f"{title}_poster",
+                "background.old",
+                f"season{season}.backup",
+                f"s{season}e{episode}.orig",
+                f"season{season}_s{season}e{episode}",
+                "_background",
+                "seasonXX",
+                f"{title} s{season}e{episode}",
+                "folder",
+                "",
+            ]
+        )
+
+    return [
+        (
+            rng.choice(libraries),
+            f"{_random_case(rng, stem())}.{_random_case(rng, rng.choice(extensions))}",
+        )
+        for _ in range(count)
+    ]
+
+
+def classify_new(library_folder: str, filename: str):
+    bucket, kind = classify(filename)
+    library_type = get_library_type(library_folder) if kind in LIBRARY_KINDS else None
+    return bucket, media_type(kind, library_type, library_folder)
+
+
+def classify_legacy(library_folder: str, filename: str):
+    return legacy_bucket(filename), legacy_media_type(filename, library_folder)
+
+
+def run_benchmark(count: int):
+    logger.info(f"Generating {count} synthetic filenames...")
+    samples = generate_filenames(count)
+
+    timings = {}
+    results = {}
+    for label, func in (("legacy", classify_legacy), ("classifier", classify_new)):
+        start_time = time.perf_counter()
+        results[label] = [func(library, filename) for library, filename in samples]
+        timings[label] = time.perf_counter() - start_time
+        logger.info(
+            f"{label:>10}: {timings[label]:.2f}s ({count / timings[label]:,.0f} files/sec)"
+        )
+
+    mismatches = [
+        (sample, old, new)
+        for sample, old, new in zip(samples, results["legacy"], results["classifier"])
+        if old != new
+    ]
+    for sample, old, new in mismatches[:20]:
+        logger.error(f"Mismatch for {sample}: legacy={old} classifier={new}")
+
+    logger.info(f"Speedup: {timings['legacy'] / timings['classifier']:.1f}x")
+    if mismatches:
+        logger.error(f"{len(mismatches)} of {count} filenames classified differently")
+        return False
+
+    logger.info(f"All {count} filenames classified identically")
+    return True
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sys.exit(0 if run_benchmark(total) else 1)
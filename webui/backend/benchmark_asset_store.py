@@ -0,0 +1,117 @@
+"""
+Memory benchmark for the asset cache entries
+
+Builds the gallery entries of a synthetic assets tree twice - as the dicts the
+cache used to hold and as AssetRecord objects - and reports the memory each
+representation allocates (measured with tracemalloc).
+
+Usage:
+    python benchmark_asset_store.py [count]   (default: 500000)
+"""
+
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from urllib.parse import quote
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from asset_store import AssetRecord, records_to_dicts
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LIBRARIES = ["Movies", "4K Movies", "TV Shows", "Anime", "Kids #1"]
+MEDIA_TYPES = ["Movie", "Show", "Season", "Episode", "Movie Background", "Show Background"]
+
+
+def generate_files(count: int) -> list:
+    """Build (relative_path, size, ctime, mtime, type) tuples like the scanner produces"""
+    files = []
+    folder_index = 0
+    while len(files) < count:
+        library = LIBRARIES[folder_index % len(LIBRARIES)]
+        folder = f"{library}/Some Title {folder_index} (2{folder_index % 1000:03d}) [tmdb-{folder_index}]"
+        names = ["poster.jpg", "background.jpg", "Season01.jpg", "S01E01.jpg", "S01E02.jpg"]
+        for offset, name in enumerate(names):
+            base_time = 1700000000.0 + folder_index + offset / 10
+            media_type = MEDIA_TYPES[(folder_index + offset) % len(MEDIA_TYPES)]
+            files.append((f"{folder}/{name}", 250000 + folder_index, base_time, base_time, media_type))
+        folder_index += 1
+    return files[:count]
+
+
+def build_dicts(files: list) -> list:
+    """Previous cache entry layout (process_image_path before AssetRecord)"""
+    entries = []
+    for relative_path, size, created, modified, media_type in files:
+        encoded_url_path = quote(relative_path, safe="/")
+        parts = relative_path.split("/")
+        entries.append(
+            {
+                "path": relative_path,
+                "name": parts[-1],
+                "size": size,
+                "url": f"/poster_assets/{encoded_url_path}?t={int(modified * 1000)}",
+                "thumbnail_url": f"/thumbnails/poster_assets/300/{encoded_url_path}?t={int(modified * 1000)}",
+                "created": created,
+                "modified": modified,
+                "type": media_type,
+                "width": 0,
+                "height": 0,
+                "format": None,
+            }
+        )
+    return entries
+
+
+def build_records(files: list) -> list:
+    return [AssetRecord(*entry) for entry in files]
+
+
+def measure(label: str, build, files: list):
+    """Memory allocated by build(files); paths, stat values and types are shared by both layouts"""
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    entries = build(files)
+    elapsed = time.perf_counter() - start_time
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    logger.info(
+        f"{label:>8}: {current / 1024 / 1024:7.1f} MB "
+        f"({current / len(files):.0f} bytes/file, built in {elapsed:.2f}s)"
+    )
+    return entries, current
+
+
+def run_benchmark(count: int):
+    logger.info(f"Generating {count} synthetic asset paths...")
+    files = generate_files(count)
+
+    dicts, dict_bytes = measure("dicts", build_dicts, files)
+    records, record_bytes = measure("records", build_records, files)
+
+    # Serialized records must match the old entries exactly
+    start_time = time.perf_counter()
+    serialized = records_to_dicts(records)
+    elapsed = time.perf_counter() - start_time
+    if serialized != dicts:
+        logger.error("Serialized records differ from the dict entries")
+        return False
+
+    logger.info(f"Serializing all records took {elapsed:.2f}s")
+    logger.info(
+        f"Saved {(dict_bytes - record_bytes) / 1024 / 1024:.1f} MB "
+        f"({(1 - record_bytes / dict_bytes) * 100:.0f}%) for {count} files"
+    )
+    return True
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    sys.exit(0 if run_benchmark(total) else 1)
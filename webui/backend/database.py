@@ -276,6 +276,31 @@ class ImageChoicesDB:
                     conn.close()
                 return None
 
+    def get_choices_by_ids(self, record_ids: List[int]) -> List[sqlite3.Row]:
+        """Get several choices by their IDs (queried in chunks of 900)"""
+        if not record_ids:
+            return []
+
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+                rows = []
+                for i in range(0, len(record_ids), 900):
+                    chunk = record_ids[i : i + 900]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"SELECT * FROM imagechoices WHERE id IN ({placeholders})", chunk
+                    )
+                    rows.extend(cursor.fetchall())
+                conn.close()
+                return rows
+            except sqlite3.Error as e:
+                logger.error(f"Error getting choices by IDs: {e}")
+                if 'conn' in locals():
+                    conn.close()
+                return []
+
     def get_choice_by_title(self, title: str) -> Optional[sqlite3.Row]:
         """Get a specific choice by its Title"""
         with self.lock:
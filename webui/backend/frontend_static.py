@@ -0,0 +1,155 @@
+"""
+Pre-compressed Frontend Assets
+
+The built Web UI (JS/CSS bundles, index.html, locale files) is served as
+plain files by default. This module prepares Brotli and gzip variants once at
+startup so the frontend mount can answer with the smallest encoding the
+browser accepts, without compressing on every request.
+
+Variants are looked up in this order:
+- Sidecar files next to the source ("index.js.br", "index.js.gz"), e.g.
+  produced by the frontend build
+- Files in the cache directory, generated here when missing or outdated
+
+Brotli is used when the optional 'brotli' package is installed; gzip always works.
+"""
+
+import gzip
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Text formats worth compressing (images and fonts are compressed already)
+COMPRESSIBLE_EXTENSIONS = {
+    ".js",
+    ".mjs",
+    ".css",
+    ".html",
+    ".json",
+    ".svg",
+    ".txt",
+    ".map",
+    ".xml",
+    ".webmanifest",
+    ".ico",
+}
+
+# Smaller files do not gain anything from compression
+MIN_COMPRESS_SIZE = 1024
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps the output identical between runs
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _is_current(variant: Path, source_mtime: float) -> bool:
+    try:
+        return variant.stat().st_mtime >= source_mtime
+    except OSError:
+        return False
+
+
+def precompress_directory(directory: Path, cache_dir: Path) -> Dict[str, Dict[str, Path]]:
+    """
+    Find or create compressed variants of all compressible files in 'directory'
+
+    Args:
+        directory: Frontend build directory (e.g. frontend/dist)
+        cache_dir: Where generated variants are written
+
+    Returns:
+        {relative posix path: {encoding: variant path}}
+    """
+    directory = Path(directory)
+    cache_dir = Path(cache_dir)
+    encodings = [enc for enc in ENCODINGS if enc != "br" or BROTLI_AVAILABLE]
+
+    variants: Dict[str, Dict[str, Path]] = {}
+    generated = 0
+    saved_bytes = 0
+
+    for source in directory.rglob("*"):
+        if source.suffix.lower() not in COMPRESSIBLE_EXTENSIONS or not source.is_file():
+            continue
+        try:
+            st = source.stat()
+        except OSError:
+            continue
+        if st.st_size < MIN_COMPRESS_SIZE:
+            continue
+
+        relative = source.relative_to(directory).as_posix()
+        data = None
+        for encoding in encodings:
+            suffix = ENCODINGS[encoding]
+            sidecar = source.with_name(source.name + suffix)
+            if _is_current(sidecar, st.st_mtime):
+                variants.setdefault(relative, {})[encoding] = sidecar
+                continue
+
+            target = cache_dir / (relative + suffix)
+            if not _is_current(target, st.st_mtime):
+                try:
+                    if data is None:
+                        data = source.read_bytes()
+                    compressed = _compress(data, encoding)
+                    if len(compressed) >= st.st_size:
+                        continue
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = target.with_name(target.name + ".tmp")
+                    tmp_path.write_bytes(compressed)
+                    os.replace(tmp_path, target)
+                    generated += 1
+                    saved_bytes += st.st_size - len(compressed)
+                except Exception as e:
+                    logger.warning(f"Could not compress {relative} ({encoding}): {e}")
+                    continue
+            variants.setdefault(relative, {})[encoding] = target
+
+    logger.info(
+        f"Frontend assets pre-compressed: {len(variants)} files "
+        f"({', '.join(encodings)}), {generated} variants generated, "
+        f"{saved_bytes / 1024:.0f} KB saved"
+    )
+    return variants
+
+
+def select_encoding(accept_encoding: str, available: Iterable[str]) -> Optional[str]:
+    """
+    Pick the preferred encoding from 'available' that the client accepts
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header
+        available: Encodings with an existing variant
+
+    Returns:
+        Content-Encoding to use, or None for the uncompressed file
+    """
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q=") and params[2:].strip("0.") == "":
+            continue  # q=0 means "not acceptable"
+        accepted.add(name.strip())
+
+    for encoding in ENCODINGS:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
@@ -0,0 +1,95 @@
+"""
+Compressed Log Archives
+
+Posterizarr moves the previous run's logs to RotatedLogs/Logs_<timestamp>/
+and the Web UI rotates FrontendUI.log; both were kept as plain text. Logs
+compress about 10:1, so rotated files are stored as "<name>.gz" instead.
+log_tail, the log endpoints and the runtime parser read archives
+transparently. How many archives are kept is still decided by Posterizarr's
+maxLogs setting and UI_LOG_BACKUPS.
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from log_tail import COMPRESSED_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+# Only files in RotatedLogs are compressed (not CSV/JSON exports)
+ARCHIVE_PATTERN = "*/*.log"
+
+# Skip files changed more recently, in case a rotation is still in progress
+MIN_AGE_SECONDS = 60
+
+
+def compress_log(source: Path, target: Optional[Path] = None, remove_source: bool = True) -> Path:
+    """
+    Compress 'source' to 'target' (default: source + ".gz")
+
+    The archive is written under a temporary name and keeps the source's
+    modification time, so sorting rotated logs by date is unaffected.
+    """
+    source = Path(source)
+    target = Path(target) if target else source.with_name(source.name + COMPRESSED_SUFFIX)
+    tmp_path = target.with_name(target.name + ".tmp")
+    st = source.stat()
+    try:
+        with open(source, "rb") as src, gzip.open(tmp_path, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if remove_source:
+        source.unlink()
+    return target
+
+
+def rotate_compressed(source: str, dest: str):
+    """RotatingFileHandler.rotator writing the rotated file as an archive"""
+    compress_log(Path(source), Path(dest))
+
+
+def archive_name(default_name: str) -> str:
+    """RotatingFileHandler.namer matching rotate_compressed"""
+    return default_name + COMPRESSED_SUFFIX
+
+
+def compress_rotated_logs(rotated_dir: Path) -> Tuple[int, int]:
+    """
+    Compress plain .log files in the rotation folders of 'rotated_dir'
+
+    Returns:
+        (files compressed, bytes saved)
+    """
+    rotated_dir = Path(rotated_dir)
+    if not rotated_dir.is_dir():
+        return 0, 0
+
+    compressed = 0
+    saved = 0
+    now = time.time()
+    for path in sorted(rotated_dir.glob(ARCHIVE_PATTERN)):
+        try:
+            st = path.stat()
+            if not path.is_file() or now - st.st_mtime < MIN_AGE_SECONDS:
+                continue
+            archive = compress_log(path)
+            saved += st.st_size - archive.stat().st_size
+            compressed += 1
+        except OSError as e:
+            # Posterizarr may be deleting old rotation folders at the same time
+            logger.debug(f"Could not compress {path}: {e}")
+
+    if compressed:
+        logger.info(
+            f"Compressed {compressed} rotated log files, {saved / 1024 / 1024:.1f} MB saved"
+        )
+    return compressed, saved
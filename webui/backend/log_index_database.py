@@ -0,0 +1,557 @@
+"""
+Database module for the full-text log index (log_index.db)
+Indexes the Logs, UILogs and RotatedLogs directories into SQLite FTS5 so the
+Web UI can search the whole log history without reading the files.
+
+Ingestion is incremental: each file is checkpointed by byte offset and only
+new complete lines are read. A file is recognized by its inode and first
+bytes, so when Posterizarr moves Logs/ into RotatedLogs/Logs_<timestamp>/
+the already indexed lines move with it instead of being indexed again.
+The same applies when a rotated log is later compressed to "<name>.gz":
+offsets refer to the uncompressed data, so the archive is recognized as
+the fully indexed file and not read again. Index rows of deleted files are
+removed.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from log_tail import COMPRESSED_SUFFIX, is_compressed, log_size, open_log
+
+logger = logging.getLogger(__name__)
+
+# Indexed files, relative to the Posterizarr base directory
+LOG_SOURCES = (
+    "Logs/*.log",
+    "UILogs/*.log",
+    "UILogs/*.log.[0-9]*",
+    "RotatedLogs/*/*.log",
+    "RotatedLogs/*/*.log.gz",
+)
+
+# Bytes compared to recognize a file after it was moved (covers the run header)
+HEAD_SIZE = 4096
+# Bytes read and committed per transaction while ingesting
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Bump when the table layout changes; older indexes are dropped and rebuilt
+SCHEMA_VERSION = "1"
+
+# [2025-11-04 10:44:39] [INFO]    |L.123  | message              (Posterizarr.ps1)
+# [2025-11-04 10:44:39] [INFO    ] [BACKEND:main:lifespan:1894] - message  (Web UI)
+LINE_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2})[^\]]*\]\s*\[\s*([A-Za-z]+)\s*\]")
+
+# Search terms: "quoted phrases" or single words, optionally with a trailing * for prefixes
+QUERY_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+class FileState(NamedTuple):
+    """What the checkpoint of a file is compared against"""
+
+    st_ino: int  # 0 for archives (compression creates a new inode)
+    st_size: int  # Uncompressed size
+    st_mtime: float
+
+
+def parse_line(line: str) -> Tuple[Optional[str], Optional[str]]:
+    """(timestamp 'YYYY-MM-DD HH:MM:SS', upper-case level) of a log line, or (None, None)"""
+    match = LINE_PATTERN.match(line)
+    if not match:
+        return None, None
+    return match.group(1).replace("T", " "), match.group(2).upper()
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Turn user input into an FTS5 query: all terms must match, quoted parts
+    are phrases and a trailing * matches prefixes. FTS5 operators and
+    punctuation are treated as text, so any input is a valid query.
+
+    Returns None if the input contains nothing searchable.
+    """
+    terms = []
+    for phrase, word in QUERY_TERM_PATTERN.findall(text or ""):
+        term = phrase or word
+        prefix = not phrase and term.endswith("*")
+        term = term.rstrip("*") if prefix else term
+        if not re.search(r"\w", term):
+            continue
+        quoted = '"' + term.replace('"', '""') + '"'
+        terms.append(quoted + "*" if prefix else quoted)
+    return " ".join(terms) if terms else None
+
+
+class LogIndexDB:
+    """Database class for the full-text log index"""
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the database
+
+        Args:
+            db_path: Path to the database file
+        """
+        self.db_path = db_path
+        self.lock = threading.RLock()  # Thread-safety lock
+        self.ingest_lock = threading.Lock()  # One ingestion pass at a time
+
+    def _get_connection(self):
+        """Helper to create a new connection"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def initialize(self):
+        """Create the tables if they don't exist (drops outdated layouts)"""
+        logger.info("=" * 60)
+        logger.info("INITIALIZING LOG INDEX DATABASE")
+        logger.debug(f"Database path: {self.db_path}")
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self.lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "CREATE TABLE IF NOT EXISTS log_index_meta (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                cursor.execute("SELECT value FROM log_index_meta WHERE key = 'schema_version'")
+                row = cursor.fetchone()
+                if row and row[0] != SCHEMA_VERSION:
+                    logger.info(f"Log index schema changed ({row[0]} -> {SCHEMA_VERSION}), rebuilding")
+                    cursor.execute("DROP TABLE IF EXISTS log_files")
+                    cursor.execute("DROP TABLE IF EXISTS log_lines")
+                    cursor.execute("DROP TABLE IF EXISTS log_fts")
+                    cursor.execute("DELETE FROM log_index_meta")
+
+                # One row per indexed file with its ingestion checkpoint
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS log_files (
+                        id INTEGER PRIMARY KEY,
+                        path TEXT NOT NULL UNIQUE,
+                        inode INTEGER NOT NULL,
+                        head BLOB NOT NULL,
+                        size INTEGER NOT NULL,
+                        mtime REAL NOT NULL,
+                        offset INTEGER NOT NULL,
+                        lines INTEGER NOT NULL,
+                        last_timestamp TEXT,
+                        last_level TEXT
+                    )
+                    """
+                )
+                # Line metadata; the text lives in log_fts under the same rowid
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS log_lines (
+                        id INTEGER PRIMARY KEY,
+                        file_id INTEGER NOT NULL,
+                        line INTEGER NOT NULL,
+                        timestamp TEXT,
+                        level TEXT
+                    )
+                    """
+                )
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_log_lines_file ON log_lines(file_id)"
+                )
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_log_lines_timestamp ON log_lines(timestamp)"
+                )
+                cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5(text)")
+                cursor.execute(
+                    "INSERT OR REPLACE INTO log_index_meta (key, value) VALUES ('schema_version', ?)",
+                    (SCHEMA_VERSION,),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        logger.info("Log index database initialization complete")
+        logger.info("=" * 60)
+
+    def ingest(
+        self, base_dir: Path, blocking: bool = True, max_bytes: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Index new lines of all log files
+
+        Args:
+            base_dir: Posterizarr base directory (LOG_SOURCES are relative to it)
+            blocking: Wait for a running pass instead of returning None
+            max_bytes: Stop after reading about this many bytes (None = no limit)
+
+        Returns:
+            Stats dict ('complete' is False if max_bytes stopped the pass early),
+            or None if another pass was running and blocking is False
+        """
+        if not self.ingest_lock.acquire(blocking=blocking):
+            return None
+        try:
+            return self._ingest(Path(base_dir), max_bytes)
+        finally:
+            self.ingest_lock.release()
+
+    def _ingest(self, base_dir: Path, max_bytes: Optional[int]) -> Dict:
+        stats = {"files": 0, "new_files": 0, "moved": 0, "removed": 0, "lines": 0, "complete": True}
+
+        candidates = []
+        for pattern in LOG_SOURCES:
+            for path in sorted(base_dir.glob(pattern)):
+                if path.name.endswith(".tmp"):
+                    continue  # Archive still being written
+                st = _file_state(path)
+                if st is not None:
+                    candidates.append((path.relative_to(base_dir).as_posix(), path, st))
+        stats["files"] = len(candidates)
+
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT id, path, inode, head, size, mtime, offset, lines, last_timestamp, last_level FROM log_files"
+            )
+            known = {row[0]: row for row in cursor.fetchall()}
+            by_path = {row[1]: file_id for file_id, row in known.items()}
+
+            claimed: Dict[int, str] = {}
+            pending = []  # (path, file, stat, head) without checkpoint at their path
+            work = []  # (file_id or None, path, file, stat, head)
+            for rel, path, st in candidates:
+                file_id = by_path.get(rel)
+                row = known.get(file_id)
+                if row and row[2] == st.st_ino and row[4] == st.st_size and row[5] == st.st_mtime:
+                    claimed[file_id] = rel  # Unchanged
+                    continue
+                head = _read_head(path)
+                if head is None:
+                    continue
+                if row and _continues(row, st, head):
+                    claimed[file_id] = rel
+                    work.append((file_id, rel, path, st, head))
+                else:
+                    pending.append((rel, path, st, head))
+
+            # Files that moved (log rotation) keep their checkpoint and lines
+            for rel, path, st, head in pending:
+                file_id = next(
+                    (
+                        file_id
+                        for file_id, row in known.items()
+                        if file_id not in claimed and row[3] and _continues(row, st, head)
+                    ),
+                    None,
+                )
+                if file_id is not None:
+                    claimed[file_id] = rel
+                    stats["moved"] += 1
+                    logger.debug(f"Log index: {known[file_id][1]} moved to {rel}")
+                else:
+                    stats["new_files"] += 1
+                work.append((file_id, rel, path, st, head))
+
+            with self.lock:
+                removed = [file_id for file_id in known if file_id not in claimed]
+                for file_id in removed:
+                    cursor.execute(
+                        "DELETE FROM log_fts WHERE rowid IN (SELECT id FROM log_lines WHERE file_id = ?)",
+                        (file_id,),
+                    )
+                    cursor.execute("DELETE FROM log_lines WHERE file_id = ?", (file_id,))
+                    cursor.execute("DELETE FROM log_files WHERE id = ?", (file_id,))
+                stats["removed"] = len(removed)
+
+                # Two steps, so files swapping paths never collide on the UNIQUE path
+                renamed = [(file_id, rel) for file_id, rel in claimed.items() if known[file_id][1] != rel]
+                cursor.executemany(
+                    "UPDATE log_files SET path = ? WHERE id = ?",
+                    [(f"\0{file_id}", file_id) for file_id, _ in renamed],
+                )
+                cursor.executemany(
+                    "UPDATE log_files SET path = ? WHERE id = ?",
+                    [(rel, file_id) for file_id, rel in renamed],
+                )
+                conn.commit()
+
+            # Oldest files first: line ids follow ingestion order and search
+            # returns the highest ids first, so on a first build the current
+            # logs must not end up below the rotated ones
+            work.sort(key=lambda item: (item[3].st_mtime, item[1]))
+
+            budget = max_bytes
+            for file_id, rel, path, st, head in work:
+                if budget is not None and budget <= 0:
+                    stats["complete"] = False
+                    break
+                if file_id is None:
+                    with self.lock:
+                        cursor.execute(
+                            "INSERT INTO log_files (path, inode, head, size, mtime, offset, lines) VALUES (?, ?, ?, 0, 0, 0, 0)",
+                            (rel, st.st_ino, head),
+                        )
+                        conn.commit()
+                    file_id = cursor.lastrowid
+                    row = (file_id, rel, st.st_ino, head, 0, 0, 0, 0, None, None)
+                else:
+                    row = known[file_id]
+                lines, read, done = self._ingest_file(conn, row, path, st, head, budget)
+                stats["lines"] += lines
+                if budget is not None:
+                    budget -= read
+                if not done:
+                    stats["complete"] = False
+                    break
+        finally:
+            conn.close()
+
+        if stats["lines"] or stats["removed"] or stats["moved"]:
+            logger.info(
+                f"Log index updated: {stats['lines']} lines, {stats['new_files']} new files, "
+                f"{stats['moved']} moved, {stats['removed']} removed"
+            )
+        return stats
+
+    def _ingest_file(
+        self, conn, row, path: Path, st: FileState, head: bytes, budget: Optional[int]
+    ) -> Tuple[int, int, bool]:
+        """
+        Index complete lines after the checkpoint of 'row'
+
+        Returns:
+            (lines indexed, bytes read, False if 'budget' ran out before the end)
+        """
+        file_id, _, _, _, _, _, offset, line_count, last_timestamp, last_level = row
+        cursor = conn.cursor()
+        total_lines = 0
+        total_read = 0
+        done = True
+        compressed = is_compressed(path)
+
+        with open_log(path) as f:
+            f.seek(offset)
+            while offset < st.st_size:
+                size = CHUNK_SIZE if budget is None else min(CHUNK_SIZE, budget - total_read)
+                if size <= 0:
+                    done = False
+                    break
+                data = f.read(size)
+                if not data:
+                    break
+                unterminated = False
+                if compressed and not data.endswith(b"\n"):
+                    # Seeking back in an archive decompresses it from the start,
+                    # so finish the line instead. Archives are complete: a last
+                    # line without newline is indexed too.
+                    data += f.readline(CHUNK_SIZE)
+                    if not data.endswith(b"\n"):
+                        data += b"\n"
+                        unterminated = True
+                end = data.rfind(b"\n")
+                if end < 0:
+                    if len(data) < size:
+                        break  # Last line is still being written
+                    if size < CHUNK_SIZE:
+                        done = False  # Budget ends inside a line
+                        break
+                    end = len(data) - 1  # Overlong line, index it in pieces
+                if end < len(data) - 1:
+                    data = data[: end + 1]
+                    f.seek(offset + len(data))
+
+                entries = []
+                for raw in data.split(b"\n")[:-1]:
+                    line_count += 1
+                    text = raw.rstrip(b"\r").decode("utf-8", errors="ignore").replace("\x00", "").strip()
+                    if not text:
+                        continue
+                    timestamp, level = parse_line(text)
+                    if timestamp:
+                        last_timestamp, last_level = timestamp, level
+                    # Continuation lines (stack traces, multi-line messages)
+                    # inherit the time and level of the entry they belong to
+                    entries.append((line_count, last_timestamp, last_level, text))
+
+                offset += len(data) - unterminated
+                total_read += len(data)
+                total_lines += len(entries)
+
+                with self.lock:
+                    # Ids are assigned here (only one ingestion pass runs at a time)
+                    # so both tables can be filled with executemany
+                    first_id = cursor.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM log_lines").fetchone()[0]
+                    cursor.executemany(
+                        "INSERT INTO log_lines (id, file_id, line, timestamp, level) VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (first_id + index, file_id, line_no, timestamp, level)
+                            for index, (line_no, timestamp, level, _) in enumerate(entries)
+                        ],
+                    )
+                    cursor.executemany(
+                        "INSERT INTO log_fts (rowid, text) VALUES (?, ?)",
+                        [(first_id + index, entry[3]) for index, entry in enumerate(entries)],
+                    )
+                    cursor.execute(
+                        """
+                        UPDATE log_files SET inode = ?, head = ?, offset = ?, lines = ?,
+                            last_timestamp = ?, last_level = ? WHERE id = ?
+                        """,
+                        (st.st_ino, head, offset, line_count, last_timestamp, last_level, file_id),
+                    )
+                    conn.commit()
+
+        # Size and mtime mark the file as fully indexed, so unchanged files are
+        # skipped without being opened
+        if offset >= st.st_size:
+            with self.lock:
+                cursor.execute(
+                    "UPDATE log_files SET inode = ?, head = ?, size = ?, mtime = ? WHERE id = ?",
+                    (st.st_ino, head, st.st_size, st.st_mtime, file_id),
+                )
+                conn.commit()
+        return total_lines, total_read, done
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        levels: Optional[Iterable[str]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        files: Optional[Iterable[str]] = None,
+        limit: int = 100,
+        before_id: Optional[int] = None,
+    ) -> Dict:
+        """
+        Search indexed log lines, newest first
+
+        Args:
+            query: Words/"phrases" that must all appear (None = filters only)
+            levels: Levels to include (INFO, WARNING, ERROR, ...)
+            since / until: Inclusive 'YYYY-MM-DD HH:MM:SS' bounds
+            files: File names ("Scriptlog.log") or paths relative to the base
+                directory ("RotatedLogs/Logs_20250101_120000/Scriptlog.log")
+            limit: Maximum number of results
+            before_id: Only results older than this id (the 'next_before' of
+                the previous page)
+
+        Returns:
+            {"results": [...], "next_before": id or None}
+        """
+        match = build_match_query(query) if query else None
+        if query and match is None:
+            return {"results": [], "next_before": None}
+
+        conditions = []
+        params: List = []
+        if match:
+            # Walk the FTS index by rowid so the newest matches come first without sorting
+            source = "log_fts JOIN log_lines l ON l.id = log_fts.rowid"
+            id_column = "log_fts.rowid"
+            conditions.append("log_fts MATCH ?")
+            params.append(match)
+        else:
+            source = "log_lines l JOIN log_fts ON log_fts.rowid = l.id"
+            id_column = "l.id"
+        levels = [level.upper() for level in (levels or []) if level]
+        if levels:
+            conditions.append(f"l.level IN ({','.join('?' * len(levels))})")
+            params.extend(levels)
+        if since:
+            conditions.append("l.timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("l.timestamp <= ?")
+            params.append(until)
+        files = [name for name in (files or []) if name]
+        if files:
+            file_conditions = []
+            for name in files:
+                # Scriptlog.log also matches archives compressed to Scriptlog.log.gz
+                names = [name] if is_compressed(name) else [name, name + COMPRESSED_SUFFIX]
+                for variant in names:
+                    file_conditions.append("f.path = ? OR f.path LIKE ? ESCAPE '\\'")
+                    escaped = variant.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    params.extend([variant, "%/" + escaped])
+            conditions.append("(" + " OR ".join(file_conditions) + ")")
+        if before_id is not None:
+            conditions.append(f"{id_column} < ?")
+            params.append(before_id)
+
+        sql = f"""
+            SELECT l.id, f.path, l.line, l.timestamp, l.level, log_fts.text
+            FROM {source} JOIN log_files f ON f.id = l.file_id
+            {"WHERE " + " AND ".join(conditions) if conditions else ""}
+            ORDER BY {id_column} DESC LIMIT ?
+        """
+        params.append(limit + 1)
+
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+        results = [
+            {"id": row[0], "file": row[1], "line": row[2], "timestamp": row[3], "level": row[4], "text": row[5]}
+            for row in rows[:limit]
+        ]
+        return {
+            "results": results,
+            "next_before": results[-1]["id"] if len(rows) > limit else None,
+        }
+
+    def get_stats(self) -> Dict:
+        """Number of indexed files and lines"""
+        conn = self._get_connection()
+        try:
+            files, lines = conn.execute("SELECT COUNT(*), COALESCE(SUM(lines), 0) FROM log_files").fetchone()
+        finally:
+            conn.close()
+        return {"files": files, "lines": lines}
+
+    def close(self):
+        """Close connection - connections are opened per operation."""
+        pass
+
+
+def _file_state(path: Path) -> Optional[FileState]:
+    try:
+        st = path.stat()
+        if not path.is_file():
+            return None
+        if is_compressed(path):
+            return FileState(0, log_size(path), st.st_mtime)
+        return FileState(st.st_ino, st.st_size, st.st_mtime)
+    except OSError:
+        return None
+
+
+def _read_head(path: Path) -> Optional[bytes]:
+    try:
+        with open_log(path) as f:
+            return f.read(HEAD_SIZE)
+    except (OSError, EOFError):
+        return None
+
+
+def _continues(row, st: FileState, head: bytes) -> bool:
+    """Whether the file with 'st' / 'head' is the one checkpointed in 'row' (possibly grown)"""
+    _, _, inode, stored_head, _, _, offset, _, _, _ = row
+    if inode and st.st_ino and inode != st.st_ino:
+        return False
+    return st.st_size >= offset and head[: len(stored_head)] == stored_head
+
+
+def init_log_index_db(db_path: Path) -> LogIndexDB:
+    """
+    Initialize the log index database
+    """
+    db = LogIndexDB(db_path)
+    db.initialize()
+    return db
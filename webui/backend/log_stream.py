@@ -0,0 +1,239 @@
+"""
+Shared Log Streaming
+
+Every /ws/logs connection used to poll its log file on its own (stat + reopen
+every 0.3s) and send one websocket frame per line. This module runs a single
+tailer per log file and fans its output out to all connected clients.
+
+Features:
+- One LogTailer task per file, woken by watchdog events with a polling
+  fallback (events can be missed on Docker/Windows mounts)
+- New lines are read from the last byte offset and broadcast as one batch
+- Each subscriber has a bounded queue; a client that falls behind gets its
+  queued batches dropped and one resync marker instead, so a slow browser
+  never blocks the tailer or grows memory without limit
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from log_tail import log_size, read_lines_after
+
+logger = logging.getLogger(__name__)
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Seconds between stat() checks without (or in addition to) file events
+POLL_INTERVAL = 0.3
+FALLBACK_POLL_INTERVAL = 2.0
+# Wait after a file event so bursts of writes end up in one batch
+BATCH_DELAY = 0.1
+# Lines read per batch and batches queued per subscriber
+MAX_BATCH_LINES = 2000
+SUBSCRIBER_QUEUE_SIZE = 64
+
+
+class LogSubscriber:
+    """
+    One client of a LogTailer
+
+    get() returns ("lines", [str, ...]) for new lines, or ("resync", offset)
+    when batches were dropped: the client should reload the log up to
+    'offset' (the next batch continues from there).
+    """
+
+    def __init__(self, tailer: "LogTailer", max_batches: int):
+        self.tailer = tailer
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_batches)
+        self.dropped_batches = 0
+
+    @property
+    def path(self) -> Path:
+        return self.tailer.path
+
+    def offer(self, lines: List[str], offset: int):
+        """Queue a batch; on overflow replace the backlog with a resync marker"""
+        try:
+            self.queue.put_nowait(("lines", lines))
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped_batches += 1
+            # Everything before the end of this batch is covered by the resync
+            self.queue.put_nowait(("resync", offset))
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Tuple[str, Any]]:
+        """Next message, or None after 'timeout' seconds without one"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LogTailer:
+    """Follows one log file and broadcasts new complete lines to its subscribers"""
+
+    def __init__(self, path: Path, poll_interval: float):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.subscribers: set = set()
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        try:
+            self.position = log_size(path)
+        except OSError:
+            self.position = 0
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.changed.wait(), self.poll_interval)
+                await asyncio.sleep(BATCH_DELAY)
+            except asyncio.TimeoutError:
+                pass
+            self.changed.clear()
+
+            try:
+                size = log_size(self.path)
+            except OSError:
+                continue  # Not created yet, or being rotated
+            if size == self.position:
+                continue
+
+            try:
+                while True:
+                    lines, offset, start = await asyncio.to_thread(
+                        read_lines_after, self.path, self.position, MAX_BATCH_LINES
+                    )
+                    if start < self.position:
+                        logger.info(f"Log file {self.path.name} was truncated or rotated")
+                    # Position update and broadcast happen together in the event
+                    # loop, so subscribers joining in between never miss lines
+                    self.position = offset
+                    content = [line.strip() for line in lines if line.strip()]
+                    if content:
+                        for subscriber in list(self.subscribers):
+                            subscriber.offer(content, offset)
+                    # Stop at the end, or at a line that is still being written
+                    if offset >= size or len(lines) < MAX_BATCH_LINES:
+                        break
+            except OSError as e:
+                logger.warning(f"Error reading log file {self.path}: {e}")
+                await asyncio.sleep(1)
+
+
+class _LogEventHandler(FileSystemEventHandler):
+    """Wakes tailers from the watchdog thread"""
+
+    def __init__(self, hub: "LogStreamHub"):
+        self.hub = hub
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path:
+                self.hub.notify(Path(path))
+
+
+class LogStreamHub:
+    """Registry of LogTailers, started on first subscribe and stopped on last unsubscribe"""
+
+    def __init__(self, max_batches: int = SUBSCRIBER_QUEUE_SIZE):
+        self.max_batches = max_batches
+        self.tailers: Dict[Path, LogTailer] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.observer: Any = None  # watchdog.observers.Observer instance
+        self.watched_dirs: Dict[Path, Any] = {}
+
+    def _watch(self, directory: Path) -> bool:
+        """Schedule a watchdog watch for 'directory'; False if events are unavailable"""
+        if not WATCHDOG_AVAILABLE:
+            return False
+        if directory in self.watched_dirs:
+            return True
+        try:
+            if self.observer is None:
+                self.observer = Observer()
+                self.observer.daemon = True
+                self.observer.start()
+            self.watched_dirs[directory] = self.observer.schedule(
+                _LogEventHandler(self), str(directory), recursive=False
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Log events unavailable for {directory}, polling instead: {e}")
+            return False
+
+    def subscribe(self, path: Path) -> Tuple[LogSubscriber, int]:
+        """
+        Subscribe to new lines of 'path'
+
+        Returns:
+            (subscriber, byte offset the stream starts at); lines before the
+            offset are the caller's initial view (e.g. read_lines_before)
+        """
+        self.loop = asyncio.get_running_loop()
+        key = Path(path).resolve()
+        tailer = self.tailers.get(key)
+        if tailer is None:
+            watched = key.parent.is_dir() and self._watch(key.parent)
+            tailer = LogTailer(key, FALLBACK_POLL_INTERVAL if watched else POLL_INTERVAL)
+            self.tailers[key] = tailer
+            tailer.start()
+            logger.debug(f"Started log tailer for {key} (events: {watched})")
+
+        subscriber = LogSubscriber(tailer, self.max_batches)
+        tailer.subscribers.add(subscriber)
+        return subscriber, tailer.position
+
+    def unsubscribe(self, subscriber: LogSubscriber):
+        tailer = subscriber.tailer
+        tailer.subscribers.discard(subscriber)
+        if not tailer.subscribers and self.tailers.get(tailer.path) is tailer:
+            tailer.stop()
+            del self.tailers[tailer.path]
+            directory = tailer.path.parent
+            if directory in self.watched_dirs and not any(
+                t.path.parent == directory for t in self.tailers.values()
+            ):
+                try:
+                    self.observer.unschedule(self.watched_dirs.pop(directory))
+                except Exception:
+                    pass
+            logger.debug(f"Stopped log tailer for {tailer.path}")
+
+    def notify(self, path: Path):
+        """Called from the watchdog thread for every file event"""
+        tailer = self.tailers.get(path)
+        if tailer is not None and self.loop is not None:
+            self.loop.call_soon_threadsafe(tailer.changed.set)
+
+    def shutdown(self):
+        for tailer in self.tailers.values():
+            tailer.stop()
+        self.tailers.clear()
+        self.watched_dirs.clear()
+        if self.observer is not None:
+            try:
+                self.observer.stop()
+            except Exception:
+                pass
+            self.observer = None
@@ -0,0 +1,213 @@
+"""
+Log Tail Reader
+
+Posterizarr's logs grow to hundreds of MB during long runs, while the Web UI
+only ever shows the end of them. Instead of reading whole files, the helpers
+here seek backwards from the end (or from a byte offset) in blocks, so
+fetching the last N lines costs O(N) regardless of the file size.
+
+Byte offsets double as pagination cursors: every page reports where its first
+line starts and where its last line ends, which are valid "before" / "after"
+positions for the neighbouring pages.
+
+Lines are decoded as UTF-8 (undecodable bytes dropped) and returned with a
+"\\n" terminator, like readlines() in text mode.
+
+Rotated logs compressed to "<name>.gz" are read transparently; offsets then
+refer to the uncompressed data. Archives cannot be read backwards, so their
+tail is found by streaming through them once.
+"""
+
+import gzip
+import os
+from collections import deque
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+BLOCK_SIZE = 64 * 1024
+
+# Suffix of compressed rotated logs
+COMPRESSED_SUFFIX = ".gz"
+
+
+def is_compressed(path: Path) -> bool:
+    return Path(path).name.endswith(COMPRESSED_SUFFIX)
+
+
+def find_log(directory: Path, name: str) -> Optional[Path]:
+    """'name' in 'directory', or its compressed archive; None if neither exists"""
+    path = Path(directory) / name
+    if path.is_file():
+        return path
+    archive = path.with_name(path.name + COMPRESSED_SUFFIX)
+    if not is_compressed(path) and archive.is_file():
+        return archive
+    return None
+
+
+def open_log(path: Path):
+    """Binary file object for a log or a compressed log archive"""
+    return gzip.open(path, "rb") if is_compressed(path) else open(path, "rb")
+
+
+def log_size(path: Path) -> int:
+    """
+    Size of the (uncompressed) log data
+
+    For archives this is read from the gzip trailer, which stores the size
+    modulo 4 GiB - plenty for single log files.
+    """
+    if not is_compressed(path):
+        return os.path.getsize(path)
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) < 4:
+            return 0
+        f.seek(-4, os.SEEK_END)
+        return int.from_bytes(f.read(4), "little")
+
+
+def _decode(raw: bytes) -> str:
+    return raw.rstrip(b"\r").decode("utf-8", errors="ignore") + "\n"
+
+
+def read_lines_before(
+    path: Path,
+    count: int,
+    end: Optional[int] = None,
+    predicate: Optional[Callable[[str], bool]] = None,
+) -> Tuple[List[str], int, int]:
+    """
+    Up to 'count' lines ending before byte offset 'end'
+
+    Args:
+        path: Log file
+        count: Maximum number of lines
+        end: Byte offset to read backwards from (default: end of file); must
+            be a line start, e.g. the 'start' of a previous page
+        predicate: Only lines for which this returns True are returned and counted
+
+    Returns:
+        (lines in file order, byte offset of the first returned line, end offset used)
+    """
+    if is_compressed(path):
+        return _read_archive_lines_before(path, count, end, predicate)
+
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size if end is None else max(0, min(end, size))
+        found: List[str] = []  # Newest first
+        first_start = end
+        pos = end
+        remainder = b""  # Leading part of the data read so far, may be an incomplete line
+        at_end = True
+
+        while len(found) < count:
+            if pos == 0:
+                # The remainder is the first line of the file
+                parts = [remainder]
+                first_index = 0
+            else:
+                read = min(BLOCK_SIZE, pos)
+                pos -= read
+                f.seek(pos)
+                parts = (f.read(read) + remainder).split(b"\n")
+                first_index = 1
+            cursor = pos + sum(len(part) + 1 for part in parts) - 1
+
+            for index in range(len(parts) - 1, first_index - 1, -1):
+                part = parts[index]
+                start = cursor - len(part)
+                cursor = start - 1
+                if at_end:
+                    at_end = False
+                    if not part:
+                        continue  # Nothing after the last newline
+                line = _decode(part)
+                if predicate is None or predicate(line):
+                    found.append(line)
+                    first_start = start
+                    if len(found) >= count:
+                        break
+
+            if first_index == 0:
+                break
+            remainder = parts[0]
+
+    found.reverse()
+    return found, first_start, end
+
+
+def _read_archive_lines_before(
+    path: Path, count: int, end: Optional[int], predicate: Optional[Callable[[str], bool]]
+) -> Tuple[List[str], int, int]:
+    window: deque = deque(maxlen=max(count, 0))  # (start offset, line)
+    pos = 0
+    with gzip.open(path, "rb") as f:
+        for raw in f:
+            if end is not None and pos + len(raw) > end:
+                break
+            line = _decode(raw.rstrip(b"\n"))
+            if count > 0 and (predicate is None or predicate(line)):
+                window.append((pos, line))
+            pos += len(raw)
+    end = pos if end is None else min(end, pos)
+    first_start = window[0][0] if window else end
+    return [line for _, line in window], first_start, end
+
+
+def read_lines_after(path: Path, start: int, count: int) -> Tuple[List[str], int, int]:
+    """
+    Up to 'count' complete lines starting at byte offset 'start'
+
+    A trailing line without newline is still being written and is left for
+    the next call (archives are complete, so there it is returned). If the
+    file shrank below 'start' (truncated or rotated), reading restarts at the
+    beginning.
+
+    Returns:
+        (lines, byte offset after the last returned line, start offset used)
+    """
+    lines: List[str] = []
+    compressed = is_compressed(path)
+    with open_log(path) as f:
+        size = log_size(path) if compressed else f.seek(0, os.SEEK_END)
+        if start > size:
+            start = 0
+        f.seek(start)
+        offset = start
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                if compressed:
+                    lines.append(_decode(raw))
+                    offset += len(raw)
+                break
+            lines.append(_decode(raw[:-1]))
+            offset += len(raw)
+            if len(lines) >= count:
+                break
+    return lines, offset, start
+
+
+def complete_lines_end(path: Path) -> int:
+    """Byte offset after the last newline (0 if the file has no complete line)"""
+    if is_compressed(path):
+        return log_size(path)  # Archives are complete
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            read = min(BLOCK_SIZE, pos)
+            pos -= read
+            f.seek(pos)
+            index = f.read(read).rfind(b"\n")
+            if index >= 0:
+                return pos + index + 1
+    return 0
+
+
+def tail_lines(
+    path: Path, count: int, predicate: Optional[Callable[[str], bool]] = None
+) -> List[str]:
+    """Last 'count' lines of a file (only lines matching 'predicate' if given)"""
+    if count <= 0:
+        return []
+    return read_lines_before(path, count, predicate=predicate)[0]
@@ -17,7 +17,7 @@ import logging
 import time
 import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent
@@ -38,6 +38,7 @@ class LogsWatcher:
         db_instance=None,
         runtime_db_instance=None,
         media_export_db_instance=None,
+        on_media_export_imported: Optional[Callable[[], None]] = None,
     ):
         """
         Initialize the logs watcher
@@ -47,11 +48,13 @@ class LogsWatcher:
             db_instance: ImageChoices database instance
             runtime_db_instance: Runtime database instance
             media_export_db_instance: Plex export database instance
+            on_media_export_imported: Called after Plex/OtherMedia export CSVs were imported
         """
         self.logs_dir = Path(logs_dir)
         self.db = db_instance
         self.runtime_db = runtime_db_instance
         self.media_export_db = media_export_db_instance
+        self.on_media_export_imported = on_media_export_imported
 
         self.observer: Any = None  # watchdog.observers.Observer instance
         self.handler: Any = None  # LogsFileHandler instance
@@ -775,6 +778,7 @@ class LogsWatcher:
                 logger.info(f"  Duration: {elapsed:.2f}s")
                 logger.info(f"  Stats: {results['library_count']} libraries, {results['episode_count']} episodes")
                 logger.info("=" * 80)
+                self._notify_media_export_imported()
             else:
                 logger.error(
                     f"[Thread {thread_id}] [ERROR] Plex CSV import failed: media_export_db_instance is None"
@@ -810,6 +814,7 @@ class LogsWatcher:
                 logger.info(f"  Duration: {elapsed:.2f}s")
                 logger.info(f"  Stats: {results['library_count']} libraries, {results['episode_count']} episodes")
                 logger.info("=" * 80)
+                self._notify_media_export_imported()
             else:
                 logger.error(
                     f"[Thread {thread_id}] [ERROR] OtherMedia CSV import failed: media_export_db_instance is None"
@@ -824,6 +829,15 @@ class LogsWatcher:
         finally:
             logger.debug(f"[Thread {thread_id}] OtherMedia CSV import thread finishing")
 
+    def _notify_media_export_imported(self):
+        """Let the asset cache pick up library types from the new export"""
+        if not self.on_media_export_imported:
+            return
+        try:
+            self.on_media_export_imported()
+        except Exception as e:
+            logger.error(f"Error refreshing library types after export import: {e}")
+
     def _safe_import_runtime(self, json_filename: str):
         """Thread-safe runtime import wrapper"""
         thread_id = threading.get_ident()
@@ -1024,6 +1038,7 @@ def create_logs_watcher(
     db_instance=None,
     runtime_db_instance=None,
     media_export_db_instance=None,
+    on_media_export_imported: Optional[Callable[[], None]] = None,
 ) -> LogsWatcher:
     """
     Factory function to create and configure a LogsWatcher
@@ -1033,6 +1048,7 @@ def create_logs_watcher(
         db_instance: ImageChoices database instance
         runtime_db_instance: Runtime database instance
         media_export_db_instance: Plex export database instance
+        on_media_export_imported: Called after export CSVs were imported
 
     Returns:
         Configured LogsWatcher instance
@@ -1058,7 +1074,7 @@ def create_logs_watcher(
         db_instance=db_instance,
         runtime_db_instance=runtime_db_instance,
         media_export_db_instance=media_export_db_instance,
-        # Callbacks are no longer needed here
+        on_media_export_imported=on_media_export_imported,
     )
 
     logger.info("[OK] LogsWatcher instance created successfully")
@@ -20,13 +20,14 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
+import io
 import json
 import subprocess
 import asyncio
 import os
 import httpx
 from pathlib import Path
-from typing import Optional, List, Literal, Dict
+from typing import Optional, List, Literal, Dict, Tuple
 import logging
 import re
 import time
@@ -38,14 +39,21 @@ import xml.etree.ElementTree as ET
 import sys
 from urllib.parse import quote
 import zipfile
+import mimetypes
+import base64
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import shutil
 import sqlite3
 import bcrypt
 import secrets
 from starlette.responses import FileResponse
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+from email.utils import formatdate, parsedate_to_datetime
 from PIL import Image, ImageDraw, ImageChops
 from io import BytesIO
+from operator import attrgetter
 from base64 import b64encode
 try:
     from .overlay_generator import generate_overlay_image
@@ -55,6 +63,42 @@ try:
     from .queue_manager import QueueManager
 except ImportError:
     from queue_manager import QueueManager
+try:
+    from .asset_scanner import AssetScanner, ScanCancelled, ScanThrottle
+except ImportError:
+    from asset_scanner import AssetScanner, ScanCancelled, ScanThrottle
+try:
+    from . import asset_classifier
+except ImportError:
+    import asset_classifier
+try:
+    from .scan_metrics import ScanHistory, ScanMetrics
+except ImportError:
+    from scan_metrics import ScanHistory, ScanMetrics
+try:
+    from .asset_store import (
+        AssetIndex,
+        AssetRecord,
+        DimensionFilter,
+        InvalidCursor,
+        decode_cursor,
+        encode_cursor,
+        parse_aspect,
+        records_to_dicts,
+        version_query,
+    )
+except ImportError:
+    from asset_store import (
+        AssetIndex,
+        AssetRecord,
+        DimensionFilter,
+        InvalidCursor,
+        decode_cursor,
+        encode_cursor,
+        parse_aspect,
+        records_to_dicts,
+        version_query,
+    )
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -155,6 +199,11 @@ RUNNING_FILE = TEMP_DIR / "Posterizarr.Running"
 IMAGECHOICES_DB_PATH = DATABASE_DIR / "imagechoices.db"
 QUEUE_STAGING_DIR = BASE_DIR / "queue_staging"
 QUEUE_DB_PATH = DATABASE_DIR / "queue.db"
+ASSET_INDEX_DB_PATH = DATABASE_DIR / "asset_index.db"
+LOG_INDEX_DB_PATH = DATABASE_DIR / "log_index.db"
+THUMBNAIL_CACHE_DIR = BASE_DIR / "Cache" / "thumbnails"
+# Compressed variants of the Web UI files (the build directory may be read-only)
+FRONTEND_CACHE_DIR = BASE_DIR / "Cache" / "frontend"
 
 # Initialize Queue Manager
 queue_manager = QueueManager(QUEUE_DB_PATH)
@@ -165,7 +214,9 @@ process_lock = threading.RLock()
 # Clear UILogs on startup - remove all log files
 import glob
 
-for log_file in glob.glob(str(UI_LOGS_DIR / "*.log")):
+for log_file in glob.glob(str(UI_LOGS_DIR / "*.log")) + glob.glob(
+    str(UI_LOGS_DIR / "*.log.[0-9]*")
+):
     try:
         os.remove(log_file)
         pass  # Silent - no console output
@@ -183,8 +234,18 @@ LOG_LEVEL_MAP = {
 
 WEBUI_SETTINGS_PATH = UI_LOGS_DIR / "webui_settings.json"
 
-# Global queue listener for thread-safe logging
-queue_listener = None
+
+def _get_int_env(name: str, default: int, minimum: int) -> int:
+    """Integer environment setting, falls back to the default if it is invalid"""
+    try:
+        return max(minimum, int(os.environ.get(name, default)))
+    except ValueError:
+        logger.warning(f"Invalid {name} value, using {default}")
+        return default
+
+
+# Background writer owning FrontendUI.log (backend records and UI entries)
+ui_log_writer = None
 
 
 def load_webui_settings():
@@ -334,9 +395,15 @@ else:
     logger.debug(f"Config exists: {CONFIG_PATH.exists()}")
 
 
+# FrontendUI.log rotation: size per file and rotated files kept
+UI_LOG_MAX_MB = _get_int_env("UI_LOG_MAX_MB", 10, minimum=0)
+UI_LOG_BACKUPS = _get_int_env("UI_LOG_BACKUPS", 3, minimum=0)
+# Store rotated logs (RotatedLogs, FrontendUI.log backups) as .gz archives
+LOG_COMPRESSION = os.environ.get("LOG_COMPRESSION", "true").strip().lower() == "true"
+
 def setup_backend_ui_logger():
     """Setup backend logger to also write to FrontendUI.log"""
-    global queue_listener
+    global ui_log_writer
     logger.info("Initializing backend UI logger")
     try:
         # Create UILogs directory if not exists
@@ -353,36 +420,23 @@ def setup_backend_ui_logger():
         else:
             logger.debug("No existing FrontendUI.log to clear")
 
-        # Create File Handler for FrontendUI.log with thread-safe queue
-        logger.debug(f"Creating file handler for: {backend_log_path}")
-        backend_ui_file_handler = logging.FileHandler(
-            backend_log_path, encoding="utf-8", mode="w"
+        # One background thread writes backend records and UI entries, with
+        # buffered writes and size-based rotation
+        from ui_log_writer import UILogWriter
+
+        logger.debug(f"Creating UI log writer for: {backend_log_path}")
+        ui_log_writer = UILogWriter(
+            backend_log_path,
+            level=LOG_LEVEL,  # Use configurable log level
+            max_bytes=UI_LOG_MAX_MB * 1024 * 1024,
+            backup_count=UI_LOG_BACKUPS,
+            compress=LOG_COMPRESSION,
         )
-        backend_ui_file_handler.setLevel(LOG_LEVEL)  # Use configurable log level
-        backend_ui_file_handler.setFormatter(
-            logging.Formatter(
-                "[%(asctime)s] [%(levelname)-8s] [BACKEND:%(name)s:%(funcName)s:%(lineno)d] - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
-        logger.debug("File handler formatter configured")
-
-        # Use QueueHandler for thread-safe logging
-        from queue import Queue
-        from logging.handlers import QueueHandler, QueueListener
-
-        log_queue = Queue(-1)  # Unlimited queue size
-        queue_handler = QueueHandler(log_queue)
-
-        # Start queue listener in background thread
-        queue_listener = QueueListener(
-            log_queue, backend_ui_file_handler, respect_handler_level=True
-        )
-        queue_listener.start()
-        logger.debug("Queue listener started for thread-safe logging")
+        ui_log_writer.start()
+        logger.debug("UI log writer started for thread-safe logging")
 
         # Add queue handler to root logger (so all backend logs are captured)
-        logging.getLogger().addHandler(queue_handler)
+        logging.getLogger().addHandler(ui_log_writer.queue_handler())
         logger.info(f"Backend logger initialized successfully: {backend_log_path}")
         logger.info(
             f"Backend logging to FrontendUI.log enabled with {LOG_LEVEL_ENV} level"
@@ -549,6 +603,99 @@ except ImportError as e:
     )
     logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
 
+# Import asset index database module
+try:
+    logger.debug("Attempting to import asset_index_database module")
+    from asset_index_database import init_asset_index_db, AssetIndexDB
+
+    ASSET_INDEX_DB_AVAILABLE = True
+    logger.info("Asset index database module loaded successfully")
+except ImportError as e:
+    ASSET_INDEX_DB_AVAILABLE = False
+    logger.warning(
+        f"Asset index database not available: {e}. Startup will wait for a full asset scan."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import log index database module
+try:
+    logger.debug("Attempting to import log_index_database module")
+    from log_index_database import init_log_index_db, LogIndexDB
+
+    LOG_INDEX_DB_AVAILABLE = True
+    logger.info("Log index database module loaded successfully")
+except ImportError as e:
+    LOG_INDEX_DB_AVAILABLE = False
+    logger.warning(f"Log index database not available: {e}. Log search will be disabled.")
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import assets watcher module
+try:
+    logger.debug("Attempting to import assets_watcher module")
+    from assets_watcher import create_assets_watcher, AssetsWatcher
+
+    ASSETS_WATCHER_AVAILABLE = True
+    logger.info("Assets watcher module loaded successfully")
+except ImportError as e:
+    ASSETS_WATCHER_AVAILABLE = False
+    logger.warning(
+        f"Assets watcher not available: {e}. Gallery updates will wait for the periodic refresh."
+    )
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import thumbnail service module
+try:
+    logger.debug("Attempting to import thumbnail_service module")
+    from thumbnail_service import (
+        PLACEHOLDER_MEDIA_TYPE,
+        SHEET_WIDTHS,
+        THUMBNAIL_FORMATS,
+        THUMBNAIL_WIDTHS,
+        SheetTile,
+        ThumbnailService,
+        create_placeholder,
+        create_thumbnail_service,
+    )
+
+    THUMBNAILS_AVAILABLE = True
+    logger.info("Thumbnail service module loaded successfully")
+except ImportError as e:
+    THUMBNAILS_AVAILABLE = False
+    logger.warning(f"Thumbnail service not available: {e}. Galleries will load full size images.")
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Log readers, streaming and archives (stdlib only)
+from log_tail import find_log, log_size, open_log, read_lines_after, read_lines_before, tail_lines
+from log_stream import LogStreamHub
+from log_archive import compress_rotated_logs
+from ui_log_store import UILogStore
+
+# Import frontend pre-compression module
+try:
+    logger.debug("Attempting to import frontend_static module")
+    from frontend_static import BROTLI_AVAILABLE, precompress_directory, select_encoding
+
+    FRONTEND_PRECOMPRESSION_AVAILABLE = True
+    logger.info("Frontend pre-compression module loaded successfully")
+except ImportError as e:
+    FRONTEND_PRECOMPRESSION_AVAILABLE = False
+    BROTLI_AVAILABLE = False
+    logger.warning(f"Frontend pre-compression not available: {e}. Web UI files are served uncompressed.")
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
+# Import API response encoding module
+try:
+    logger.debug("Attempting to import api_responses module")
+    from api_responses import ORJSON_AVAILABLE, ApiCompressionMiddleware, FastJSONResponse
+
+    API_RESPONSES_AVAILABLE = True
+    logger.info("API response encoding module loaded successfully")
+except ImportError as e:
+    API_RESPONSES_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+    logger.warning(f"API response encoding not available: {e}. Using FastAPI's default encoder.")
+    logger.debug(f"ImportError details: {type(e).__name__}: {str(e)}", exc_info=True)
+
 logger.info("Module loading completed")
 logger.debug(f"Config Mapper: {CONFIG_MAPPER_AVAILABLE}")
 logger.debug(f"Scheduler: {SCHEDULER_AVAILABLE}")
@@ -558,6 +705,11 @@ logger.debug(f"Config Database: {CONFIG_DATABASE_AVAILABLE}")
 logger.debug(f"Runtime Database: {RUNTIME_DB_AVAILABLE}")
 logger.debug(f"Logs Watcher: {LOGS_WATCHER_AVAILABLE}")
 logger.debug(f"Media Export Database: {MEDIA_EXPORT_DB_AVAILABLE}")
+logger.debug(f"Asset Index Database: {ASSET_INDEX_DB_AVAILABLE}")
+logger.debug(f"Assets Watcher: {ASSETS_WATCHER_AVAILABLE}")
+logger.debug(f"Thumbnails: {THUMBNAILS_AVAILABLE}")
+logger.debug(f"Frontend Pre-compression: {FRONTEND_PRECOMPRESSION_AVAILABLE} (brotli: {BROTLI_AVAILABLE})")
+logger.debug(f"API Response Encoding: {API_RESPONSES_AVAILABLE} (orjson: {ORJSON_AVAILABLE})")
 
 current_process: Optional[subprocess.Popen] = None
 current_mode: Optional[str] = None
@@ -567,11 +719,17 @@ db: Optional["ImageChoicesDB"] = None
 config_db: Optional["ConfigDB"] = None
 media_export_db: Optional["MediaExportDatabase"] = None
 server_libraries_db: Optional["ServerLibrariesDB"] = None
+asset_index_db: Optional["AssetIndexDB"] = None
+log_index_db: Optional["LogIndexDB"] = None
+assets_watcher: Optional["AssetsWatcher"] = None
+thumbnail_service: Optional["ThumbnailService"] = None
 
 # Initialize cache variables early to prevent race conditions
 cache_refresh_task = None
 cache_refresh_running = False
 cache_scan_in_progress = False
+# Held while the asset cache is rebuilt or patched, so scans and watcher updates never interleave
+asset_cache_lock = threading.RLock()
 
 
 def check_directory_permissions(
@@ -736,101 +894,156 @@ def is_version_newer(current: str, remote: str) -> bool:
     return is_newer
 
 
-class CachedStaticFiles(StaticFiles):
-    """StaticFiles with Cache-Control headers for browser caching"""
-
-    def __init__(self, *args, max_age: int = 3600, **kwargs):
-        self.max_age = max_age
-        super().__init__(*args, **kwargs)
-
-    def file_response(self, *args, **kwargs):
-        response = super().file_response(*args, **kwargs)
-        response.headers["Cache-Control"] = f"public, max-age={self.max_age}"
-        return response
+# Cache lifetime of versioned URLs (?t=<mtime>); the URL changes with the file
+VERSIONED_MAX_AGE = 31536000
 
 
-def is_poster_file(filename: str) -> bool:
-    """
-    Check if file is a poster.
-    Supports: .jpg, .jpeg, .png, .webp, .tbn
-    """
-    lower_name = filename.lower()
-    valid_extensions = (".jpg", ".jpeg", ".png", ".webp", ".tbn")
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong ETag from size and modification time (no file read needed)"""
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
 
-    # 1. Must end with a valid extension
-    if not lower_name.endswith(valid_extensions):
-        return False
 
-    # 2. EXCLUDE specific folder-based reserved filenames (regardless of extension)
-    # We check if the name starts with specific reserved words to handle background.png, Season01.webp, etc.
-    if lower_name.startswith("background."):
-        return False
-    if re.match(r"^season\d+\.", lower_name):
-        return False
-    if re.match(r"^s\d+e\d+\.", lower_name):
-        return False
+def is_versioned_request(scope) -> bool:
+    """True if the URL carries a ?t= version parameter"""
+    query = scope.get("query_string", b"")
+    return query.startswith(b"t=") or b"&t=" in query
 
-    # 3. File-based exclusions (naming convention: Name_Type.ext)
-    # Exclude files ending with _background.ext, _SeasonXX.ext, _SxxExx.ext
-    if re.search(r"_background\.(jpg|jpeg|png|webp|tbn)$", lower_name):
-        return False
-    if re.search(r"_season\d+\.(jpg|jpeg|png|webp|tbn)$", lower_name):
-        return False
-    if re.search(r"_s\d+e\d+\.(jpg|jpeg|png|webp|tbn)$", lower_name):
-        return False
 
-    # If it passed all exclusions and has a valid extension, it's a poster
-    return True
+def cache_control_header(max_age: int, versioned: bool) -> str:
+    if versioned:
+        return f"public, max-age={VERSIONED_MAX_AGE}, immutable"
+    return f"public, max-age={max_age}"
 
 
-def is_background_file(filename: str) -> bool:
+def is_not_modified(request_headers: Headers, etag: str, last_modified: Optional[str]) -> bool:
     """
-    Check if file is a background.
-    Matches: background.ext OR *_background.ext
+    Evaluate If-None-Match / If-Modified-Since (RFC 9110: If-None-Match wins).
+    If-None-Match may list several (weak) tags or be "*".
     """
-    lower_name = filename.lower()
-
-    # Exact match: background.jpg, background.png, etc.
-    if re.match(r"^background\.(jpg|jpeg|png|webp|tbn)$", lower_name):
-        return True
-
-    # File-based: ends with _background.ext
-    if re.search(r"_background\.(jpg|jpeg|png|webp|tbn)$", lower_name):
-        return True
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags
 
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
     return False
 
 
-def is_season_file(filename: str) -> bool:
+class CachedStaticFiles(StaticFiles):
     """
-    Check if file is a season poster.
-    Matches: SeasonXX.ext OR *_SeasonXX.ext
+    StaticFiles with browser caching: ETag (size + mtime) and Last-Modified
+    validators with 304 responses, and immutable caching for versioned
+    (?t=<mtime>) URLs, which change whenever the file does
     """
-    # Folder-based: SeasonXX.ext (case insensitive via flag or lower handling)
-    if re.match(r"^season\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
-        return True
 
-    # File-based: *_SeasonXX.ext
-    if re.search(r"_season\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
-        return True
+    def __init__(self, *args, max_age: int = 3600, **kwargs):
+        self.max_age = max_age
+        super().__init__(*args, **kwargs)
 
-    return False
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ):
+        response = FileResponse(
+            full_path, status_code=status_code, stat_result=stat_result, method=scope["method"]
+        )
+        response.headers["etag"] = file_etag(stat_result)
+        response.headers["cache-control"] = cache_control_header(
+            self.max_age, is_versioned_request(scope)
+        )
+        if status_code == 200 and is_not_modified(
+            Headers(scope=scope), response.headers["etag"], response.headers.get("last-modified")
+        ):
+            return NotModifiedResponse(response.headers)
+        return response
 
 
-def is_titlecard_file(filename: str) -> bool:
+# Vite writes content hashed bundles (e.g. index-3f9a1c2b.js) to dist/assets
+FRONTEND_HASHED_PREFIX = "assets/"
+
+
+class FrontendStaticFiles(StaticFiles):
     """
-    Check if file is a title card / episode.
-    Matches: SxxExx.ext OR *_SxxExx.ext
+    StaticFiles for the built Web UI. Hashed bundles are cached for a year as
+    immutable, everything else (index.html, locales) is revalidated on every
+    load so new releases show up immediately. Pre-compressed variants are
+    served according to the request's Accept-Encoding.
     """
-    # Folder-based: SxxExx.ext
-    if re.match(r"^s\d+e\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
-        return True
 
-    # File-based: *_SxxExx.ext
-    if re.search(r"_s\d+e\d+\.(jpg|jpeg|png|webp|tbn)$", filename, re.IGNORECASE):
-        return True
+    def __init__(self, *args, variants: Optional[Dict[str, Dict[str, Path]]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.variants = variants or {}
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope,
+        status_code: int = 200,
+    ):
+        relative = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        request_headers = Headers(scope=scope)
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+        etag = file_etag(stat_result)
+
+        variants = self.variants.get(relative)
+        encoding = None
+        if variants:
+            encoding = select_encoding(request_headers.get("accept-encoding", ""), variants)
+        if encoding:
+            try:
+                variant_stat = os.stat(variants[encoding])
+            except OSError:
+                encoding = None
+
+        if encoding:
+            response = FileResponse(
+                variants[encoding],
+                status_code=status_code,
+                stat_result=variant_stat,
+                media_type=media_type,
+                method=scope["method"],
+            )
+            response.headers["content-encoding"] = encoding
+            etag = f'{etag[:-1]}-{encoding}"'
+        else:
+            response = FileResponse(
+                full_path,
+                status_code=status_code,
+                stat_result=stat_result,
+                media_type=media_type,
+                method=scope["method"],
+            )
+
+        response.headers["etag"] = etag
+        response.headers["last-modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+        if variants:
+            response.headers["vary"] = "Accept-Encoding"
+        if status_code == 200 and relative.startswith(FRONTEND_HASHED_PREFIX):
+            response.headers["cache-control"] = f"public, max-age={VERSIONED_MAX_AGE}, immutable"
+        else:
+            response.headers["cache-control"] = "no-cache"
 
-    return False
+        if status_code == 200 and is_not_modified(
+            request_headers, etag, response.headers["last-modified"]
+        ):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def index_response(self, scope):
+        """index.html for client-side routes, with the same headers as '/'"""
+        index_path = os.path.join(self.directory, "index.html")
+        return self.file_response(index_path, os.stat(index_path), scope)
 
 
 # ============================================================================
@@ -838,6 +1051,70 @@ def is_titlecard_file(filename: str) -> bool:
 # ============================================================================
 CACHE_TTL_SECONDS = 300  # Cache data for 3 minutes (only for statistics)
 CACHE_REFRESH_INTERVAL = 600  # Refresh cache every 3 minutes for faster gallery updates
+CACHE_FULL_RESCAN_EVERY = 6  # Every 6th background refresh re-stats all files (catches in-place overwrites)
+SCAN_HISTORY_SIZE = 20  # Scans kept for /api/cache/status
+
+
+# Library folders walked in parallel
+ASSET_SCAN_WORKERS = _get_int_env("ASSET_SCAN_WORKERS", 4, minimum=1)
+# Filesystem operations per second for background scans (0 = unthrottled)
+ASSET_SCAN_OPS_PER_SECOND = _get_int_env("ASSET_SCAN_OPS_PER_SECOND", 2000, minimum=0)
+ASSET_SCAN_BUSY_FACTOR = 0.25  # Share of the budget used while a Posterizarr run is active
+# Size limit of the gallery thumbnail cache and thumbnails generated in parallel
+THUMBNAIL_CACHE_MB = _get_int_env("THUMBNAIL_CACHE_MB", 512, minimum=16)
+THUMBNAIL_WORKERS = _get_int_env("THUMBNAIL_WORKERS", 2, minimum=1)
+
+# Large API payloads: "fast" (orjson, skips jsonable_encoder) or "default" (FastAPI encoder)
+API_JSON_ENCODER = os.environ.get("API_JSON_ENCODER", "fast").strip().lower()
+# Opt-in gzip for /api responses of at least API_COMPRESSION_MIN_SIZE bytes
+API_COMPRESSION = os.environ.get("API_COMPRESSION", "false").strip().lower() == "true"
+API_COMPRESSION_MIN_SIZE = _get_int_env("API_COMPRESSION_MIN_SIZE", 4096, minimum=0)
+
+# Lines per page when /api/logs is paged with before/after but tail=0
+LOG_PAGE_MAX_LINES = 1000
+# Lines sent when a /ws/logs client connects or resyncs after falling behind
+LOG_STREAM_INITIAL_LINES = 100
+# One shared tailer per log file for all /ws/logs clients
+log_stream_hub = LogStreamHub()
+# Parsed FrontendUI.log entries kept in memory for /api/logs/ui/unified
+UI_LOG_STORE_SIZE = 10000
+ui_log_store = UILogStore(UI_LOGS_DIR / "FrontendUI.log", UI_LOG_STORE_SIZE)
+
+
+def api_json(content):
+    """
+    Response for large list payloads. With API_JSON_ENCODER=fast the content is
+    serialized directly; otherwise it is returned for FastAPI's default handling,
+    which allows comparing both (see benchmark_api_responses.py).
+    """
+    if API_RESPONSES_AVAILABLE and API_JSON_ENCODER == "fast":
+        return FastJSONResponse(content)
+    return content
+
+
+# Live gallery updates: "auto" (filesystem events, polling fallback), "polling" or "off"
+ASSET_WATCHER_MODE = os.environ.get("ASSET_WATCHER", "auto").strip().lower()
+ASSET_WATCHER_POLL_INTERVAL = 60  # Seconds between incremental scans in polling mode
+
+# Gallery buckets and the folder counter each one increments
+ASSET_BUCKETS = {
+    "posters": "poster_count",
+    "backgrounds": "background_count",
+    "seasons": "season_count",
+    "titlecards": "titlecard_count",
+}
+
+# Remembers directory mtimes/listings between scans for incremental refreshes
+asset_scanner = AssetScanner(ASSETS_DIR, workers=ASSET_SCAN_WORKERS)
+asset_index_needs_full_write = True  # Rewrite the whole asset index on the next scan
+asset_scan_cancel = threading.Event()  # Set to abort a running throttled scan
+asset_details_lock = threading.Lock()  # Held while dimensions/placeholders are updated
+asset_details_requested = threading.Event()  # Set when another details pass is needed
+ASSET_DETAILS_BATCH_SIZE = 200  # Dimension/placeholder rows written per transaction
+asset_scan_throttle: Optional[ScanThrottle] = None  # Throttle of the last throttled scan
+library_type_map: Optional[Dict[str, str]] = None  # {library name: movie/show}, None until loaded
+library_type_lock = threading.Lock()
+scan_history = ScanHistory(SCAN_HISTORY_SIZE)  # Timings of the most recent scans
 
 asset_cache = {
     "last_scanned": 0,
@@ -846,124 +1123,357 @@ asset_cache = {
     "seasons": [],
     "titlecards": [],
     "folders": [],
+    "index": AssetIndex(),  # Path/folder/library lookups over the four lists above
     "manual_gallery": {"libraries": [], "total_assets": 0},
 }
 
 # Background refresh control (already initialized above, see global variables)
 
 
-def process_image_path(image_path: Path):
-    """Helper function to process a Path object into a dictionary."""
+def process_image_path(
+    relative_path: str, file_stat: tuple, media_type: str = None, metrics: ScanMetrics = None
+):
+    """
+    Build the cache entry for an image found by the asset scanner.
+    The URL and file name are derived from the path when the entry is serialized.
+
+    Args:
+        relative_path: Path relative to ASSETS_DIR (forward slashes)
+        file_stat: (size, ctime, mtime) tuple from the scanner
+        media_type: Known media type (e.g. from the asset index); determined if None
+        metrics: Scan metrics that record the library type lookup time
+
+    Returns:
+        (bucket, AssetRecord) - bucket is None for files outside the gallery,
+        the record is None if the entry could not be built
+    """
+    bucket = None
     try:
-        relative_path = image_path.relative_to(ASSETS_DIR)
-        url_path = str(relative_path).replace("\\", "/")
-        # URL encode the path to handle special characters like #
-        encoded_url_path = quote(url_path, safe="/")
+        size, created, modified = file_stat
 
-        # Get file stats
-        file_stat = image_path.stat()
+        # Extract library folder (first part of relative path) and classify the file once
+        library_folder, _, _ = relative_path.partition("/")
+        name = relative_path.rpartition("/")[2]
+        if media_type is None:
+            bucket, media_type = classify_asset(name, library_folder, metrics)
+        else:
+            bucket = get_asset_bucket(name)
 
-        # Extract library folder (first part of relative path) and determine media type
-        library_folder = None
-        media_type = None
-        try:
-            library_folder = relative_path.parts[0]
-            media_type = determine_media_type(image_path.name, library_folder)
-        except (ValueError, IndexError):
-            # If relative_path does not have any parts, or library_folder cannot be determined,
-            # we ignore the error and leave library_folder and media_type as None.
-            pass
+        return bucket, AssetRecord(relative_path, size, created, modified, media_type)
+    except Exception as e:
+        logger.error(f"Error processing image path {relative_path}: {e}")
+        return bucket, None
 
-        return {
-            "path": str(relative_path),
-            "name": image_path.name,
-            "size": file_stat.st_size,
-            "url": f"/poster_assets/{encoded_url_path}",
-            "created": file_stat.st_ctime,  # Creation time (Unix timestamp)
-            "modified": file_stat.st_mtime,  # Modification time (Unix timestamp)
-            "type": media_type,  # Media type (Movie, Show, Season, Episode, Background)
+
+def get_asset_bucket(filename: str) -> Optional[str]:
+    """Return the gallery bucket ("posters", "backgrounds", ...) for a filename, or None"""
+    return asset_classifier.classify(filename)[0]
+
+
+def classify_asset(filename: str, library_folder: str = None, metrics: ScanMetrics = None) -> tuple:
+    """
+    Classify an asset in a single pass.
+    Only posters and backgrounds need the library type lookup.
+
+    Returns:
+        (bucket, media_type) - bucket is None for files outside the gallery
+    """
+    bucket, kind = asset_classifier.classify(filename)
+    library_type = None
+    if library_folder and kind in asset_classifier.LIBRARY_KINDS:
+        if metrics is None:
+            library_type = get_library_type_from_db(library_folder)
+        else:
+            lookup_start = time.perf_counter()
+            library_type = get_library_type_from_db(library_folder)
+            metrics.add("library_lookup", time.perf_counter() - lookup_start)
+    return bucket, asset_classifier.media_type(kind, library_type, library_folder)
+
+
+def _count_folder_asset(
+    temp_folders: dict, relative_path: str, bucket: Optional[str], size: int, delta: int
+):
+    """Add (delta=1) or subtract (delta=-1) an image from its library folder counters"""
+    folder_name = relative_path.split("/", 1)[0] or "root"
+    folder = temp_folders.get(folder_name)
+    if folder is None:
+        folder = temp_folders[folder_name] = {
+            "name": folder_name,
+            "path": folder_name,
+            "poster_count": 0,
+            "background_count": 0,
+            "season_count": 0,
+            "titlecard_count": 0,
+            "files": 0,
+            "size": 0,
         }
-    except Exception as e:
-        logger.error(f"Error processing image path {image_path}: {e}")
-        return None
 
-def determine_media_type(filename: str, library_folder: str = None) -> str:
+    folder["files"] += delta
+    folder["size"] += delta * size
+    if bucket:
+        folder[ASSET_BUCKETS[bucket]] += delta
+
+
+def _finalize_folders(temp_folders: dict) -> list:
+    """Drop empty folders, compute totals and sort folder metadata by name"""
+    folder_list = [folder for folder in temp_folders.values() if folder["files"] > 0]
+    for folder in folder_list:
+        folder["total_count"] = sum(folder[key] for key in ASSET_BUCKETS.values())
+    folder_list.sort(key=lambda x: x["name"])
+    return folder_list
+
+
+def _build_asset_index(new_cache: dict, metrics: ScanMetrics = None) -> AssetIndex:
+    """
+    Build the lookups for the final, sorted bucket lists of a cache.
+    New records of unchanged files take over the dimensions known so far.
+    """
+    start_time = time.perf_counter()
+    index = AssetIndex({bucket: new_cache[bucket] for bucket in ASSET_BUCKETS})
+    previous = asset_cache.get("index")
+    if previous:
+        for path, record in index.by_path.items():
+            if record.format is None:
+                old = previous.get(path)
+                if old is not None and old.format is not None and old.modified == record.modified:
+                    record.set_dimensions(old.width, old.height, old.format)
+    elapsed = time.perf_counter() - start_time
+    if metrics is not None:
+        metrics.add("index", elapsed)
+    logger.debug(f"Asset index built in {elapsed:.2f}s ({len(index)} entries)")
+    return index
+
+
+def _record_classify_time(metrics: Optional[ScanMetrics], start_time: float, processed: int):
+    """Book the list building time minus the library lookups as the classify phase"""
+    if metrics is None:
+        return
+    elapsed = time.perf_counter() - start_time
+    metrics.add("classify", max(0.0, elapsed - metrics.phases.get("library_lookup", 0.0)))
+    metrics.files_processed += processed
+
+
+def _build_asset_lists(
+    new_cache: dict, files: dict, media_types: dict = None, metrics: ScanMetrics = None
+) -> dict:
     """
-    Determine media type from filename and library folder.
-    Supports .jpg, .jpeg, .png, .webp
+    Populate the asset lists of new_cache from a full scan ({path: stat}).
+    Returns {path: media_type} for every processed file.
     """
-    name = filename.lower()
-    # Regex to match supported extensions
-    ext_pattern = r"\.(jpg|jpeg|png|webp|tbn)$"
+    start_time = time.perf_counter()
+    temp_folders = {}
+    processed_types = {}
+    total = len(files)
+    processed_count = 0
+    last_log_time = time.time()
 
-    # Check for episodes/title cards first (matches S01E01.jpg, S01E01.png, etc.)
-    if re.match(r"^s\d+e\d+" + ext_pattern, name) or re.match(
-        r".*_s\d+e\d+" + ext_pattern, name
-    ):
-        logger.debug(
-            f"[MediaType] {filename} in {library_folder} -> Episode (pattern match)"
-        )
-        return "Episode"
+    for relative_path, file_stat in files.items():
+        processed_count += 1
 
-    # Check for season posters (matches Season01.jpg, Season01.png, etc.)
-    if re.match(r"^season\d+" + ext_pattern, name):
-        logger.debug(
-            f"[MediaType] {filename} in {library_folder} -> Season (pattern match)"
-        )
-        return "Season"
+        # Log progress every 5000 files or every 10 seconds
+        current_time = time.time()
+        if processed_count % 5000 == 0 or (current_time - last_log_time) >= 10:
+            logger.info(
+                f"Processing assets: {processed_count}/{total} ({(processed_count/total*100):.1f}%)"
+            )
+            last_log_time = current_time
 
-    # Get library type from database for backgrounds and posters
-    library_type = None
-    if library_folder:
-        library_type = get_library_type_from_db(library_folder)
-        logger.debug(
-            f"[MediaType] Library '{library_folder}' type from DB: {library_type}"
+        bucket, image_data = process_image_path(
+            relative_path,
+            file_stat,
+            media_types.get(relative_path) if media_types else None,
+            metrics,
         )
+        if not image_data:
+            if metrics is not None:
+                metrics.errors += 1
+            continue
+        processed_types[relative_path] = image_data.type
+
+        _count_folder_asset(temp_folders, relative_path, bucket, image_data.size, 1)
+        if bucket:
+            new_cache[bucket].append(image_data)
+
+    logger.info("Sorting asset lists...")
+    for bucket in ASSET_BUCKETS:
+        new_cache[bucket].sort(key=attrgetter("path"))
 
-    # Check for backgrounds (matches background.jpg, background.png, etc.)
-    if re.match(r"^background" + ext_pattern, name):
-        if library_type == "show":
-            logger.debug(f"[MediaType] {filename} -> Show Background (library_type=show)")
-            return "Show Background"
-        elif library_type == "movie":
-            logger.debug(f"[MediaType] {filename} -> Movie Background (library_type=movie)")
-            return "Movie Background"
-
-        # Guess from folder name if DB lookup failed
-        if library_folder:
-            folder_lower = library_folder.lower()
-            if any(k in folder_lower for k in ["show", "series", "tv", "serien"]):
-                return "Show Background"
-            if any(k in folder_lower for k in ["movie", "film", "kino"]):
-                return "Movie Background"
-
-        return "Background"
-
-    # Check for posters (matches poster.jpg, poster.png, etc.)
-    if re.match(r"^poster" + ext_pattern, name):
-        if library_type == "show":
-            logger.debug(f"[MediaType] {filename} -> Show (library_type=show)")
-            return "Show"
-        elif library_type == "movie":
-            logger.debug(f"[MediaType] {filename} -> Movie (library_type=movie)")
-            return "Movie"
-
-        # Guess from folder name if DB lookup failed
-        if library_folder:
-            folder_lower = library_folder.lower()
-            if any(k in folder_lower for k in ["show", "series", "tv", "serien"]):
-                return "Show"
-            if any(k in folder_lower for k in ["movie", "film", "kino"]):
-                return "Movie"
-
-    # Default to Movie for unrecognized images
-    logger.debug(f"[MediaType] {filename} in {library_folder} -> Movie (default)")
-    return "Movie"
+    logger.info("Finalizing folder metadata...")
+    new_cache["folders"] = _finalize_folders(temp_folders)
+    _record_classify_time(metrics, start_time, len(files))
+    new_cache["index"] = _build_asset_index(new_cache, metrics)
+    return processed_types
+
+
+def _merge_asset_delta(
+    new_cache: dict, base_cache: dict, scan_result, metrics: ScanMetrics = None
+) -> dict:
+    """
+    Apply an incremental scan result on top of the currently served cache.
+    The served lists and folder dicts are copied, never mutated in place.
+    Returns {path: media_type} for every new or modified file.
+    """
+    start_time = time.perf_counter()
+    processed_types = {}
+    temp_folders = {folder["name"]: dict(folder) for folder in base_cache["folders"]}
+    dropped = {bucket: set() for bucket in ASSET_BUCKETS}
+    additions = {bucket: [] for bucket in ASSET_BUCKETS}
+
+    # Take removed and modified files out of the counters and lists
+    stale = dict(scan_result.removed)
+    stale.update({path: old for path, (old, _new) in scan_result.modified.items()})
+    for relative_path, (size, _created, _modified) in stale.items():
+        bucket = get_asset_bucket(relative_path.rsplit("/", 1)[-1])
+        _count_folder_asset(temp_folders, relative_path, bucket, size, -1)
+        if bucket:
+            dropped[bucket].add(relative_path)
+
+    # Add new and modified files with their current stat data
+    fresh = dict(scan_result.added)
+    fresh.update({path: new for path, (_old, new) in scan_result.modified.items()})
+    for relative_path, file_stat in fresh.items():
+        bucket, image_data = process_image_path(relative_path, file_stat, metrics=metrics)
+        if not image_data:
+            if metrics is not None:
+                metrics.errors += 1
+            continue
+        processed_types[relative_path] = image_data.type
+        _count_folder_asset(temp_folders, relative_path, bucket, image_data.size, 1)
+        if bucket:
+            additions[bucket].append(image_data)
+
+    for bucket in ASSET_BUCKETS:
+        items = base_cache.get(bucket, [])
+        if dropped[bucket]:
+            items = [img for img in items if img["path"] not in dropped[bucket]]
+        if additions[bucket]:
+            items = items + additions[bucket]
+            items.sort(key=attrgetter("path"))
+        new_cache[bucket] = items
+
+    new_cache["folders"] = _finalize_folders(temp_folders)
+    _record_classify_time(metrics, start_time, len(stale) + len(fresh))
+    new_cache["index"] = _build_asset_index(new_cache, metrics)
+    return processed_types
+
+
+def persist_asset_index(scan_result, cache: dict, media_types: dict):
+    """
+    Write a scan result to the asset index database.
+    A failed write marks the index for a full rewrite on the next scan.
+
+    Args:
+        scan_result: ScanResult that produced 'cache'
+        cache: The new asset cache
+        media_types: {path: media_type} of the files processed by this scan
+    """
+    global asset_index_needs_full_write
+
+    if asset_index_db is None:
+        return
+
+    start_time = time.time()
+    snapshots = scan_result.snapshots
+    try:
+        if scan_result.full or asset_index_needs_full_write:
+            types = {
+                img.path: img.type for bucket in ASSET_BUCKETS for img in cache[bucket]
+            }
+            types.update(media_types)
+            asset_index_db.save_full(
+                str(ASSETS_DIR),
+                cache["last_scanned"],
+                (
+                    (path, *file_stat, types.get(path))
+                    for rel_dir, snapshot in snapshots.items()
+                    for path, file_stat in (
+                        (f"{rel_dir}/{name}" if rel_dir else name, stat)
+                        for name, stat in snapshot.files.items()
+                    )
+                ),
+                (
+                    (rel_dir, snapshot.mtime_ns, snapshot.subdirs)
+                    for rel_dir, snapshot in snapshots.items()
+                ),
+            )
+        else:
+            fresh = dict(scan_result.added)
+            fresh.update({path: new for path, (_old, new) in scan_result.modified.items()})
+            asset_index_db.save_changes(
+                str(ASSETS_DIR),
+                cache["last_scanned"],
+                ((path, *file_stat, media_types.get(path)) for path, file_stat in fresh.items()),
+                scan_result.removed.keys(),
+                (
+                    (rel_dir, snapshots[rel_dir].mtime_ns, snapshots[rel_dir].subdirs)
+                    for rel_dir in scan_result.listed_dirs
+                ),
+                scan_result.removed_dirs,
+            )
+        asset_index_needs_full_write = False
+        logger.debug(f"Asset index saved in {time.time() - start_time:.2f}s")
+    except Exception as e:
+        asset_index_needs_full_write = True
+        logger.error(f"Error saving asset index: {e}")
+
+
+def load_asset_index() -> bool:
+    """
+    Serve the persisted asset index until the first scan reconciles it with disk.
+    Restores the scanner snapshots so that reconcile pass is incremental.
+
+    Returns:
+        True if an index was loaded
+    """
+    global asset_cache
+
+    if asset_index_db is None:
+        return False
+
+    start_time = time.time()
+    try:
+        index = asset_index_db.load(str(ASSETS_DIR))
+    except Exception as e:
+        logger.error(f"Error loading asset index: {e}")
+        return False
+
+    if not index:
+        logger.info("No asset index found, the first scan will build it")
+        return False
+
+    new_cache = {
+        "posters": [],
+        "backgrounds": [],
+        "seasons": [],
+        "titlecards": [],
+        "folders": [],
+        "index": AssetIndex(),
+        "manual_gallery": {"libraries": [], "total_assets": 0},
+        "backup_gallery": {"libraries": [], "total_assets": 0},
+        "last_scanned": index["last_scanned"] or time.time(),
+    }
+    _build_asset_lists(new_cache, index["assets"], index["types"])
+    asset_scanner.restore(index["directories"], index["assets"])
+    asset_cache = new_cache
+
+    logger.info(
+        f"Loaded asset index in {time.time() - start_time:.1f}s: "
+        f"{len(index['assets'])} images in {len(index['directories'])} directories"
+    )
+    schedule_asset_details()
+    return True
+
+def determine_media_type(filename: str, library_folder: str = None) -> str:
+    """
+    Determine media type from filename and library folder.
+    Supports .jpg, .jpeg, .png, .webp, .tbn
+    """
+    return classify_asset(filename, library_folder)[1]
 
 def get_library_type_from_db(library_folder: str) -> Optional[str]:
     """
     Get library type (movie/show) from database by library folder name
-    Uses a cache to avoid repeated database lookups
+    Served from a map of all libraries that is loaded with a single query
 
     Args:
         library_folder: The library folder name (e.g., "TestMovies", "TestSerien")
@@ -971,64 +1481,152 @@ def get_library_type_from_db(library_folder: str) -> Optional[str]:
     Returns:
         "movie" or "show", or None if not found
     """
-    # Use a simple module-level cache
-    if not hasattr(get_library_type_from_db, "cache"):
-        get_library_type_from_db.cache = {}
+    types = library_type_map
+    if types is None:
+        with library_type_lock:
+            types = library_type_map if library_type_map is not None else load_library_types()
+    return types.get(library_folder)
 
-    # Check cache first
-    if library_folder in get_library_type_from_db.cache:
-        cached_type = get_library_type_from_db.cache[library_folder]
-        logger.debug(f"[LibraryType] Cache hit for '{library_folder}': {cached_type}")
-        return cached_type
 
-    # Silence warnings for 'Collections' folder and cache the result as None
-    if library_folder.lower() == "collections":
-        get_library_type_from_db.cache[library_folder] = None
-        return None
+def load_library_types() -> Dict[str, str]:
+    """
+    Load the library name -> type map from the media export database.
+    The map is only kept once the database is available, so lookups made
+    before it is initialized are retried later.
+    """
+    global library_type_map
 
-    logger.debug(
-        f"[LibraryType] Cache miss for '{library_folder}', querying database..."
+    # Use the global media_export_db instance, do not create a new one
+    if media_export_db is None:
+        return {}
+
+    start_time = time.time()
+    types = media_export_db.get_library_types()
+    library_type_map = types
+    logger.info(
+        f"[LibraryType] Loaded {len(types)} library types from database in {time.time() - start_time:.2f}s"
     )
+    return types
 
-    # Use the global media_export_db instance, do not create a new one
-    db_instance = media_export_db
 
-    if db_instance:
-        try:
-            library_type = db_instance.lookup_library_type_by_name(library_folder)
-            if library_type:
-                # Cache the result
-                get_library_type_from_db.cache[library_folder] = library_type
-                logger.info(
-                    f"[LibraryType] Database lookup for '{library_folder}': {library_type} (cached)"
-                )
-                return library_type
-            else:
-                logger.warning(
-                    f"[LibraryType] No library type found in database for '{library_folder}'"
+def refresh_library_types():
+    """
+    Reload the library types (e.g. after new export CSVs were imported) and
+    re-derive the media types of the library folders whose type changed
+    """
+    with library_type_lock:
+        previous = library_type_map
+        types = load_library_types()
+
+    if previous is None:
+        # Cached types may have been guessed before the database was ready
+        changed = set(asset_cache["index"].libraries)
+    else:
+        changed = {
+            name for name in previous.keys() | types.keys() if previous.get(name) != types.get(name)
+        }
+
+    if changed:
+        rederive_media_types(changed)
+
+
+def rederive_media_types(libraries: set) -> int:
+    """
+    Re-classify the posters and backgrounds of some library folders with the
+    current library types. Only those two buckets depend on the library type;
+    changed records are replaced copy-on-write and the index is rebuilt.
+
+    Returns:
+        Number of records whose media type changed
+    """
+    global asset_cache, asset_index_needs_full_write
+
+    with asset_cache_lock:
+        start_time = time.time()
+        new_cache = dict(asset_cache)
+        index = asset_cache["index"]
+        updated = []
+
+        for bucket in ("posters", "backgrounds"):
+            records = asset_cache[bucket]
+            for library in libraries:
+                start, end = index.library_range(library, bucket)
+                for position in range(start, end):
+                    record = records[position]
+                    _bucket, media_type = classify_asset(record.name, library)
+                    if media_type == record.type:
+                        continue
+                    if records is asset_cache[bucket]:
+                        records = list(records)
+                    records[position] = AssetRecord(
+                        record.path, record.size, record.created, record.modified, media_type
+                    )
+                    updated.append(records[position])
+            new_cache[bucket] = records
+
+        if not updated:
+            return 0
+
+        new_cache["index"] = _build_asset_index(new_cache)
+        asset_cache = new_cache
+        logger.info(
+            f"[LibraryType] Updated media types of {len(updated)} assets in "
+            f"{len(libraries)} libraries in {time.time() - start_time:.2f}s"
+        )
+
+        if asset_index_db is not None:
+            try:
+                asset_index_db.save_changes(
+                    str(ASSETS_DIR),
+                    new_cache["last_scanned"],
+                    (
+                        (record.path, record.size, record.created, record.modified, record.type)
+                        for record in updated
+                    ),
+                    (),
+                    (),
+                    (),
                 )
-        except Exception as e:
-            logger.error(
-                f"[LibraryType] Error looking up library type for '{library_folder}': {e}"
-            )
+            except Exception as e:
+                asset_index_needs_full_write = True
+                logger.error(f"Error saving updated media types to the asset index: {e}")
 
-    return None
+        return len(updated)
 
-def scan_and_cache_assets():
+def scan_and_cache_assets(
+    full_rescan: bool = False, throttled: bool = False, preempt: bool = False
+):
     """
     Scans the assets directory and populates/refreshes the cache atomically.
     Builds a new cache in the background and replaces the old one at the end.
+
+    Args:
+        full_rescan: Re-list and re-stat every directory. When False, only
+            directories whose mtime changed since the last scan are re-listed
+            and the deltas are merged into the current cache.
+        throttled: Pace the directory walk to ASSET_SCAN_OPS_PER_SECOND (slower
+            while Posterizarr is running) and allow it to be cancelled
+        preempt: Cancel a running throttled scan and wait for it instead of
+            skipping this request
     """
-    global cache_scan_in_progress, asset_cache
+    global cache_scan_in_progress, asset_cache, asset_scan_throttle
 
     # Prevent overlapping scans (thread-safe)
     if cache_scan_in_progress:
-        logger.warning("Asset scan already in progress, skipping this request")
-        return
+        if not preempt:
+            logger.warning("Asset scan already in progress, skipping this request")
+            return
+        logger.info("Cancelling the running asset scan in favour of this request")
+        asset_scan_cancel.set()
 
+    asset_cache_lock.acquire()
     cache_scan_in_progress = True
+    asset_scan_cancel.clear()
     scan_start_time = time.time()
-    logger.info("Starting background asset cache refresh...")
+    metrics = ScanMetrics("full" if full_rescan else "incremental")
+    logger.info(
+        f"Starting background asset cache refresh ({'full' if full_rescan else 'incremental'})..."
+    )
 
     # 1. Create a new, local cache. We will build this in the background.
     #    The global 'asset_cache' remains untouched and is served to the user.
@@ -1038,6 +1636,7 @@ def scan_and_cache_assets():
         "seasons": [],
         "titlecards": [],
         "folders": [],
+        "index": AssetIndex(),  # Rebuilt once the lists are final
         "manual_gallery": {"libraries": [], "total_assets": 0},
         "backup_gallery": {"libraries": [], "total_assets": 0}, # NEW: Initialize backup gallery
         "last_scanned": 0, # Will be set at the end
@@ -1046,103 +1645,56 @@ def scan_and_cache_assets():
     if not ASSETS_DIR.exists() or not ASSETS_DIR.is_dir():
         logger.warning("Assets directory not found. Clearing cache.")
         # If the path is gone, clear the global cache and stop.
+        asset_scanner.reset()
         asset_cache = new_cache # Set to empty
         asset_cache["last_scanned"] = time.time()
         cache_scan_in_progress = False
+        asset_cache_lock.release()
+        metrics.finish("missing", f"Assets directory not found: {ASSETS_DIR}")
+        scan_history.record(metrics)
         return
 
     try:
         # =========================================================
-        # 1. MAIN ASSETS SCAN (Existing Logic)
+        # 1. MAIN ASSETS SCAN
         # =========================================================
-        # Scan once for all image types and filter @eaDir in one pass
-        image_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-
+        # The scanner skips @eaDir and, unless a full rescan is requested,
+        # only re-lists directories whose mtime changed since the last scan
         logger.info(f"Scanning assets directory: {ASSETS_DIR}")
-        all_images = [
-            p
-            for p in ASSETS_DIR.rglob("*")
-            if p.suffix.lower() in image_extensions and "@eaDir" not in p.parts
-        ]
-        logger.info(f"Found {len(all_images)} image files to process")
-
-        temp_folders = {}
-        processed_count = 0
-        last_log_time = time.time()
-
-        for image_path in all_images:
-            processed_count += 1
-
-            # Log progress every 5000 files or every 10 seconds
-            current_time = time.time()
-            if processed_count % 5000 == 0 or (current_time - last_log_time) >= 10:
-                logger.info(
-                    f"Processing assets: {processed_count}/{len(all_images)} ({(processed_count/len(all_images)*100):.1f}%)"
-                )
-                last_log_time = current_time
-
-            image_data = process_image_path(image_path)
-            if not image_data:
-                continue
-
-            # Get folder name from original Path object
-            try:
-                folder_name = image_path.relative_to(ASSETS_DIR).parts[0]
-            except (ValueError, IndexError):
-                folder_name = "root"
-
-            if folder_name not in temp_folders:
-                temp_folders[folder_name] = {
-                    "name": folder_name,
-                    "path": folder_name,
-                    "poster_count": 0,
-                    "background_count": 0,
-                    "season_count": 0,
-                    "titlecard_count": 0,
-                    "files": 0,
-                    "size": 0,
-                }
-
-            # Count files and size for the folder
-            temp_folders[folder_name]["files"] += 1
-            temp_folders[folder_name]["size"] += image_data["size"]
-
-            # Add assets to the 'new_cache'
-            if is_poster_file(image_path.name):
-                new_cache["posters"].append(image_data)
-                temp_folders[folder_name]["poster_count"] += 1
-            elif is_background_file(image_path.name):
-                new_cache["backgrounds"].append(image_data)
-                temp_folders[folder_name]["background_count"] += 1
-            elif is_season_file(image_path.name):
-                new_cache["seasons"].append(image_data)
-                temp_folders[folder_name]["season_count"] += 1
-            elif is_titlecard_file(image_path.name):
-                new_cache["titlecards"].append(image_data)
-                temp_folders[folder_name]["titlecard_count"] += 1
-
-        logger.info("Sorting asset lists...")
-        # Sort the lists in 'new_cache'
-        for key in ["posters", "backgrounds", "seasons", "titlecards"]:
-            new_cache[key].sort(key=lambda x: x["path"])
-
-        logger.info("Finalizing folder metadata...")
-        # Finalize folder data
-        folder_list = list(temp_folders.values())
-        for folder in folder_list:
-            folder["total_count"] = (
-                folder["poster_count"]
-                + folder["background_count"]
-                + folder["season_count"]
-                + folder["titlecard_count"]
-            )
-        folder_list.sort(key=lambda x: x["name"])
-        new_cache["folders"] = folder_list
+        throttle = None
+        if throttled:
+            throttle = ScanThrottle(
+                ASSET_SCAN_OPS_PER_SECOND,
+                is_busy=RUNNING_FILE.exists,
+                busy_factor=ASSET_SCAN_BUSY_FACTOR,
+                cancel_event=asset_scan_cancel,
+            )
+            asset_scan_throttle = throttle
+        scan_result = asset_scanner.scan(full=full_rescan, throttle=throttle)
+        logger.info(
+            f"Walked {scan_result.dirs_total} directories ({scan_result.dirs_listed} listed) "
+            f"with {asset_scanner.workers} worker(s) in {scan_result.duration:.2f}s: "
+            f"{scan_result.files_total} image files ({scan_result.files_per_second:.0f} files/sec, "
+            f"{scan_result.files_stated} stat'ed), {len(scan_result.added)} new, "
+            f"{len(scan_result.modified)} modified, {len(scan_result.removed)} removed"
+        )
+        metrics.kind = "full" if scan_result.full else "incremental"
+        metrics.add("walk", scan_result.duration)
+        metrics.add("stat", scan_result.stat_seconds)
+        metrics.files_total = scan_result.files_total
+        metrics.files_per_second = scan_result.files_per_second
+        metrics.errors += scan_result.errors
+
+        if scan_result.full:
+            media_types = _build_asset_lists(new_cache, scan_result.added, metrics=metrics)
+        else:
+            media_types = _merge_asset_delta(new_cache, asset_cache, scan_result, metrics)
 
         # =========================================================
         # 2. MANUAL ASSETS SCAN (Existing Logic)
         # =========================================================
         logger.info("Scanning manual assets directory...")
+        phase_start = time.perf_counter()
         manual_libraries = []
         manual_total_assets = 0
         if not MANUAL_ASSETS_DIR.exists():
@@ -1188,15 +1740,18 @@ def scan_and_cache_assets():
 
                                 relative_path = f"{library_name}/{folder_name}/{img_file.name}"
                                 encoded_relative_path = quote(relative_path, safe="/")
+                                img_stat = img_file.stat()
+                                version = version_query(img_stat.st_mtime)
 
                                 assets.append(
                                     {
                                         "name": img_file.name,
                                         "path": relative_path,
                                         "type": asset_type,
-                                        "size": img_file.stat().st_size,
-                                        "url": f"/manual_poster_assets/{encoded_relative_path}",
-                                        "modified": img_file.stat().st_mtime
+                                        "size": img_stat.st_size,
+                                        "url": f"/manual_poster_assets/{encoded_relative_path}{version}",
+                                        "thumbnail_url": f"/thumbnails/manual_poster_assets/300/{encoded_relative_path}{version}",
+                                        "modified": img_stat.st_mtime
                                     }
                                 )
                                 manual_total_assets += 1
@@ -1221,12 +1776,14 @@ def scan_and_cache_assets():
                         )
             except Exception as e:
                 logger.error(f"Error scanning manual assets directory: {e}")
+                metrics.errors += 1
 
         # Add manual gallery to 'new_cache'
         new_cache["manual_gallery"] = {
             "libraries": manual_libraries,
             "total_assets": manual_total_assets
         }
+        metrics.add("manual_gallery", time.perf_counter() - phase_start)
         logger.info(
             f"Manual assets scan complete: {len(manual_libraries)} libraries, {manual_total_assets} total assets"
         )
@@ -1235,6 +1792,7 @@ def scan_and_cache_assets():
         # 3. BACKUP ASSETS SCAN (NEW LOGIC)
         # =========================================================
         logger.info("Scanning backup assets directory...")
+        phase_start = time.perf_counter()
         backup_libraries = []
         backup_total_assets = 0
 
@@ -1281,14 +1839,17 @@ def scan_and_cache_assets():
 
                                 relative_path = f"{library_name}/{folder_name}/{img_file.name}"
                                 encoded_relative_path = quote(relative_path, safe="/")
+                                img_stat = img_file.stat()
+                                version = version_query(img_stat.st_mtime)
 
                                 assets.append({
                                     "name": img_file.name,
                                     "path": relative_path,
                                     "type": asset_type,
-                                    "size": img_file.stat().st_size,
-                                    "url": f"/backup_assets/{encoded_relative_path}", # Points to static mount
-                                    "modified": img_file.stat().st_mtime
+                                    "size": img_stat.st_size,
+                                    "url": f"/backup_assets/{encoded_relative_path}{version}", # Points to static mount
+                                    "thumbnail_url": f"/thumbnails/backup_assets/300/{encoded_relative_path}{version}",
+                                    "modified": img_stat.st_mtime
                                 })
                                 backup_total_assets += 1
 
@@ -1308,12 +1869,14 @@ def scan_and_cache_assets():
                         })
             except Exception as e:
                 logger.error(f"Error scanning backup assets directory: {e}")
+                metrics.errors += 1
 
         # Add backup gallery to 'new_cache'
         new_cache["backup_gallery"] = {
             "libraries": backup_libraries,
             "total_assets": backup_total_assets
         }
+        metrics.add("backup_gallery", time.perf_counter() - phase_start)
         logger.info(
             f"Backup assets scan complete: {len(backup_libraries)} libraries, {backup_total_assets} total assets"
         )
@@ -1325,24 +1888,260 @@ def scan_and_cache_assets():
         # This is a single, instant operation.
         new_cache["last_scanned"] = time.time()
         asset_cache = new_cache
+        asset_scanner.commit(scan_result)
+
+        # Persist after the swap so the UI never waits on the database
+        if scan_result.has_changes or scan_result.full or scan_result.listed_dirs:
+            with metrics.phase("persist"):
+                persist_asset_index(scan_result, new_cache, media_types)
 
+        metrics.finish()
+        schedule_asset_details()
+
+    except ScanCancelled:
+        logger.info("Asset scan cancelled, keeping the current cache")
+        metrics.finish("cancelled")
     except Exception as e:
         logger.error(f"An error occurred during asset scan: {e}")
+        metrics.errors += 1
+        metrics.finish("failed", str(e))
     finally:
         # Release lock
         cache_scan_in_progress = False
+        asset_cache_lock.release()
         scan_duration = time.time() - scan_start_time
+        # Entries of the cache being served (the old one if the scan did not finish)
+        metrics.cache_entries = (
+            len(asset_cache["index"])
+            + asset_cache["manual_gallery"]["total_assets"]
+            + asset_cache.get("backup_gallery", {}).get("total_assets", 0)
+        )
+        scan_history.record(metrics)
+        if metrics.status != "cancelled":
+            logger.info(
+                f"Asset cache refresh finished in {scan_duration:.1f}s. "
+                f"Found {len(new_cache['posters'])} posters, "
+                f"{len(new_cache['backgrounds'])} backgrounds, "
+                f"{len(new_cache['seasons'])} seasons, "
+                f"{len(new_cache['titlecards'])} titlecards, "
+                f"{len(new_cache['folders'])} folders, "
+                f"{new_cache['manual_gallery']['total_assets']} manual assets, "
+                f"{new_cache['backup_gallery']['total_assets']} backup assets."
+            )
+            logger.info(
+                "Asset scan phases: "
+                + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in metrics.to_dict()["phases"].items())
+                + f" ({metrics.errors} errors)"
+            )
+
+def apply_asset_changes(rel_dirs: set):
+    """
+    Patch the asset cache with directories reported by the assets watcher.
+    Only those directories are re-listed; the lists, folders and indexes are
+    rebuilt copy-on-write and swapped in like after a scan.
+    """
+    global asset_cache
+
+    with asset_cache_lock:
+        if not asset_scanner.has_snapshot:
+            # No baseline yet, the running/initial scan will include these changes
+            return
+
+        start_time = time.time()
+        scan_result = asset_scanner.scan_directories(rel_dirs)
+        if not scan_result.has_changes and not scan_result.removed_dirs:
+            asset_scanner.commit(scan_result)
+            return
+
+        new_cache = dict(asset_cache)
+        media_types = _merge_asset_delta(new_cache, asset_cache, scan_result)
+        asset_cache = new_cache
+        asset_scanner.commit(scan_result)
+
         logger.info(
-            f"Asset cache refresh finished in {scan_duration:.1f}s. "
-            f"Found {len(new_cache['posters'])} posters, "
-            f"{len(new_cache['backgrounds'])} backgrounds, "
-            f"{len(new_cache['seasons'])} seasons, "
-            f"{len(new_cache['titlecards'])} titlecards, "
-            f"{len(new_cache['folders'])} folders, "
-            f"{new_cache['manual_gallery']['total_assets']} manual assets, "
-            f"{new_cache['backup_gallery']['total_assets']} backup assets."
+            f"[AssetsWatcher] Applied changes in {len(rel_dirs)} directories in "
+            f"{time.time() - start_time:.2f}s: {len(scan_result.added)} new, "
+            f"{len(scan_result.modified)} modified, {len(scan_result.removed)} removed"
         )
 
+        persist_asset_index(scan_result, new_cache, media_types)
+
+    schedule_asset_details()
+
+
+def schedule_asset_details():
+    """
+    Read missing image dimensions and generate missing placeholders in a
+    background thread. Requests made while a pass is running trigger one more
+    pass once it is done.
+    """
+    asset_details_requested.set()
+    if asset_details_lock.acquire(blocking=False):
+        threading.Thread(target=_asset_details_worker, name="AssetDetails", daemon=True).start()
+
+
+def _asset_details_worker():
+    try:
+        while asset_details_requested.is_set():
+            asset_details_requested.clear()
+            try:
+                update_asset_dimensions()
+            except Exception as e:
+                logger.error(f"Error reading asset dimensions: {e}")
+            if asset_index_db is None or not THUMBNAILS_AVAILABLE:
+                continue
+            try:
+                generate_asset_placeholders()
+            except Exception as e:
+                logger.error(f"Error generating asset placeholders: {e}")
+    finally:
+        asset_details_lock.release()
+
+
+def read_image_header(path: Path) -> Tuple[int, int, str]:
+    """Pixel size and format of an image; Image.open only parses the header"""
+    with Image.open(path) as img:
+        width, height = img.size
+        if not width or not height:
+            raise ValueError("Image header without a size")
+        return width, height, img.format or ""
+
+
+def update_asset_dimensions():
+    """
+    Fill in width, height and format of cached assets that do not have them
+    yet: from the asset index when it has an entry for the file's current
+    mtime, otherwise by reading the image header in ASSET_SCAN_WORKERS threads.
+    No image data is decoded.
+    """
+    cache = asset_cache
+    pending = [
+        record for bucket in ASSET_BUCKETS for record in cache[bucket] if record.format is None
+    ]
+    if not pending:
+        return
+
+    start_time = time.time()
+    stored = {}
+    if asset_index_db is not None:
+        stored = asset_index_db.get_dimensions((record.path, record.modified) for record in pending)
+    unread = []
+    for record in pending:
+        dimensions = stored.get(record.path)
+        if dimensions:
+            record.set_dimensions(*dimensions)
+        else:
+            unread.append(record)
+    if not unread:
+        logger.debug(f"Restored dimensions of {len(pending)} assets from the asset index")
+        return
+
+    logger.info(f"Reading image headers of {len(unread)} assets...")
+    throttle = ScanThrottle(
+        ASSET_SCAN_OPS_PER_SECOND,
+        is_busy=RUNNING_FILE.exists,
+        busy_factor=ASSET_SCAN_BUSY_FACTOR,
+    )
+
+    def read(record: AssetRecord) -> tuple:
+        op_start = time.perf_counter()
+        try:
+            dimensions = read_image_header(ASSETS_DIR / record.path)
+        except Exception as e:
+            logger.debug(f"Could not read image header of {record.path}: {e}")
+            dimensions = (0, 0, "")
+        throttle.pace(1, time.perf_counter() - op_start)
+        return dimensions
+
+    batch = []
+    unreadable = 0
+    with ThreadPoolExecutor(max_workers=ASSET_SCAN_WORKERS, thread_name_prefix="AssetHeader") as executor:
+        for record, dimensions in zip(unread, executor.map(read, unread)):
+            record.set_dimensions(*dimensions)
+            unreadable += not dimensions[2]
+            batch.append((record.path, record.modified, *dimensions))
+            if len(batch) >= ASSET_DETAILS_BATCH_SIZE and asset_index_db is not None:
+                asset_index_db.save_dimensions(batch)
+                batch = []
+    if batch and asset_index_db is not None:
+        asset_index_db.save_dimensions(batch)
+
+    logger.info(
+        f"Read {len(unread)} image headers in {time.time() - start_time:.1f}s "
+        f"({len(pending) - len(unread)} restored from the index, {unreadable} unreadable)"
+    )
+
+
+def generate_asset_placeholders():
+    """
+    Create the placeholders of all cached assets that have none for their
+    current mtime. Paced like background scans, so each asset change costs one
+    decode. Unreadable images get an empty placeholder and are not retried
+    until they change.
+    """
+    cache = asset_cache
+    stored = asset_index_db.get_placeholder_mtimes()
+    pending = [
+        record
+        for bucket in ASSET_BUCKETS
+        for record in cache[bucket]
+        if stored.get(record.path) != record.modified
+    ]
+    if not pending:
+        return
+
+    logger.info(f"Generating placeholders for {len(pending)} assets...")
+    start_time = time.time()
+    throttle = ScanThrottle(
+        ASSET_SCAN_OPS_PER_SECOND,
+        target_latency=0.2,
+        is_busy=RUNNING_FILE.exists,
+        busy_factor=ASSET_SCAN_BUSY_FACTOR,
+    )
+    batch = []
+    failed = 0
+    for record in pending:
+        op_start = time.perf_counter()
+        try:
+            data = create_placeholder(ASSETS_DIR / record.path)
+        except Exception as e:
+            logger.debug(f"Could not create placeholder for {record.path}: {e}")
+            data = b""
+            failed += 1
+        batch.append((record.path, record.modified, data))
+        if len(batch) >= ASSET_DETAILS_BATCH_SIZE:
+            asset_index_db.save_placeholders(batch)
+            batch = []
+        throttle.pace(1, time.perf_counter() - op_start)
+    if batch:
+        asset_index_db.save_placeholders(batch)
+
+    logger.info(
+        f"Generated {len(pending) - failed} placeholders in {time.time() - start_time:.1f}s "
+        f"({failed} unreadable)"
+    )
+
+
+def add_placeholders(entries: List[dict]) -> List[dict]:
+    """Add the inline placeholder image (data URI) to serialized asset entries"""
+    if asset_index_db is None or not entries:
+        return entries
+    try:
+        found = asset_index_db.get_placeholders(
+            (entry["path"], entry["modified"]) for entry in entries
+        )
+    except Exception as e:
+        logger.warning(f"Could not load asset placeholders: {e}")
+        return entries
+
+    prefix = f"data:{PLACEHOLDER_MEDIA_TYPE};base64,"
+    for entry in entries:
+        data = found.get(entry["path"])
+        if data:
+            entry["placeholder"] = prefix + base64.b64encode(data).decode("ascii")
+    return entries
+
+
 def background_cache_refresh(skip_initial_scan: bool = False):
     """Background thread that refreshes the cache periodically"""
     global cache_refresh_running
@@ -1355,13 +2154,14 @@ def background_cache_refresh(skip_initial_scan: bool = False):
     try:
         if cache_refresh_running and not skip_initial_scan:
             logger.info("Running initial asset cache scan on startup...")
-            scan_and_cache_assets()
+            scan_and_cache_assets(throttled=True)
             logger.info("Initial cache scan complete.")
         elif skip_initial_scan:
             logger.info("Skipping initial cache scan (already run by startup process).")
     except Exception as e:
         logger.error(f"Error during initial cache scan: {e}")
 
+    refresh_count = 0
     while cache_refresh_running:
         try:
             # Wait until the next refresh
@@ -1374,8 +2174,11 @@ def background_cache_refresh(skip_initial_scan: bool = False):
                 time.sleep(1)
 
             if cache_refresh_running:  # Check again after sleep
+                refresh_count += 1
+                # Incremental refreshes miss files overwritten in place, so do a full pass regularly
+                full_rescan = refresh_count % CACHE_FULL_RESCAN_EVERY == 0
                 logger.info("Background cache refresh triggered by interval")
-                scan_and_cache_assets()
+                scan_and_cache_assets(full_rescan=full_rescan, throttled=True)
                 logger.info("Background cache refresh completed")
         except Exception as e:
             logger.error(f"Error in background cache refresh loop: {e}")
@@ -1419,129 +2222,131 @@ def get_fresh_assets():
         logger.debug("Cache not yet populated - background scan in progress")
     return asset_cache
 
-def find_poster_in_assets(
+BACKGROUND_ASSET_TYPES = {
+    "Background",
+    "Movie Background",
+    "Show Background",
+    "TV Background",
+    "Series Background",
+    "Episode Background",
+}
+
+
+def _rootfolder_image_candidates(
+    files: dict, asset_type: str, title: str, image_filename: Optional[str]
+) -> list:
+    """File names to try (in order) for an asset of a rootfolder directory"""
+    candidates = []
+
+    # First priority: use filename from download_source if available
+    if image_filename:
+        candidates.append(image_filename)
+
+    # Second priority: determine by asset type
+    if asset_type == "Season":
+        # Extract season number from title (format: "Show Name | Season 01" or "Title SEASON")
+        match = re.search(r"Season\s*(\d+)", title, re.IGNORECASE)
+        if match:
+            candidates.append(f"Season{match.group(1).zfill(2)}.jpg")
+            # Try without padding
+            candidates.append(f"Season{match.group(1)}.jpg")
+        else:
+            # If no season number in title, use the first Season*.jpg file
+            candidates.extend(
+                sorted(n for n in files if n.startswith("Season") and n.endswith(".jpg"))[:1]
+            )
+    elif asset_type in ["TitleCard", "Title_Card", "Episode"]:
+        # Extract episode info from title (format: "S01E01 | Episode Title")
+        match = re.search(r"(S\d+E\d+)", title, re.IGNORECASE)
+        if match:
+            candidates.append(f"{match.group(1).upper()}.jpg")
+    elif asset_type in BACKGROUND_ASSET_TYPES:
+        candidates.append("background.jpg")
+    else:
+        # Default: poster.jpg (for "Poster", "Show", or any other type)
+        candidates.append("poster.jpg")
+
+    return candidates
+
+
+def resolve_rootfolder_image(
     rootfolder: str,
     asset_type: str = "Poster",
     title: str = "",
     download_source: str = "",
-) -> str:
+    library: str = "",
+) -> Optional[tuple]:
     """
-    Search recursively in ASSETS_DIR for a folder matching rootfolder and return image URL
+    Find the image of an ImageChoices row using the scanner's rootfolder index
+    (no filesystem walk, no stat calls).
 
     Args:
-        rootfolder: The rootfolder name from ImageChoices.csv (e.g. "1 Million Followers (2024) {tmdb-1117126}")
-        asset_type: Type of asset ("Poster", "Season", "TitleCard", "Title_Card", "Background", "Episode", "Show")
-        title: Full title from CSV (used to extract Season/Episode info)
+        rootfolder: Folder name (e.g. "1 Million Followers (2024) {tmdb-1117126}")
+        asset_type: Type of asset ("Poster", "Season", "TitleCard", "Background", ...)
+        title: Full title (used to extract Season/Episode info)
         download_source: Path from CSV (for manually created assets, contains actual file path)
+        library: Library folder; when given, "<library>/<rootfolder>" is tried first
 
     Returns:
-        URL path to image or None if not found
+        (relative_path, (size, ctime, mtime)) or None if not found
     """
-    if not ASSETS_DIR.exists():
+    if not rootfolder:
         return None
 
-    try:
-        # If download_source is a local path, try to extract the filename from it
-        image_filename = None
-        if download_source and download_source != "N/A":
-            # Check if it looks like a file path (has backslashes or forward slashes and contains a file extension)
-            if (
-                "\\" in download_source or "/" in download_source
-            ) and "." in download_source:
-                # Extract filename from path (e.g., "C:\...\S01E02.jpg" -> "S01E02.jpg")
-                import os
+    # If download_source is a local path, use the filename from it
+    image_filename = None
+    if download_source and download_source != "N/A":
+        if ("\\" in download_source or "/" in download_source) and "." in download_source:
+            image_filename = download_source.replace("\\", "/").rsplit("/", 1)[-1]
+
+    rel_dirs = asset_scanner.find_directories(rootfolder)
+    if library:
+        preferred = f"{library}/{rootfolder}"
+        if preferred in rel_dirs:
+            rel_dirs = [preferred] + [d for d in rel_dirs if d != preferred]
+
+    for rel_dir in rel_dirs:
+        files = asset_scanner.directory_files(rel_dir)
+        for filename in _rootfolder_image_candidates(files, asset_type, title, image_filename):
+            file_stat = files.get(filename)
+            if file_stat is not None:
+                return f"{rel_dir}/{filename}", file_stat
 
-                image_filename = os.path.basename(download_source)
-                logger.info(
-                    f"Extracted filename from download_source: {image_filename} (from: {download_source})"
-                )
+    return None
 
-        # Search recursively for the folder
-        for item in ASSETS_DIR.rglob("*"):
-            # Skip @eaDir folders from Synology NAS
-            if item.is_dir() and item.name == "@eaDir":
-                continue
 
-            if item.is_dir() and item.name == rootfolder:
-                # Found the matching folder
-                image_file = None
-
-                # First priority: use filename from download_source if available
-                if image_filename:
-                    image_file = item / image_filename
-                    logger.info(f"Checking for file from download_source: {image_file}")
-                    if not image_file.exists():
-                        logger.warning(
-                            f"File from download_source not found: {image_file}"
-                        )
-                        image_file = None
-
-                # Second priority: determine by asset type
-                if not image_file:
-                    if asset_type == "Season":
-                        # Extract season number from title (format: "Show Name | Season 01" or "Title SEASON")
-                        import re
-
-                        match = re.search(r"Season\s*(\d+)", title, re.IGNORECASE)
-                        if match:
-                            season_num = match.group(1).zfill(2)  # Pad to 2 digits
-                            image_file = item / f"Season{season_num}.jpg"
-                            if not image_file.exists():
-                                # Try without padding
-                                image_file = item / f"Season{match.group(1)}.jpg"
-                        else:
-                            # If no season number in title, look for any Season*.jpg file
-                            import glob
+def _rootfolder_image_url(relative_path: str, mtime: float) -> str:
+    # URL encode the path and add a cache busting parameter from the modification time
+    return f"/poster_assets/{quote(relative_path, safe='/')}{version_query(mtime)}"
 
-                            season_files = list(item.glob("Season*.jpg"))
-                            if season_files:
-                                # Use the first Season*.jpg file found
-                                image_file = season_files[0]
-                                logger.info(
-                                    f"No season number in title, using first found: {image_file.name}"
-                                )
-
-                    elif asset_type in ["TitleCard", "Title_Card", "Episode"]:
-                        # Extract episode info from title (format: "S01E01 | Episode Title" or just "Episode Title")
-                        import re
-
-                        match = re.search(r"(S\d+E\d+)", title, re.IGNORECASE)
-                        if match:
-                            episode_code = match.group(1).upper()  # e.g. "S01E01"
-                            image_file = item / f"{episode_code}.jpg"
-
-                    elif asset_type in [
-                        "Background",
-                        "Movie Background",
-                        "Show Background",
-                        "TV Background",
-                        "Series Background",
-                        "Episode Background",
-                    ]:
-                        # Look for background.jpg in the folder
-                        image_file = item / "background.jpg"
 
-                    else:
-                        # Default: look for poster.jpg (for "Poster", "Show", or any other type)
-                        image_file = item / "poster.jpg"
+def find_poster_in_assets(
+    rootfolder: str,
+    asset_type: str = "Poster",
+    title: str = "",
+    download_source: str = "",
+) -> str:
+    """
+    Find the image of a rootfolder (folder name anywhere in ASSETS_DIR) and return its URL
 
-                # Check if the image file exists
-                if image_file and image_file.exists() and image_file.is_file():
-                    # Create relative path from ASSETS_DIR
-                    relative_path = image_file.relative_to(ASSETS_DIR)
-                    # Create URL path with forward slashes
-                    url_path = str(relative_path).replace("\\", "/")
-                    # URL encode the path to handle special characters like #
-                    encoded_url_path = quote(url_path, safe="/")
-                    # Add cache busting parameter using file modification time
-                    mtime = int(image_file.stat().st_mtime)
-                    logger.info(f"Found image: {url_path} (mtime: {mtime})")
-                    return f"/poster_assets/{encoded_url_path}?t={mtime}"
+    Args:
+        rootfolder: The rootfolder name from ImageChoices.csv (e.g. "1 Million Followers (2024) {tmdb-1117126}")
+        asset_type: Type of asset ("Poster", "Season", "TitleCard", "Title_Card", "Background", "Episode", "Show")
+        title: Full title from CSV (used to extract Season/Episode info)
+        download_source: Path from CSV (for manually created assets, contains actual file path)
 
-        logger.warning(
-            f"No image found for rootfolder: {rootfolder}, type: {asset_type}"
-        )
-        return None
+    Returns:
+        URL path to image or None if not found
+    """
+    try:
+        found = resolve_rootfolder_image(rootfolder, asset_type, title, download_source)
+        if not found:
+            logger.warning(
+                f"No image found for rootfolder: {rootfolder}, type: {asset_type}"
+            )
+            return None
+        relative_path, (_size, _created, modified) = found
+        return _rootfolder_image_url(relative_path, modified)
 
     except Exception as e:
         logger.error(f"Error searching for {asset_type} in assets: {e}")
@@ -1559,88 +2364,16 @@ def find_poster_with_metadata(
     Returns:
         dict with 'url', 'created', 'modified' keys, or None if not found
     """
-    if not ASSETS_DIR.exists():
-        return None
-
     try:
-        # If download_source is a local path, try to extract the filename from it
-        image_filename = None
-        if download_source and download_source != "N/A":
-            if (
-                "\\" in download_source or "/" in download_source
-            ) and "." in download_source:
-                import os
-
-                image_filename = os.path.basename(download_source)
-
-        # Search recursively for the folder
-        for item in ASSETS_DIR.rglob("*"):
-            if item.is_dir() and item.name == "@eaDir":
-                continue
-
-            if item.is_dir() and item.name == rootfolder:
-                image_file = None
-
-                # First priority: use filename from download_source if available
-                if image_filename:
-                    image_file = item / image_filename
-                    if not image_file.exists():
-                        image_file = None
-
-                # Second priority: determine by asset type
-                if not image_file:
-                    if asset_type == "Season":
-                        import re
-
-                        match = re.search(r"Season\s*(\d+)", title, re.IGNORECASE)
-                        if match:
-                            season_num = match.group(1).zfill(2)
-                            image_file = item / f"Season{season_num}.jpg"
-                            if not image_file.exists():
-                                image_file = item / f"Season{match.group(1)}.jpg"
-                        else:
-                            import glob
-
-                            season_files = list(item.glob("Season*.jpg"))
-                            if season_files:
-                                image_file = season_files[0]
-
-                    elif asset_type in ["TitleCard", "Title_Card", "Episode"]:
-                        import re
-
-                        match = re.search(r"(S\d+E\d+)", title, re.IGNORECASE)
-                        if match:
-                            episode_code = match.group(1).upper()
-                            image_file = item / f"{episode_code}.jpg"
-
-                    elif asset_type in [
-                        "Background",
-                        "Movie Background",
-                        "Show Background",
-                        "TV Background",
-                        "Series Background",
-                        "Episode Background",
-                    ]:
-                        image_file = item / "background.jpg"
-
-                    else:
-                        image_file = item / "poster.jpg"
-
-                # Check if the image file exists
-                if image_file and image_file.exists() and image_file.is_file():
-                    file_stat = image_file.stat()
-                    relative_path = image_file.relative_to(ASSETS_DIR)
-                    url_path = str(relative_path).replace("\\", "/")
-                    encoded_url_path = quote(url_path, safe="/")
-                    mtime = int(file_stat.st_mtime)
-
-                    return {
-                        "url": f"/poster_assets/{encoded_url_path}?t={mtime}",
-                        "created": file_stat.st_ctime,
-                        "modified": file_stat.st_mtime,
-                    }
-
-        return None
+        found = resolve_rootfolder_image(rootfolder, asset_type, title, download_source)
+        if not found:
+            return None
+        relative_path, (_size, created, modified) = found
+        return {
+            "url": _rootfolder_image_url(relative_path, modified),
+            "created": created,
+            "modified": modified,
+        }
 
     except Exception as e:
         logger.error(f"Error searching for {asset_type} in assets: {e}")
@@ -1840,7 +2573,7 @@ async def get_script_version():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown"""
-    global scheduler, db, config_db, media_export_db, logs_watcher, server_libraries_db
+    global scheduler, db, config_db, media_export_db, logs_watcher, server_libraries_db, asset_index_db, log_index_db, assets_watcher, thumbnail_service
 
     logger.info("Starting Posterizarr Web UI Backend")
 
@@ -1851,19 +2584,86 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error setting up default images: {e}")
 
-    # This blocks the app from starting until the first scan is done,
-    # ensuring the UI is populated on first load.
-    logger.info("Running initial asset cache scan... (UI will be available after this is complete)")
-    try:
-        # We wrap the blocking function in asyncio.to_thread to be a good async citizen
-        await asyncio.to_thread(scan_and_cache_assets)
-        logger.info("Initial asset cache scan complete.")
-    except Exception as e:
-        logger.error(f"Error during initial cache scan: {e}")
-        # We can decide to continue or fail startup. Let's continue.
+    # Downscaled gallery images, generated on first request
+    if THUMBNAILS_AVAILABLE:
+        try:
+            thumbnail_service = create_thumbnail_service(
+                THUMBNAIL_CACHE_DIR,
+                max_bytes=THUMBNAIL_CACHE_MB * 1024 * 1024,
+                workers=THUMBNAIL_WORKERS,
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize thumbnail service: {e}")
+            thumbnail_service = None
 
-    # Start background cache refresh (which will now skip its own initial scan)
-    start_cache_refresh_background(skip_initial_scan=True)
+    # Initialize media export database if available
+    # (before the asset cache, which needs the library types to classify assets)
+    if MEDIA_EXPORT_DB_AVAILABLE:
+        try:
+            logger.info("Initializing media export database...")
+            media_export_db = MediaExportDatabase()
+            logger.info("Media export database ready")
+        except Exception as e:
+            logger.error(f"Failed to initialize media export database: {e}")
+            media_export_db = None
+    else:
+        logger.info(
+            "Media export database module not available, skipping initialization"
+        )
+
+    # Serve the persisted asset index right away and reconcile it with disk in
+    # the background. Without an index, block until the first scan is done so
+    # the UI is populated on first load.
+    index_loaded = False
+    if ASSET_INDEX_DB_AVAILABLE:
+        try:
+            asset_index_db = init_asset_index_db(ASSET_INDEX_DB_PATH)
+            index_loaded = await asyncio.to_thread(load_asset_index)
+            if index_loaded:
+                # Stored media types may predate the latest library export
+                await asyncio.to_thread(refresh_library_types)
+        except Exception as e:
+            logger.error(f"Failed to initialize asset index database: {e}")
+            asset_index_db = None
+
+    # Full-text log search and rotated log compression run in the background
+    if LOG_INDEX_DB_AVAILABLE:
+        try:
+            log_index_db = init_log_index_db(LOG_INDEX_DB_PATH)
+        except Exception as e:
+            logger.error(f"Failed to initialize log index database: {e}")
+            log_index_db = None
+    start_log_maintenance()
+
+    if index_loaded:
+        logger.info("Asset cache served from index, reconciling with disk in the background")
+    else:
+        logger.info("Running initial asset cache scan... (UI will be available after this is complete)")
+        try:
+            # We wrap the blocking function in asyncio.to_thread to be a good async citizen
+            await asyncio.to_thread(scan_and_cache_assets)
+            logger.info("Initial asset cache scan complete.")
+        except Exception as e:
+            logger.error(f"Error during initial cache scan: {e}")
+            # We can decide to continue or fail startup. Let's continue.
+
+    # Start background cache refresh (its initial scan is the reconcile pass)
+    start_cache_refresh_background(skip_initial_scan=not index_loaded)
+
+    # Apply filesystem changes in the assets directory as they happen
+    if ASSETS_WATCHER_AVAILABLE:
+        try:
+            assets_watcher = create_assets_watcher(
+                assets_dir=ASSETS_DIR,
+                on_changes=apply_asset_changes,
+                on_poll=lambda: scan_and_cache_assets(throttled=True),
+                mode=ASSET_WATCHER_MODE,
+                poll_interval=ASSET_WATCHER_POLL_INTERVAL,
+            )
+            assets_watcher.start()
+        except Exception as e:
+            logger.error(f"Failed to start assets watcher: {e}")
+            assets_watcher = None
 
     # Initialize config database if available
     if CONFIG_DATABASE_AVAILABLE:
@@ -1880,19 +2680,6 @@ async def lifespan(app: FastAPI):
             config_db = None
     else:
         logger.info("Config database module not available, skipping initialization")
-    # Initialize media export database if available
-    if MEDIA_EXPORT_DB_AVAILABLE:
-        try:
-            logger.info("Initializing media export database...")
-            media_export_db = MediaExportDatabase()
-            logger.info("Media export database ready")
-        except Exception as e:
-            logger.error(f"Failed to initialize media export database: {e}")
-            media_export_db = None
-    else:
-        logger.info(
-            "Media export database module not available, skipping initialization"
-        )
 
     # Initialize database if available
     if DATABASE_AVAILABLE:
@@ -1972,6 +2759,7 @@ async def lifespan(app: FastAPI):
                 media_export_db_instance=(
                     media_export_db if MEDIA_EXPORT_DB_AVAILABLE else None
                 ),
+                on_media_export_imported=refresh_library_types,
             )
             logs_watcher.start()
             logger.info(
@@ -2004,6 +2792,16 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
 
+    # Stop assets watcher
+    if assets_watcher:
+        try:
+            assets_watcher.stop()
+        except Exception as e:
+            logger.error(f"Error stopping assets watcher: {e}")
+
+    if thumbnail_service:
+        thumbnail_service.shutdown()
+
     # Stop logs watcher
     if logs_watcher:
         try:
@@ -2013,15 +2811,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping logs watcher: {e}")
 
-    # Stop queue listener for thread-safe logging
-    global queue_listener
-    if queue_listener:
+    # Stop shared /ws/logs tailers
+    log_stream_hub.shutdown()
+
+    # Stop the FrontendUI.log writer (writes what is still queued)
+    if ui_log_writer:
         try:
-            logger.info("Stopping queue listener for FrontendUI.log")
-            queue_listener.stop()
-            logger.info("Queue listener stopped")
+            logger.info("Stopping UI log writer for FrontendUI.log")
+            ui_log_writer.stop()
         except Exception as e:
-            logger.error(f"Error stopping queue listener: {e}")
+            logger.error(f"Error stopping UI log writer: {e}")
 
     # Stop background cache refresh
     stop_cache_refresh_background()
@@ -2086,6 +2885,10 @@ if AUTH_MIDDLEWARE_AVAILABLE:
 else:
     logger.info("Basic Auth middleware not available, skipping")
 
+if API_COMPRESSION and API_RESPONSES_AVAILABLE:
+    app.add_middleware(ApiCompressionMiddleware, minimum_size=API_COMPRESSION_MIN_SIZE)
+    logger.info(f"API response compression enabled (responses >= {API_COMPRESSION_MIN_SIZE} bytes)")
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -4605,22 +5408,19 @@ def get_last_log_lines(count=25, mode=None, log_file=None):
         scriptlog_path = LOGS_DIR / log_filename
         if scriptlog_path.exists() and scriptlog_path.stat().st_size > 0:
             try:
-                with open(scriptlog_path, "r", encoding="utf-8", errors="ignore") as f:
-                    all_lines = f.readlines()
-                    # Filter out empty lines and decorative lines
-                    lines = []
-                    for line in all_lines:
-                        stripped = line.strip()
-                        if (
-                            stripped
-                            and not stripped.startswith("=====")
-                            and not stripped.startswith("_____")
-                            and not all(c in "=-_| " for c in stripped)
-                        ):
-                            lines.append(stripped)
+                # Skip empty lines and decorative lines
+                def is_content(line: str) -> bool:
+                    stripped = line.strip()
+                    return bool(
+                        stripped
+                        and not stripped.startswith("=====")
+                        and not stripped.startswith("_____")
+                        and not all(c in "=-_| " for c in stripped)
+                    )
 
-                    if lines:
-                        return lines[-count:]  # Return last N lines
+                lines = [line.strip() for line in tail_lines(scriptlog_path, count, is_content)]
+                if lines:
+                    return lines  # Return last N lines
             except Exception as e:
                 logger.error(f"Error reading log file {log_filename}: {e}")
                 continue
@@ -4634,25 +5434,13 @@ async def receive_ui_log(log_entry: UILogEntry):
     Receives UI/Frontend logs and writes them to FrontendUI.log
     Format matches backend logs for consistent viewing
     """
+    if ui_log_writer is None:
+        return {"success": False, "error": "UI log writer not available"}
     try:
-        ui_log_path = UI_LOGS_DIR / "FrontendUI.log"
-
-        # Use server timestamp to avoid client/server time differences
-        from datetime import datetime
-
-        server_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        level = log_entry.level.upper()
-        component = log_entry.component
-        message = log_entry.message
-
         # Format: [TIMESTAMP] [LEVEL] [UI:Component] - MESSAGE
-        # This matches backend format but with UI: prefix
-        log_line = f"[{server_timestamp}] [{level:8}] [UI:{component}] - {message}\n"
-
-        # Write to FrontendUI.log
-        with open(ui_log_path, "a", encoding="utf-8") as f:
-            f.write(log_line)
+        # The writer thread adds the server timestamp to avoid client/server
+        # time differences
+        ui_log_writer.write_ui(log_entry.level, log_entry.component, log_entry.message)
 
         return {"success": True}
 
@@ -4667,27 +5455,12 @@ async def receive_ui_logs_batch(batch: UILogBatch):
     Receives multiple UI logs at once (better performance)
     Uses server timestamps to ensure chronological consistency
     """
+    if ui_log_writer is None:
+        return {"success": False, "error": "UI log writer not available"}
     try:
-        ui_log_path = UI_LOGS_DIR / "FrontendUI.log"
-
-        from datetime import datetime
-
-        log_lines = []
+        # Queued in order; the writer thread adds server timestamps
         for log_entry in batch.logs:
-            # Use server timestamp for all logs
-            server_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            level = log_entry.level.upper()
-            component = log_entry.component
-            message = log_entry.message
-
-            log_line = (
-                f"[{server_timestamp}] [{level:8}] [UI:{component}] - {message}\n"
-            )
-            log_lines.append(log_line)
-
-        # Batch write for better performance
-        with open(ui_log_path, "a", encoding="utf-8") as f:
-            f.writelines(log_lines)
+            ui_log_writer.write_ui(log_entry.level, log_entry.component, log_entry.message)
 
         return {"success": True, "count": len(batch.logs)}
 
@@ -5089,7 +5862,10 @@ async def get_status():
                 # Auto-trigger cache refresh after script finishes
                 logger.info("Triggering cache refresh after script completion...")
                 try:
-                    threading.Thread(target=scan_and_cache_assets, daemon=True).start()
+                    # Full rescan: the script overwrites existing posters in place
+                    threading.Thread(
+                        target=scan_and_cache_assets, kwargs={"full_rescan": True}, daemon=True
+                    ).start()
                     logger.info("Cache refresh started in background after script completion")
                 except Exception as e:
                     logger.error(f"Error refreshing cache after script completion: {e}")
@@ -5137,7 +5913,11 @@ async def get_status():
                     # Auto-trigger cache refresh after scheduler finishes
                     logger.info("Triggering cache refresh after scheduler completion...")
                     try:
-                        threading.Thread(target=scan_and_cache_assets, daemon=True).start()
+                        threading.Thread(
+                            target=scan_and_cache_assets,
+                            kwargs={"full_rescan": True},
+                            daemon=True,
+                        ).start()
                         logger.info(
                             "Cache refresh started in background after scheduler completion"
                         )
@@ -5533,8 +6313,8 @@ async def migrate_runtime_data_from_logs():
             for rotation_dir in rotated_logs_dir.iterdir():
                 if rotation_dir.is_dir():
                     for log_file, mode in current_logs:
-                        log_path = rotation_dir / log_file
-                        if log_path.exists():
+                        log_path = find_log(rotation_dir, log_file)
+                        if log_path:
                             log_files_to_check.append((log_path, mode))
 
         imported_count = 0
@@ -5756,12 +6536,14 @@ async def get_plex_library_data(
 
         data = media_export_db.get_library_data(run_timestamp, limit)
 
-        return {
-            "success": True,
-            "data": data,
-            "count": len(data),
-            "run_timestamp": run_timestamp or "latest",
-        }
+        return api_json(
+            {
+                "success": True,
+                "data": data,
+                "count": len(data),
+                "run_timestamp": run_timestamp or "latest",
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error getting Plex library data: {e}")
@@ -5788,12 +6570,14 @@ async def get_plex_episode_data(
 
         data = media_export_db.get_episode_data(run_timestamp, limit)
 
-        return {
-            "success": True,
-            "data": data,
-            "count": len(data),
-            "run_timestamp": run_timestamp or "latest",
-        }
+        return api_json(
+            {
+                "success": True,
+                "data": data,
+                "count": len(data),
+                "run_timestamp": run_timestamp or "latest",
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error getting Plex episode data: {e}")
@@ -5813,6 +6597,7 @@ async def import_plex_csvs():
             }
 
         results = media_export_db.import_latest_csvs()
+        await asyncio.to_thread(refresh_library_types)
 
         return {
             "success": True,
@@ -5891,12 +6676,14 @@ async def get_other_media_library_data(
         if limit:
             data = data[:limit]
 
-        return {
-            "success": True,
-            "data": data,
-            "count": len(data),
-            "run_timestamp": run_timestamp or "latest",
-        }
+        return api_json(
+            {
+                "success": True,
+                "data": data,
+                "count": len(data),
+                "run_timestamp": run_timestamp or "latest",
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error getting OtherMedia library data: {e}")
@@ -5923,12 +6710,14 @@ async def get_other_media_episode_data(
 
         data = media_export_db.get_other_episode_data(run_timestamp, limit)
 
-        return {
-            "success": True,
-            "data": data,
-            "count": len(data),
-            "run_timestamp": run_timestamp or "latest",
-        }
+        return api_json(
+            {
+                "success": True,
+                "data": data,
+                "count": len(data),
+                "run_timestamp": run_timestamp or "latest",
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error getting OtherMedia episode data: {e}")
@@ -5948,6 +6737,7 @@ async def import_other_media_csvs():
             }
 
         results = media_export_db.import_other_latest_csvs()
+        await asyncio.to_thread(refresh_library_types)
 
         return {
             "success": True,
@@ -7462,9 +8252,12 @@ async def get_logs():
                 }
             )
 
-    # Get logs from UILogs directory
+    # Get logs from UILogs directory, including rotated FrontendUI.log.1(.gz), ...
     if UI_LOGS_DIR.exists():
-        for log_file in UI_LOGS_DIR.glob("*.log"):
+        ui_log_files = list(UI_LOGS_DIR.glob("*.log")) + [
+            path for path in UI_LOGS_DIR.glob("*.log.[0-9]*") if not path.name.endswith(".tmp")
+        ]
+        for log_file in ui_log_files:
             stat = log_file.stat()
             log_files.append(
                 {
@@ -7478,125 +8271,190 @@ async def get_logs():
     return {"logs": sorted(log_files, key=lambda x: x["modified"], reverse=True)}
 
 
-@app.get("/api/logs/{log_name}")
-async def get_log_content(log_name: str, tail: int = 100):
-    """Get log file content from either Logs or UILogs directory"""
-    # Try Logs directory first
-    log_path = LOGS_DIR / log_name
+log_index_requested = threading.Event()  # Wakes the log maintenance thread early
+# Bytes a search reads itself before answering; larger backlogs go to the background
+LOG_SEARCH_CATCHUP_BYTES = 16 * 1024 * 1024
+# Seconds between log maintenance passes (Posterizarr rotates its logs on every run)
+LOG_MAINTENANCE_INTERVAL = 15 * 60
 
-    # If not found, try UILogs directory
-    if not log_path.exists():
-        log_path = UI_LOGS_DIR / log_name
 
-    if not log_path.exists():
-        raise HTTPException(status_code=404, detail="Log file not found")
+def schedule_log_index():
+    """Run log maintenance now instead of at the next interval"""
+    log_index_requested.set()
 
-    try:
-        with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-            return {"content": lines[-tail:] if tail else lines}
-    except Exception as e:
-        logger.error(f"Error reading log: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
 
+def start_log_maintenance():
+    """Compress rotated logs and index new log lines in a background thread"""
+    threading.Thread(target=_log_maintenance_worker, name="LogMaintenance", daemon=True).start()
 
-@app.get("/api/logs/ui/unified")
-async def get_unified_ui_logs(tail: int = 500):
-    """
-    Get unified UI logs from FrontendUI.log with both backend and frontend entries
-    Returns chronologically sorted logs with source identification
-    """
-    try:
-        ui_log_path = UI_LOGS_DIR / "FrontendUI.log"
 
-        if not ui_log_path.exists():
-            return {"logs": [], "total": 0, "message": "No UI logs available yet"}
+def _log_maintenance_worker():
+    while True:
+        log_index_requested.clear()
+        if LOG_COMPRESSION:
+            try:
+                compress_rotated_logs(ROTATED_LOGS_DIR)
+            except Exception as e:
+                logger.error(f"Error compressing rotated logs: {e}")
+        if log_index_db is not None:
+            try:
+                log_index_db.ingest(BASE_DIR)
+            except Exception as e:
+                logger.error(f"Error indexing logs: {e}")
+        log_index_requested.wait(LOG_MAINTENANCE_INTERVAL)
 
-        import re
-        from datetime import datetime
 
-        logs = []
+def _parse_log_time(value: Optional[str], end: bool = False) -> Optional[str]:
+    """'YYYY-MM-DD[ HH:MM[:SS]]' (or ISO with T) -> 'YYYY-MM-DD HH:MM:SS'; dates cover the whole day"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid time: {value}")
+    if end and len(value.strip()) <= 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+@app.get("/api/logs/search")
+async def search_logs(
+    q: Optional[str] = None,
+    level: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    file: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    before: Optional[int] = None,
+):
+    """
+    Full-text search across current and rotated logs, newest first
 
-        with open(ui_log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
+    Args:
+        q: Words or "phrases" that must all appear; a trailing * matches prefixes
+        level: Comma-separated levels (e.g. "ERROR,WARNING")
+        since / until: Time range, 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'
+        file: Comma-separated file names (Scriptlog.log) or paths
+            (RotatedLogs/Logs_20250101_120000/Scriptlog.log)
+        limit: Results per page
+        before: 'next_before' of the previous page
+    """
+    if log_index_db is None:
+        raise HTTPException(status_code=503, detail="Log search is not available")
 
-        # Parse each log line
-        # Backend format: [TIMESTAMP] [LEVEL] [BACKEND:module:function:line] - MESSAGE
-        # Frontend format: [TIMESTAMP] [LEVEL] [UI:Component] - MESSAGE
+    since_value = _parse_log_time(since)
+    until_value = _parse_log_time(until, end=True)
 
-        backend_pattern = re.compile(
-            r"^\[([^\]]+)\]\s+\[([^\]]+)\]\s+\[BACKEND:([^\]]+)\]\s+-\s+(.*)$"
+    try:
+        # Catch up with lines written since the last pass unless one is running
+        stats = await asyncio.to_thread(
+            log_index_db.ingest, BASE_DIR, False, LOG_SEARCH_CATCHUP_BYTES
         )
-        frontend_pattern = re.compile(
-            r"^\[([^\]]+)\]\s+\[([^\]]+)\]\s+\[UI:([^\]]+)\]\s+-\s+(.*)$"
+        if stats is not None and not stats["complete"]:
+            schedule_log_index()
+
+        result = await asyncio.to_thread(
+            log_index_db.search,
+            q,
+            level.split(",") if level else None,
+            since_value,
+            until_value,
+            [name.strip() for name in file.split(",")] if file else None,
+            limit,
+            before,
         )
+    except Exception as e:
+        logger.error(f"Error searching logs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+    result["indexing"] = stats is None or not stats["complete"]
+    return result
 
-            # Try backend format
-            backend_match = backend_pattern.match(line)
-            if backend_match:
-                timestamp_str, level, module_info, message = backend_match.groups()
-                logs.append(
-                    {
-                        "timestamp": timestamp_str,
-                        "level": level.strip(),
-                        "source": "backend",
-                        "component": module_info,
-                        "message": message,
-                        "raw": line,
-                    }
-                )
-                continue
 
-            # Try frontend format
-            frontend_match = frontend_pattern.match(line)
-            if frontend_match:
-                timestamp_str, level, component, message = frontend_match.groups()
-                logs.append(
-                    {
-                        "timestamp": timestamp_str,
-                        "level": level.strip(),
-                        "source": "frontend",
-                        "component": component,
-                        "message": message,
-                        "raw": line,
-                    }
-                )
-                continue
+@app.get("/api/logs/{log_name}")
+async def get_log_content(
+    log_name: str,
+    tail: int = 100,
+    before: Optional[int] = Query(None, ge=0),
+    after: Optional[int] = Query(None, ge=0),
+):
+    """
+    Get log file content from either Logs or UILogs directory
 
-            # If no pattern matches, include as raw log
-            logs.append(
-                {
-                    "timestamp": "",
-                    "level": "UNKNOWN",
-                    "source": "unknown",
-                    "component": "",
-                    "message": line,
-                    "raw": line,
-                }
+    Args:
+        tail: Number of lines (0 = whole file when neither before nor after is given)
+        before: Return the 'tail' lines ending at this byte offset (older page)
+        after: Return up to 'tail' complete lines starting at this byte offset (newer page)
+
+    Returns 'start' / 'end' byte offsets of the returned lines; use start as
+    'before' for the previous page and end as 'after' to poll for new lines.
+    Compressed rotated logs (.gz) are read like plain ones; offsets and size
+    refer to the uncompressed data.
+    """
+    # Try Logs directory first, then UILogs (plain or compressed)
+    log_path = find_log(LOGS_DIR, log_name) or find_log(UI_LOGS_DIR, log_name)
+
+    if log_path is None:
+        raise HTTPException(status_code=404, detail="Log file not found")
+
+    if before is not None and after is not None:
+        raise HTTPException(status_code=400, detail="Use either 'before' or 'after'")
+
+    try:
+        if after is not None:
+            lines, end, start = await asyncio.to_thread(
+                read_lines_after, log_path, after, tail or LOG_PAGE_MAX_LINES
+            )
+        elif before is not None or tail:
+            lines, start, end = await asyncio.to_thread(
+                read_lines_before, log_path, tail or LOG_PAGE_MAX_LINES, before
             )
+        else:
+            with open_log(log_path) as f:
+                lines = io.TextIOWrapper(f, encoding="utf-8", errors="ignore").readlines()
+            start, end = 0, log_size(log_path)
+        return {"content": lines, "start": start, "end": end, "size": log_size(log_path)}
+    except Exception as e:
+        logger.error(f"Error reading log: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Sort by timestamp (most recent last)
-        def parse_timestamp(log_entry):
-            try:
-                if log_entry["timestamp"]:
-                    return datetime.strptime(
-                        log_entry["timestamp"], "%Y-%m-%d %H:%M:%S"
-                    )
-                return datetime.min
-            except (ValueError, TypeError):
-                return datetime.min
 
-        logs.sort(key=parse_timestamp)
+@app.get("/api/logs/ui/unified")
+async def get_unified_ui_logs(
+    tail: int = 500,
+    level: Optional[str] = None,
+    source: Optional[str] = None,
+    component: Optional[str] = None,
+):
+    """
+    Get unified UI logs from FrontendUI.log with both backend and frontend entries
+    Returns the newest entries in file (chronological) order with source identification
+
+    Args:
+        tail: Number of entries (0 = all buffered, up to UI_LOG_STORE_SIZE)
+        level: Comma-separated levels (e.g. "ERROR,WARNING")
+        source: Comma-separated sources ("backend", "ui")
+        component: Case-insensitive part of the component (e.g. "lifespan", "Gallery")
+    """
+    try:
+        # Only lines appended since the last request are parsed
+        if not await asyncio.to_thread(ui_log_store.refresh):
+            return {"logs": [], "total": 0, "message": "No UI logs available yet"}
 
-        # Return last N entries
-        result_logs = logs[-tail:] if tail and len(logs) > tail else logs
+        result_logs = ui_log_store.query(
+            tail,
+            level.split(",") if level else None,
+            source.split(",") if source else None,
+            component,
+        )
 
-        return {"logs": result_logs, "total": len(result_logs), "total_all": len(logs)}
+        return {
+            "logs": result_logs,
+            "total": len(result_logs),
+            "total_all": ui_log_store.total,
+            "has_older": ui_log_store.has_older
+            or ui_log_store.total > len(ui_log_store.entries),
+        }
 
     except Exception as e:
         logger.error(f"Error reading unified UI logs: {e}")
@@ -7606,14 +8464,10 @@ async def get_unified_ui_logs(tail: int = 500):
 @app.get("/api/logs/{log_name}/exists")
 async def check_log_exists(log_name: str):
     """Check if a log file exists (for waiting until script creates log)"""
-    # Try Logs directory first
-    log_path = LOGS_DIR / log_name
+    # Try Logs directory first, then UILogs (plain or compressed)
+    log_path = find_log(LOGS_DIR, log_name) or find_log(UI_LOGS_DIR, log_name)
 
-    # If not found, try UILogs directory
-    if not log_path.exists():
-        log_path = UI_LOGS_DIR / log_name
-
-    exists = log_path.exists()
+    exists = log_path is not None
 
     return {
         "exists": exists,
@@ -7622,6 +8476,17 @@ async def check_log_exists(log_name: str):
     }
 
 
+async def _wait_for_websocket_disconnect(websocket: WebSocket):
+    """Consume incoming frames until the client disconnects"""
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+    except Exception:
+        return
+
+
 @app.websocket("/ws/logs")
 async def websocket_logs(
     websocket: WebSocket, log_file: Optional[str] = Query("Scriptlog.log")
@@ -7638,9 +8503,11 @@ async def websocket_logs(
     logger.info(f"WebSocket connection established for log: {log_file}")
 
     # Determine which log file to monitor - check both directories
-    log_path = LOGS_DIR / log_file
-    if not log_path.exists():
-        log_path = UI_LOGS_DIR / log_file
+    log_path = (
+        find_log(LOGS_DIR, log_file)
+        or find_log(UI_LOGS_DIR, log_file)
+        or UI_LOGS_DIR / log_file
+    )
 
     # Track if user explicitly requested a specific log file
     user_requested_log = log_file != "Scriptlog.log"  # User manually selected a log
@@ -7657,28 +8524,42 @@ async def websocket_logs(
         "scheduled": "Scriptlog.log",
     }
 
-    try:
-        # Send initial logs (increased to 100 lines)
-        if log_path.exists():
-            with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()[-100:]
-                for line in lines:
-                    stripped = line.strip()
-                    if stripped:  # Only send non-empty lines
-                        await websocket.send_json({"type": "log", "content": stripped})
+    subscriber = None
+    disconnect_task = asyncio.create_task(_wait_for_websocket_disconnect(websocket))
+
+    async def send_lines(message_type: str, lines: List[str]):
+        if lines:
+            await websocket.send_json({"type": message_type, "lines": lines})
 
-        # Monitor log file for changes with dynamic log file switching
-        last_position = log_path.stat().st_size if log_path.exists() else 0
+    async def follow(path: Path):
+        """Subscribe to 'path' and send the lines before the stream starts"""
+        nonlocal subscriber
+        if subscriber is not None:
+            log_stream_hub.unsubscribe(subscriber)
+        subscriber, offset = log_stream_hub.subscribe(path)
+        if path.exists():
+            lines = (await asyncio.to_thread(read_lines_before, path, LOG_STREAM_INITIAL_LINES, offset))[0]
+            await send_lines("log_batch", [line.strip() for line in lines if line.strip()])
+
+    try:
+        # Send initial logs (last 100 lines), then stream new lines in batches
+        await follow(log_path)
         last_mode = current_mode
         current_log_file = log_file  # Track current log file being watched
 
-        while True:
-            try:
-                # FASTER POLLING: 0.3s instead of 1s
-                await asyncio.sleep(0.3)
-            except asyncio.CancelledError:
-                logger.info("WebSocket log streaming cancelled (connection closed)")
-                break
+        while not disconnect_task.done():
+            message = await subscriber.get(timeout=1.0)
+            if message is not None:
+                kind, payload = message
+                if kind == "lines":
+                    await send_lines("log_batch", payload)
+                else:
+                    # Client fell behind and batches were dropped: resend the tail
+                    logger.debug(f"WebSocket client behind on {log_path.name}, resyncing")
+                    lines = (await asyncio.to_thread(read_lines_before, log_path, LOG_STREAM_INITIAL_LINES, payload))[0]
+                    await websocket.send_json(
+                        {"type": "log_resync", "lines": [line.strip() for line in lines if line.strip()]}
+                    )
 
             # Only auto-switch if user didn't manually request a specific log
             # AND the current mode changed
@@ -7700,7 +8581,6 @@ async def websocket_logs(
                     log_path = LOGS_DIR / new_log_file
                     if not log_path.exists():
                         log_path = UI_LOGS_DIR / new_log_file
-                    last_position = log_path.stat().st_size if log_path.exists() else 0
 
                     # Notify client about log file change
                     await websocket.send_json(
@@ -7710,6 +8590,7 @@ async def websocket_logs(
                             "mode": current_mode,
                         }
                     )
+                    await follow(log_path)
 
                 last_mode = current_mode
             elif user_requested_log and current_mode != last_mode:
@@ -7719,38 +8600,6 @@ async def websocket_logs(
                     f"Mode changed to {current_mode}, but user manually selected {log_file}, not auto-switching"
                 )
 
-            # Monitor current log file
-            if log_path.exists():
-                try:
-                    current_size = log_path.stat().st_size
-
-                    # Handle log file truncation/rotation
-                    if current_size < last_position:
-                        last_position = 0
-                        logger.info(
-                            f"Log file {log_path.name} was truncated or rotated"
-                        )
-
-                    if current_size > last_position:
-                        with open(
-                            log_path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            f.seek(last_position)
-                            new_lines = f.readlines()
-
-                            # Send new lines immediately as they come
-                            for line in new_lines:
-                                stripped = line.strip()
-                                if stripped:  # Only send non-empty lines
-                                    await websocket.send_json(
-                                        {"type": "log", "content": stripped}
-                                    )
-
-                        last_position = current_size
-                except OSError as e:
-                    logger.warning(f"Error reading log file: {e}")
-                    await asyncio.sleep(1)  # Wait longer on file errors
-
     except WebSocketDisconnect as e:
         # Normal disconnect - check close code
         close_code = e.code if hasattr(e, "code") else None
@@ -7777,6 +8626,9 @@ async def websocket_logs(
             except:
                 pass
     finally:
+        disconnect_task.cancel()
+        if subscriber is not None:
+            log_stream_hub.unsubscribe(subscriber)
         logger.debug("WebSocket connection closed")
 
 
@@ -7786,7 +8638,7 @@ async def get_gallery():
     try:
         cache = get_fresh_assets()
         # Return cached posters, limit to 200 for performance
-        return {"images": cache["posters"][:200]}
+        return api_json({"images": add_placeholders(records_to_dicts(cache["posters"][:200]))})
     except Exception as e:
         logger.error(f"Error getting gallery from cache: {e}")
         return {"images": []}
@@ -7853,19 +8705,9 @@ def _get_categorized_assets(config: dict) -> dict:
     # Get all records from database
     records = db.get_all_choices()
 
-    # Create a fast lookup map from the asset cache
-    logger.debug("Creating fast asset lookup map from cache for overview...")
+    # Path lookup map from the asset cache, built once per scan
     cache = get_fresh_assets()
-    all_cached_assets = (
-        cache["posters"]
-        + cache["backgrounds"]
-        + cache["seasons"]
-        + cache["titlecards"]
-    )
-    asset_map = {
-        img["path"].replace("\\", "/"): img for img in all_cached_assets
-    }
-    logger.debug(f"Asset map created with {len(asset_map)} items for overview")
+    asset_map = cache["index"].by_path
 
     # Get primary language and provider from config
     primary_language = None
@@ -8137,7 +8979,7 @@ async def get_backgrounds_gallery():
     """Get backgrounds gallery from assets directory (only background.jpg) - uses cache"""
     try:
         cache = get_fresh_assets()
-        return {"images": cache["backgrounds"][:200]}
+        return api_json({"images": add_placeholders(records_to_dicts(cache["backgrounds"][:200]))})
     except Exception as e:
         logger.error(f"Error getting backgrounds from cache: {e}")
         return {"images": []}
@@ -8245,7 +9087,7 @@ async def get_seasons_gallery():
     """Get seasons gallery from assets directory (only SeasonXX.jpg) - uses cache"""
     try:
         cache = get_fresh_assets()
-        return {"images": cache["seasons"][:200]}
+        return api_json({"images": add_placeholders(records_to_dicts(cache["seasons"][:200]))})
     except Exception as e:
         logger.error(f"Error getting seasons from cache: {e}")
         return {"images": []}
@@ -8353,7 +9195,7 @@ async def get_titlecards_gallery():
     """Get title cards gallery from assets directory (only SxxExx.jpg - episodes) - uses cache"""
     try:
         cache = get_fresh_assets()
-        return {"images": cache["titlecards"][:200]}
+        return api_json({"images": add_placeholders(records_to_dicts(cache["titlecards"][:200]))})
     except Exception as e:
         logger.error(f"Error getting titlecards from cache: {e}")
         return {"images": []}
@@ -8473,7 +9315,7 @@ async def get_manual_assets_gallery():
         logger.debug(
             f"Returning cached manual assets gallery: {len(manual_gallery_data.get('libraries', []))} libraries"
         )
-        return manual_gallery_data
+        return api_json(manual_gallery_data)
 
     except Exception as e:
         logger.error(f"Error getting manual assets gallery from cache: {e}")
@@ -8579,7 +9421,7 @@ async def get_backup_assets_gallery():
     try:
         cache = get_fresh_assets()
         # Return empty structure if not found in cache yet
-        return cache.get("backup_gallery", {"libraries": [], "total_assets": 0})
+        return api_json(cache.get("backup_gallery", {"libraries": [], "total_assets": 0}))
     except Exception as e:
         logger.error(f"Error getting backup gallery: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -8688,26 +9530,183 @@ async def get_assets_folder_images_filtered(image_type: str, folder_path: str):
     try:
         cache = get_fresh_assets()
 
-        # Get the appropriate image list from cache
-        all_images = cache[image_type]
-
-        # Filter images that belong to the specified folder
+        # Images below the specified folder (binary search on the sorted list)
         # folder_path is like "4K" or "Movies/ActionMovies"
-        filtered_images = [
-            img
-            for img in all_images
-            if img["path"].startswith(folder_path + "/")
-            or img["path"].startswith(folder_path + "\\")
-        ]
+        filtered_images = cache["index"].folder(image_type, folder_path.replace("\\", "/"))
 
-        return {"images": filtered_images}
+        return {"images": add_placeholders(records_to_dicts(filtered_images))}
     except Exception as e:
         logger.error(f"Error getting folder images from cache: {e}")
         return {"images": []}
 
+
+@app.get("/api/assets/query")
+async def query_assets(
+    type: Optional[str] = Query(None),
+    library: Optional[str] = Query(None),
+    media_type: Optional[str] = Query(None),
+    modified_from: Optional[float] = Query(None),
+    modified_to: Optional[float] = Query(None),
+    min_size: Optional[int] = Query(None, ge=0),
+    max_size: Optional[int] = Query(None, ge=0),
+    min_width: Optional[int] = Query(None, ge=0),
+    max_width: Optional[int] = Query(None, ge=0),
+    min_height: Optional[int] = Query(None, ge=0),
+    max_height: Optional[int] = Query(None, ge=0),
+    aspect: Optional[str] = Query(None),
+    not_aspect: Optional[str] = Query(None),
+    aspect_tolerance: float = Query(0.01, ge=0, le=0.5),
+    format: Optional[str] = Query(None),
+    sort: Literal["name", "mtime", "size"] = Query("name"),
+    order: Literal["asc", "desc"] = Query("asc"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+):
+    """
+    Query the asset cache with filters, sorting and cursor pagination - uses cache
+
+    Args:
+        type: Comma-separated buckets (posters, backgrounds, seasons, titlecards), default all
+        library: Library folder or sub folder path ("Movies" or "Movies/Title (2020)")
+        media_type: Comma-separated media types (Movie, Show, Season, Episode, ...)
+        modified_from / modified_to: Inclusive modification time range (Unix timestamps)
+        min_size / max_size: Inclusive file size range in bytes
+        min_width / max_width / min_height / max_height: Inclusive pixel ranges
+        aspect: Only this width:height ratio ("16:9", "2:3" or "1.78")
+        not_aspect: Only ratios other than this one (e.g. backgrounds not 16:9)
+        aspect_tolerance: Allowed relative deviation for aspect / not_aspect
+        format: Comma-separated image formats (JPEG, PNG, WEBP)
+        Images whose header has not been read yet never match the pixel,
+        aspect or format filters.
+        sort: "name" (library/folder/file path), "mtime" or "size"
+        order: "asc" or "desc"
+        limit: Page size (1-500)
+        cursor: next_cursor of the previous page
+    """
+    buckets = list(ASSET_BUCKETS)
+    if type:
+        buckets = [b.strip() for b in type.split(",") if b.strip()]
+        invalid = [b for b in buckets if b not in ASSET_BUCKETS]
+        if invalid or not buckets:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid image type. Must be one of: {list(ASSET_BUCKETS)}",
+            )
+
+    descending = order == "desc"
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, sort, descending)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    media_types = [t.strip() for t in media_type.split(",") if t.strip()] if media_type else None
+
+    try:
+        dimensions = DimensionFilter(
+            min_width=min_width,
+            max_width=max_width,
+            min_height=min_height,
+            max_height=max_height,
+            aspect=parse_aspect(aspect) if aspect else None,
+            not_aspect=parse_aspect(not_aspect) if not_aspect else None,
+            aspect_tolerance=aspect_tolerance,
+            formats=[f.strip() for f in format.split(",") if f.strip()] if format else None,
+        )
+    except (ValueError, ZeroDivisionError):
+        raise HTTPException(
+            status_code=400, detail="Invalid aspect ratio. Use a ratio like 16:9 or 1.78"
+        )
+
+    try:
+        cache = get_fresh_assets()
+        start_time = time.perf_counter()
+        page, last_key = cache["index"].query(
+            buckets,
+            folder=library.replace("\\", "/") if library else None,
+            media_types=media_types,
+            modified_from=modified_from,
+            modified_to=modified_to,
+            min_size=min_size,
+            max_size=max_size,
+            dimensions=dimensions,
+            sort=sort,
+            descending=descending,
+            limit=limit,
+            after=after,
+        )
+        logger.debug(
+            f"Asset query ({sort} {order}, {len(page)} results) took "
+            f"{(time.perf_counter() - start_time) * 1000:.1f}ms"
+        )
+
+        return api_json(
+            {
+                "success": True,
+                "images": add_placeholders(records_to_dicts(page)),
+                "count": len(page),
+                "limit": limit,
+                "sort": sort,
+                "order": order,
+                "has_more": last_key is not None,
+                "next_cursor": encode_cursor(sort, descending, last_key) if last_key else None,
+            }
+        )
+    except Exception as e:
+        logger.error(f"Error querying assets from cache: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 # ============================================================================
 # FOLDER VIEW (RECURSIVE)
 # ============================================================================
+# Image files listed by the folder view
+FOLDER_VIEW_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def _resolve_folder_view_path(path: Optional[str]) -> Tuple[Path, str]:
+    """
+    Directory of a folder view path inside ASSETS_DIR
+
+    Returns:
+        (directory, path relative to ASSETS_DIR with forward slashes)
+    """
+    if not path:
+        return ASSETS_DIR, ""
+
+    # Sanitize path to prevent traversal
+    # This is a simple sanitization; a more robust one might be needed
+    if ".." in path:
+        raise HTTPException(status_code=400, detail="Invalid path")
+
+    full_path = (ASSETS_DIR / path).resolve()
+
+    # Ensure the path is within ASSETS_DIR
+    if not str(full_path).startswith(str(ASSETS_DIR.resolve())):
+        raise HTTPException(status_code=403, detail="Access denied: Invalid path")
+
+    if not full_path.exists() or not full_path.is_dir():
+        raise HTTPException(status_code=404, detail="Path not found")
+
+    return full_path, str(full_path.relative_to(ASSETS_DIR)).replace("\\", "/")
+
+
+def _folder_view_asset_type(filename: str, library_folder: Optional[str]) -> Tuple[str, str]:
+    """
+    Media type of a folder view image and the simple type the frontend uses
+    (poster, background, season, titlecard)
+    """
+    asset_type_str = determine_media_type(filename, library_folder)
+    asset_type_simple = "poster"  # default
+    if "background" in asset_type_str.lower():
+        asset_type_simple = "background"
+    elif "season" in asset_type_str.lower():
+        asset_type_simple = "season"
+    elif "episode" in asset_type_str.lower():
+        asset_type_simple = "titlecard"
+    return asset_type_str, asset_type_simple
+
+
 # This new endpoint REPLACES get_folder_view_items and get_folder_view_assets
 @app.get("/api/folder-view/browse")
 async def get_folder_view_browse(path: Optional[str] = Query(None)):
@@ -8716,26 +9715,7 @@ async def get_folder_view_browse(path: Optional[str] = Query(None)):
     Returns a list of folders and assets at the specified path.
     """
     try:
-        current_dir = ASSETS_DIR
-        relative_path_str = ""
-
-        if path:
-            # Sanitize path to prevent traversal
-            # This is a simple sanitization; a more robust one might be needed
-            if ".." in path:
-                raise HTTPException(status_code=400, detail="Invalid path")
-
-            full_path = (ASSETS_DIR / path).resolve()
-
-            # Ensure the path is within ASSETS_DIR
-            if not str(full_path).startswith(str(ASSETS_DIR.resolve())):
-                raise HTTPException(status_code=403, detail="Access denied: Invalid path")
-
-            if not full_path.exists() or not full_path.is_dir():
-                raise HTTPException(status_code=404, detail="Path not found")
-
-            current_dir = full_path
-            relative_path_str = str(full_path.relative_to(ASSETS_DIR)).replace("\\", "/")
+        current_dir, relative_path_str = _resolve_folder_view_path(path)
 
         logger.info(f"Browsing folder view: {current_dir}")
 
@@ -8775,29 +9755,22 @@ async def get_folder_view_browse(path: Optional[str] = Query(None)):
             elif item.is_file():
                 # This is a file, check if it's an image
                 file_ext = item.suffix.lower()
-                if file_ext in {".jpg", ".jpeg", ".png", ".webp"}:
+                if file_ext in FOLDER_VIEW_EXTENSIONS:
                     # This is an asset
                     file_path = item.relative_to(ASSETS_DIR)
                     url_path = str(file_path).replace("\\", "/")
                     encoded_url_path = quote(url_path, safe="/")
 
                     # Determine asset type (poster, background, etc.)
-                    asset_type_str = determine_media_type(item.name, library_folder)
-
-                    # Map to simple types for frontend (poster, background, season, titlecard)
-                    asset_type_simple = "poster" # default
-                    if "background" in asset_type_str.lower():
-                        asset_type_simple = "background"
-                    elif "season" in asset_type_str.lower():
-                        asset_type_simple = "season"
-                    elif "episode" in asset_type_str.lower():
-                        asset_type_simple = "titlecard"
+                    asset_type_str, asset_type_simple = _folder_view_asset_type(
+                        item.name, library_folder
+                    )
 
                     items.append({
                         "type": "asset",
                         "name": item.name,
                         "path": url_path,
-                        "url": f"/poster_assets/{encoded_url_path}",
+                        "url": f"/poster_assets/{encoded_url_path}{version_query(modified)}",
                         "size": item.stat().st_size,
                         "asset_type": asset_type_simple, # e.g., 'poster', 'background'
                         "full_type": asset_type_str, # e.g., 'Movie', 'Show Background'
@@ -8807,6 +9780,7 @@ async def get_folder_view_browse(path: Optional[str] = Query(None)):
 
         # Sort: folders first, then assets
         items.sort(key=lambda x: (x["type"] != "folder", x["name"]))
+        add_placeholders([item for item in items if item["type"] == "asset"])
 
         return {
             "success": True,
@@ -8821,6 +9795,79 @@ async def get_folder_view_browse(path: Optional[str] = Query(None)):
         logger.exception("Full traceback:")
         return {"success": False, "error": str(e), "items": []}
 
+@app.get("/api/folder-view/sheet")
+async def get_folder_view_sheet(
+    path: Optional[str] = Query(None),
+    width: int = Query(150),
+    format: Literal["webp", "jpeg"] = Query("webp"),
+):
+    """
+    Contact sheet of the images in a folder view folder: one sprite at
+    thumbnail scale plus the coordinates of every image in it. The sheet is
+    cached and only rendered again when the folder's images change.
+
+    Args:
+        path: Folder relative to the assets directory (default: root)
+        width: Tile width (150 or 300); posters and seasons are cropped to
+            2:3, backgrounds and title cards to 16:9 like the folder view tiles
+        format: "webp" (default) or "jpeg"
+    """
+    if not thumbnail_service:
+        raise HTTPException(status_code=503, detail="Thumbnail service not available")
+    if width not in SHEET_WIDTHS:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid width. Must be one of: {list(SHEET_WIDTHS)}"
+        )
+
+    current_dir, relative_path_str = _resolve_folder_view_path(path)
+    library_folder = relative_path_str.split("/")[0] if relative_path_str else None
+
+    def list_tiles() -> List[SheetTile]:
+        tiles = []
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if os.path.splitext(entry.name)[1].lower() not in FOLDER_VIEW_EXTENSIONS:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                asset_type = _folder_view_asset_type(entry.name, library_folder)[1]
+                tiles.append(
+                    SheetTile(
+                        path=f"{relative_path_str}/{entry.name}" if relative_path_str else entry.name,
+                        source=Path(entry.path),
+                        size=st.st_size,
+                        mtime=st.st_mtime,
+                        aspect=9 / 16 if asset_type in ("background", "titlecard") else 3 / 2,
+                    )
+                )
+        tiles.sort(key=lambda tile: tile.path)
+        return tiles
+
+    try:
+        tiles = await asyncio.to_thread(list_tiles)
+        if not tiles:
+            return {"success": True, "path": relative_path_str, "sheet_url": None, "tiles": {}}
+
+        name, layout = await thumbnail_service.get_sheet(
+            f"poster_assets/{relative_path_str}", tiles, width, format
+        )
+        return {
+            "success": True,
+            "path": relative_path_str,
+            "sheet_url": f"/thumbnails/sheets/{name}",
+            **layout,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating contact sheet for '{path}': {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/recent-assets")
 async def get_recent_assets():
     """
@@ -8857,24 +9904,10 @@ async def get_recent_assets():
                 "total_count": 0,
             }
 
-        # Create a fast lookup map from the asset cache
-        # This scans the cache (memory) not the disk
-        logger.debug("Creating fast asset lookup map from cache...")
+        # Path lookup map from the asset cache, built once per scan
+        # This uses the cache (memory) not the disk
         cache = get_fresh_assets()
-        # Combine all asset types into one lookup
-        all_cached_assets = (
-            cache["posters"]
-            + cache["backgrounds"]
-            + cache["seasons"]
-            + cache["titlecards"]
-        )
-
-        # Create a map: { "Library/Folder/poster.jpg": { ... asset data ... } }
-        # Use normalized paths for lookup
-        asset_map = {
-            img["path"].replace("\\", "/"): img for img in all_cached_assets
-        }
-        logger.debug(f"Asset map created with {len(asset_map)} items")
+        asset_map = cache["index"].by_path
 
         # Convert database records to asset format and find poster files
         all_assets_with_mtime = []
@@ -8982,11 +10015,13 @@ async def get_recent_assets():
             f"Returning {len(recent_assets)} most recent assets with existing images from database"
         )
 
-        return {
-            "success": True,
-            "assets": recent_assets,
-            "total_count": len(recent_assets),
-        }
+        return api_json(
+            {
+                "success": True,
+                "assets": recent_assets,
+                "total_count": len(recent_assets),
+            }
+        )
 
     except Exception as e:
         logger.error(f"[ERROR] Error getting recent assets from database: {e}")
@@ -9206,10 +10241,13 @@ async def get_assets_stats():
 
 
 @app.post("/api/refresh-cache")
-async def refresh_cache():
-    """Manually refresh the asset cache"""
+async def refresh_cache(full: bool = True):
+    """
+    Manually refresh the asset cache (full rescan unless full=false).
+    A running background scan is cancelled so this one starts right away.
+    """
     try:
-        scan_and_cache_assets()
+        await asyncio.to_thread(scan_and_cache_assets, full_rescan=full, preempt=True)
         return {
             "success": True,
             "message": "Cache refreshed successfully",
@@ -9264,7 +10302,11 @@ async def get_cache_status():
                 "running": cache_refresh_running,
                 "thread_alive": thread_alive,
                 "scan_in_progress": cache_scan_in_progress,
+                "throttle": asset_scan_throttle.status() if asset_scan_throttle else None,
             },
+            "watcher": assets_watcher.status() if assets_watcher else {"running": False},
+            "thumbnails": thumbnail_service.status() if thumbnail_service else None,
+            "scans": scan_history.status(),
         }
     except Exception as e:
         logger.error(f"Error getting cache status: {e}")
@@ -12284,21 +13326,9 @@ async def get_assets_overview():
         # Get all records from database
         records = db.get_all_choices()
 
-        # Create a fast lookup map from the asset cache
-        logger.debug("Creating fast asset lookup map from cache for overview...")
+        # Path lookup map from the asset cache, built once per scan
         cache = get_fresh_assets()
-        all_cached_assets = (
-            cache["posters"]
-            + cache["backgrounds"]
-            + cache["seasons"]
-            + cache["titlecards"]
-        )
-
-        # Create a map: { "Library/Folder/poster.jpg": { ... asset data ... } }
-        asset_map = {
-            img["path"].replace("\\", "/"): img for img in all_cached_assets
-        }
-        logger.debug(f"Asset map created with {len(asset_map)} items for overview")
+        asset_map = cache["index"].by_path
 
         # Get primary languages and provider from config
         primary_language = None
@@ -12510,7 +13540,7 @@ async def get_all_imagechoices():
     try:
         records = db.get_all_choices()
         # Convert sqlite3.Row to dict
-        return [dict(record) for record in records]
+        return api_json([dict(record) for record in records])
     except Exception as e:
         logger.error(f"Error fetching image choices: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -12691,7 +13721,7 @@ async def find_asset_for_imagechoice(record_id: int):
             "asset": {
                 "name": asset_file.name,
                 "path": path_str,
-                "url": f"/poster_assets/{encoded_path_str}",
+                "url": f"/poster_assets/{encoded_path_str}{version_query(asset_file.stat().st_mtime)}",
                 "type": asset_type,
                 "library": library,
             },
@@ -12704,6 +13734,58 @@ async def find_asset_for_imagechoice(record_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class FindAssetsBatchRequest(BaseModel):
+    record_ids: List[int]
+
+
+@app.post("/api/imagechoices/find-assets")
+async def find_assets_for_imagechoices(request: FindAssetsBatchRequest):
+    """
+    Resolve the asset files of many database records in one call.
+    Uses the scanner's rootfolder index, so no filesystem access is needed.
+    Returns {record_id: asset or null}.
+    """
+    if not DATABASE_AVAILABLE or db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+    if len(request.record_ids) > 10000:
+        raise HTTPException(status_code=400, detail="At most 10000 records per request")
+
+    try:
+        records = await asyncio.to_thread(db.get_choices_by_ids, request.record_ids)
+        assets = {record_id: None for record_id in request.record_ids}
+
+        for record in records:
+            record_dict = dict(record)
+            found = resolve_rootfolder_image(
+                record_dict.get("Rootfolder") or "",
+                record_dict.get("Type") or "Poster",
+                record_dict.get("Title") or "",
+                record_dict.get("DownloadSource") or "",
+                library=record_dict.get("LibraryName") or "",
+            )
+            if not found:
+                continue
+
+            relative_path, (_size, created, modified) = found
+            assets[record_dict["id"]] = {
+                "name": relative_path.rsplit("/", 1)[-1],
+                "path": relative_path,
+                "url": _rootfolder_image_url(relative_path, modified),
+                "library": record_dict.get("LibraryName"),
+                "created": created,
+                "modified": modified,
+            }
+
+        found_count = sum(1 for asset in assets.values() if asset)
+        logger.info(f"Resolved {found_count}/{len(assets)} record assets from the rootfolder index")
+        return {"success": True, "assets": assets, "found": found_count}
+
+    except Exception as e:
+        logger.error(f"Error resolving assets for records: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/api/imagechoices/import")
 async def import_imagechoices_csv():
     """Manually trigger import of ImageChoices.csv to database"""
@@ -13265,6 +14347,102 @@ async def save_created_overlay(options: OverlayCreatorRequest):
 # STATIC FILE MOUNTS
 # ============================================
 
+def _thumbnail_sources() -> Dict[str, Path]:
+    """Static mounts that thumbnails can be requested for"""
+    return {
+        "poster_assets": ASSETS_DIR,
+        "manual_poster_assets": MANUAL_ASSETS_DIR,
+        "backup_assets": BACKUP_DIR,
+    }
+
+
+@app.get("/thumbnails/sheets/{name}")
+async def get_contact_sheet(name: str):
+    """
+    Contact sheet rendered by /api/folder-view/sheet. The name is derived
+    from the folder listing, so the file never changes and is cached as immutable.
+    """
+    if not thumbnail_service:
+        raise HTTPException(status_code=503, detail="Thumbnail service not available")
+
+    stem, _, extension = name.partition(".")
+    media_types = {ext.lstrip("."): media for _fmt, ext, media in THUMBNAIL_FORMATS.values()}
+    if len(stem) != 40 or not all(c in "0123456789abcdef" for c in stem) or extension not in media_types:
+        raise HTTPException(status_code=404, detail="Contact sheet not found")
+    if not thumbnail_service.touch(name):
+        raise HTTPException(status_code=404, detail="Contact sheet not found")
+
+    return FileResponse(
+        thumbnail_service.cache_dir / name,
+        media_type=media_types[extension],
+        headers={"Cache-Control": cache_control_header(0, versioned=True)},
+    )
+
+
+@app.get("/thumbnails/{source}/{width}/{file_path:path}")
+async def get_thumbnail(
+    request: Request,
+    source: str,
+    width: int,
+    file_path: str,
+    format: Literal["webp", "jpeg"] = Query("webp"),
+):
+    """
+    Downscaled copy of an image from one of the asset mounts.
+    Served outside /api like the originals, so <img> tags can load it.
+    Conditional requests are answered from the source's stat data, without
+    touching the thumbnail cache.
+
+    Args:
+        source: "poster_assets", "manual_poster_assets" or "backup_assets"
+        width: Thumbnail width (150, 300 or 600)
+        file_path: Image path inside the mount
+        format: "webp" (default) or "jpeg"
+    """
+    if not thumbnail_service:
+        raise HTTPException(status_code=503, detail="Thumbnail service not available")
+
+    root = _thumbnail_sources().get(source)
+    if root is None:
+        raise HTTPException(status_code=404, detail="Unknown thumbnail source")
+    if width not in THUMBNAIL_WIDTHS:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid width. Must be one of: {list(THUMBNAIL_WIDTHS)}"
+        )
+
+    # Prevent path traversal out of the mount
+    source_path = (root / file_path).resolve()
+    try:
+        source_path.relative_to(root.resolve())
+        source_stat = source_path.stat()
+    except (ValueError, OSError):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    # The cache file name already identifies source version, width and format
+    key = f"{source}/{file_path}"
+    etag = '"' + thumbnail_service.cache_name(
+        key, source_stat.st_size, source_stat.st_mtime, width, format
+    ).rpartition(".")[0] + '"'
+    last_modified = formatdate(source_stat.st_mtime, usegmt=True)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": cache_control_header(86400, is_versioned_request(request.scope)),
+    }
+    if is_not_modified(request.headers, etag, last_modified):
+        return NotModifiedResponse(headers)
+
+    try:
+        thumbnail_path = await thumbnail_service.get(source_path, key, width, format)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Image not found")
+    except Exception as e:
+        logger.warning(f"Could not create thumbnail for {source}/{file_path}: {e}")
+        raise HTTPException(status_code=415, detail="Image could not be thumbnailed")
+
+    return FileResponse(thumbnail_path, media_type=THUMBNAIL_FORMATS[format][2], headers=headers)
+
+
 if ASSETS_DIR.exists():
     app.mount(
         "/poster_assets",
@@ -13540,8 +14718,18 @@ async def run_queue(background_tasks: BackgroundTasks):
     return {"success": True, "message": "Queue execution started"}
 
 
+frontend_files: Optional[FrontendStaticFiles] = None
 if FRONTEND_DIR.exists():
-    app.mount("/", StaticFiles(directory=str(FRONTEND_DIR), html=True), name="frontend")
+    frontend_variants = {}
+    if FRONTEND_PRECOMPRESSION_AVAILABLE:
+        try:
+            frontend_variants = precompress_directory(FRONTEND_DIR, FRONTEND_CACHE_DIR)
+        except Exception as e:
+            logger.warning(f"Could not pre-compress frontend assets: {e}")
+    frontend_files = FrontendStaticFiles(
+        directory=str(FRONTEND_DIR), html=True, variants=frontend_variants
+    )
+    app.mount("/", frontend_files, name="frontend")
     logger.info(f"Mounted frontend from {FRONTEND_DIR}")
 
 
@@ -13561,8 +14749,8 @@ async def spa_fallback(request: Request, exc: HTTPException):
 
     # Return index.html for all other 404s (client-side routes)
     index_path = FRONTEND_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if frontend_files is not None and index_path.exists():
+        return frontend_files.index_response(request.scope)
 
     # If index.html doesn't exist, return the original 404
     raise exc
@@ -1054,6 +1054,52 @@ class MediaExportDatabase:
                     conn.close()
                 return None
 
+    def get_library_types(self) -> Dict[str, str]:
+        """
+        Map every known library name to its type (movie/show) in one query
+
+        Uses the latest run of each library. Plex exports take precedence over
+        other media server exports, like lookup_library_type_by_name().
+
+        Returns:
+            {library_name: "movie" | "show"}
+        """
+        with self.lock:
+            try:
+                conn = self._get_connection()
+                cursor = conn.cursor()
+
+                # SQLite returns library_type from the row holding MAX(run_timestamp)
+                cursor.execute(
+                    """
+                    SELECT library_name, library_type, MAX(run_timestamp), 0 AS source
+                    FROM plex_library_export
+                    WHERE library_name IS NOT NULL
+                    GROUP BY library_name
+                    UNION ALL
+                    SELECT library_name, library_type, MAX(run_timestamp), 1 AS source
+                    FROM other_media_library_export
+                    WHERE library_name IS NOT NULL
+                    GROUP BY library_name
+                    ORDER BY source DESC
+                    """
+                )
+                rows = cursor.fetchall()
+                conn.close()
+
+                # Plex rows come last and overwrite other media server rows
+                return {
+                    row["library_name"]: row["library_type"].lower()
+                    for row in rows
+                    if row["library_type"]
+                }
+
+            except Exception as e:
+                logger.error(f"Error loading library types: {e}")
+                if 'conn' in locals():
+                    conn.close()
+                return {}
+
     def get_all_runs(self) -> List[str]:
         """Get list of all unique run timestamps from both library and episode tables"""
         with self.lock:
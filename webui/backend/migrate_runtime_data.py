@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from runtime_database import runtime_db
 from runtime_parser import parse_runtime_from_log
+from log_tail import find_log
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -65,8 +66,8 @@ def migrate_runtime_data():
         for rotation_dir in rotated_logs_dir.iterdir():
             if rotation_dir.is_dir():
                 for log_file, mode in current_logs:
-                    log_path = rotation_dir / log_file
-                    if log_path.exists():
+                    log_path = find_log(rotation_dir, log_file)
+                    if log_path:
                         log_files_to_check.append((log_path, mode))
 
     logger.info(f"Found {len(log_files_to_check)} log files to check")
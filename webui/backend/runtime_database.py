@@ -380,6 +380,7 @@ class RuntimeDatabase:
             if imported_count == 0:
                 logger.info("No JSON files found, checking log files...")
                 from runtime_parser import parse_runtime_from_log
+                from log_tail import find_log
                 rotated_logs_dir = BASE_DIR / "RotatedLogs"
                 log_files_to_check = []
                 current_logs = [
@@ -394,8 +395,8 @@ class RuntimeDatabase:
                     for rotation_dir in rotated_logs_dir.iterdir():
                         if rotation_dir.is_dir():
                             for log_file, mode in current_logs:
-                                log_path = rotation_dir / log_file
-                                if log_path.exists():
+                                log_path = find_log(rotation_dir, log_file)
+                                if log_path:
                                     log_files_to_check.append((log_path, mode))
                 for log_path, mode in log_files_to_check:
                     try:
@@ -9,6 +9,8 @@ from typing import Dict, Optional
 import logging
 from datetime import datetime
 
+from log_tail import COMPRESSED_SUFFIX, tail_lines
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,9 +31,7 @@ def parse_runtime_from_log(log_path: Path, mode: str = "normal") -> Optional[Dic
             return None
 
         # Read last 150 lines to find the runtime info
-        with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
-            lines = f.readlines()
-            last_lines = lines[-150:] if len(lines) > 150 else lines
+        last_lines = tail_lines(log_path, 150)
 
         runtime_seconds = None
         runtime_formatted = None
@@ -143,7 +143,7 @@ def parse_runtime_from_log(log_path: Path, mode: str = "normal") -> Optional[Dic
             "titlecards": titlecards,
             "errors": errors,
             "fallbacks": fallback_images,
-            "log_file": log_path.name,
+            "log_file": log_path.name.removesuffix(COMPRESSED_SUFFIX),
             "start_time": "",  # Not available in log files
             "end_time": "",  # Not available in log files
         }
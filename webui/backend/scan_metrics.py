@@ -0,0 +1,117 @@
+"""
+Asset Scan Instrumentation
+
+Collects per-phase timings and counters of every asset cache refresh and keeps
+the last runs in a ring buffer, so /api/cache/status can show where refresh
+time goes (directory walk, stat calls, classification, library lookups,
+manual and backup gallery scans).
+
+Phase durations are wall-clock seconds. "walk" covers the whole directory pass
+including its stat() calls; "stat" is the time spent in stat() calls alone,
+summed over all scanner workers.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Order of the phases in the API output
+SCAN_PHASES = (
+    "walk",
+    "stat",
+    "classify",
+    "library_lookup",
+    "index",
+    "manual_gallery",
+    "backup_gallery",
+    "persist",
+)
+
+
+class ScanMetrics:
+    """Timings and counters of a single scan"""
+
+    def __init__(self, kind: str):
+        """
+        Args:
+            kind: "full" or "incremental"
+        """
+        self.kind = kind
+        self.started = time.time()
+        self.duration = 0.0
+        self.phases: Dict[str, float] = {}
+        self.files_total = 0
+        self.files_processed = 0
+        self.files_per_second = 0.0
+        self.errors = 0
+        self.cache_entries = 0
+        self.status = "running"
+        self.error: Optional[str] = None
+
+    def add(self, phase: str, seconds: float):
+        """Add time to a phase (phases may be entered more than once)"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as 'name'"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start_time)
+
+    def finish(self, status: str = "ok", error: Optional[str] = None):
+        self.duration = time.time() - self.started
+        self.status = status
+        self.error = error
+
+    def to_dict(self) -> dict:
+        phases = {name: round(self.phases[name], 4) for name in SCAN_PHASES if name in self.phases}
+        return {
+            "kind": self.kind,
+            "status": self.status,
+            "error": self.error,
+            "started": datetime.fromtimestamp(self.started).isoformat(),
+            "duration": round(self.duration, 4),
+            "phases": phases,
+            "files_total": self.files_total,
+            "files_processed": self.files_processed,
+            "files_per_second": round(self.files_per_second, 1),
+            "errors": self.errors,
+            "cache_entries": self.cache_entries,
+        }
+
+
+class ScanHistory:
+    """Thread-safe ring buffer of the most recent scans"""
+
+    def __init__(self, size: int = 20):
+        self.lock = threading.Lock()
+        self.scans: deque = deque(maxlen=size)
+        self.total_scans = 0
+        self.peak_cache_entries = 0
+
+    def record(self, metrics: ScanMetrics):
+        with self.lock:
+            self.scans.append(metrics)
+            self.total_scans += 1
+            self.peak_cache_entries = max(self.peak_cache_entries, metrics.cache_entries)
+
+    def recent(self) -> List[dict]:
+        """Recorded scans, newest first"""
+        with self.lock:
+            scans = list(self.scans)
+        return [metrics.to_dict() for metrics in reversed(scans)]
+
+    def status(self) -> dict:
+        scans = self.recent()
+        return {
+            "total_scans": self.total_scans,
+            "history_size": self.scans.maxlen,
+            "peak_cache_entries": self.peak_cache_entries,
+            "recent": scans,
+        }
@@ -0,0 +1,427 @@
+"""
+Thumbnail Service for the Gallery Grids
+
+Generates downscaled copies of posters and backgrounds on demand, so gallery
+grids do not download full resolution artwork (2000x3000 posters, 3840x2160
+backgrounds) for tiles that are a few hundred pixels wide.
+
+Features:
+- Fixed set of widths, WebP or JPEG output
+- On-disk cache keyed by source path, size and mtime (replaced assets get new thumbnails)
+- Cache size bounded by evicting the least recently used thumbnails
+- Generation runs in a bounded worker pool; concurrent requests for the same
+  thumbnail share one job
+- Tiny placeholder images (a few hundred bytes) that the galleries inline
+  while the thumbnails load
+- Contact sheets: all images of a folder in one sprite plus a coordinate map,
+  cached under a name derived from the folder listing
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Allowed thumbnail widths in pixels
+THUMBNAIL_WIDTHS = (150, 300, 600)
+DEFAULT_THUMBNAIL_WIDTH = 300
+
+# format -> (PIL format, file extension, media type)
+THUMBNAIL_FORMATS = {
+    "webp": ("WEBP", ".webp", "image/webp"),
+    "jpeg": ("JPEG", ".jpg", "image/jpeg"),
+}
+
+THUMBNAIL_QUALITY = 80
+
+# Tile widths of contact sheets and their size limits (decoded sheets are
+# held in memory while they are rendered)
+SHEET_WIDTHS = (150, 300)
+SHEET_MAX_WIDTH = 2048
+SHEET_MAX_HEIGHT = 8192
+
+
+class SheetTile(NamedTuple):
+    """Image of a contact sheet"""
+
+    path: str  # Key of the tile in the coordinate map
+    source: Path
+    size: int
+    mtime: float
+    aspect: float  # Cell height / width; images are cropped to fill the cell
+
+
+# Placeholders are scaled up (and thereby blurred) by the browser
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+PLACEHOLDER_MEDIA_TYPE = "image/webp"
+
+
+class ThumbnailService:
+    """Creates and caches thumbnails of image files"""
+
+    def __init__(self, cache_dir: Path, max_bytes: int, workers: int = 2):
+        """
+        Args:
+            cache_dir: Directory for the generated thumbnails
+            max_bytes: Upper bound for the size of the cache directory
+            workers: Thumbnails generated in parallel
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="Thumbnail"
+        )
+
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Tuple[int, float]] = {}  # {file: (size, last used)}
+        self.total_bytes = 0
+        self.pending: Dict[str, Future] = {}  # Thumbnails being generated
+
+        self.generated = 0
+        self.hits = 0
+        self.evicted = 0
+        self.errors = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_entries()
+        logger.info(
+            f"ThumbnailService initialized: {self.cache_dir} "
+            f"({len(self.entries)} cached, {self.total_bytes / 1024 / 1024:.1f} MB, "
+            f"limit {self.max_bytes / 1024 / 1024:.0f} MB)"
+        )
+
+    def _load_entries(self):
+        """Pick up thumbnails from previous runs"""
+        for entry in os.scandir(self.cache_dir):
+            if not entry.is_file() or entry.name.endswith(".tmp"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            self.entries[entry.name] = (st.st_size, st.st_mtime)
+            self.total_bytes += st.st_size
+        self._evict()
+
+    @staticmethod
+    def cache_name(key: str, size: int, mtime: float, width: int, fmt: str) -> str:
+        """File name of a thumbnail; changes whenever the source file is replaced"""
+        digest = hashlib.sha1(f"{key}|{size}|{mtime}|{width}".encode("utf-8")).hexdigest()
+        return digest + THUMBNAIL_FORMATS[fmt][1]
+
+    async def get(self, source: Path, key: str, width: int, fmt: str) -> Path:
+        """
+        Path of the thumbnail for 'source', generating it if needed
+
+        Args:
+            source: Image file to downscale
+            key: Stable identifier of the source (e.g. "poster_assets/Movies/x/poster.jpg")
+            width: One of THUMBNAIL_WIDTHS
+            fmt: Key of THUMBNAIL_FORMATS
+
+        Raises:
+            FileNotFoundError: If the source does not exist
+            ValueError: For unsupported widths or formats
+        """
+        if width not in THUMBNAIL_WIDTHS:
+            raise ValueError(f"Unsupported thumbnail width: {width}")
+        if fmt not in THUMBNAIL_FORMATS:
+            raise ValueError(f"Unsupported thumbnail format: {fmt}")
+
+        st = await asyncio.to_thread(os.stat, source)
+        name = self.cache_name(key, st.st_size, st.st_mtime, width, fmt)
+        target = self.cache_dir / name
+
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is not None:
+                self.entries[name] = (entry[0], time.time())
+                self.hits += 1
+                return target
+
+            future = self.pending.get(name)
+            if future is None:
+                future = self.executor.submit(self._generate, source, target, width, fmt)
+                self.pending[name] = future
+
+        return await asyncio.wrap_future(future)
+
+    def _generate(self, source: Path, target: Path, width: int, fmt: str) -> Path:
+        """Worker: downscale, write atomically and account for the new file"""
+        name = target.name
+        try:
+            pil_format = THUMBNAIL_FORMATS[fmt][0]
+            with Image.open(source) as img:
+                # JPEG decoders can scale by 1/2..1/8 while decoding, much cheaper than a full decode
+                img.draft("RGB", (width, width * 4))
+                img = ImageOps.exif_transpose(img)
+                if img.mode not in ("RGB", "RGBA") or (pil_format == "JPEG" and img.mode == "RGBA"):
+                    img = img.convert("RGB")
+                if img.width > width:
+                    height = max(1, round(img.height * width / img.width))
+                    img = img.resize((width, height), Image.LANCZOS)
+
+                options = {"quality": THUMBNAIL_QUALITY}
+                if pil_format == "WEBP":
+                    options["method"] = 4
+                else:
+                    options.update(optimize=True, progressive=True)
+
+                tmp_path = target.with_name(name + ".tmp")
+                img.save(tmp_path, pil_format, **options)
+                os.replace(tmp_path, target)
+
+            size = target.stat().st_size
+            with self.lock:
+                self.entries[name] = (size, time.time())
+                self.total_bytes += size
+                self.generated += 1
+                self._evict(keep=(name,))
+            return target
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            with self.lock:
+                self.pending.pop(name, None)
+
+    async def get_sheet(
+        self, key: str, tiles: List[SheetTile], width: int, fmt: str
+    ) -> Tuple[str, dict]:
+        """
+        Contact sheet of 'tiles', generating it if the folder listing changed
+
+        Args:
+            key: Stable identifier of the folder (e.g. "poster_assets/TV/Show (2020)")
+            tiles: Images of the folder
+            width: Tile width, one of SHEET_WIDTHS
+            fmt: Key of THUMBNAIL_FORMATS
+
+        Returns:
+            (file name of the sheet in the cache directory, layout) with layout
+            {"width", "height", "tiles": {path: [x, y, w, h]}, "omitted": count}.
+            Tiles that did not fit or could not be read are not in the map.
+        """
+        if width not in SHEET_WIDTHS:
+            raise ValueError(f"Unsupported sheet width: {width}")
+        if fmt not in THUMBNAIL_FORMATS:
+            raise ValueError(f"Unsupported thumbnail format: {fmt}")
+
+        listing = "|".join(
+            f"{tile.path}:{tile.size}:{tile.mtime}:{tile.aspect}" for tile in tiles
+        )
+        digest = hashlib.sha1(f"{key}|{width}|{listing}".encode("utf-8")).hexdigest()
+        name = digest + THUMBNAIL_FORMATS[fmt][1]
+        layout_name = digest + ".json"
+
+        with self.lock:
+            if name in self.entries and layout_name in self.entries:
+                now = time.time()
+                for entry_name in (name, layout_name):
+                    self.entries[entry_name] = (self.entries[entry_name][0], now)
+                self.hits += 1
+                future = None
+            else:
+                future = self.pending.get(name)
+                if future is None:
+                    future = self.executor.submit(
+                        self._generate_sheet, tiles, width, fmt, name, layout_name
+                    )
+                    self.pending[name] = future
+
+        if future is not None:
+            return name, await asyncio.wrap_future(future)
+        try:
+            layout = await asyncio.to_thread((self.cache_dir / layout_name).read_text, "utf-8")
+            return name, json.loads(layout)
+        except (OSError, ValueError):
+            # Removed behind our back; forget both files and render again
+            with self.lock:
+                for entry_name in (name, layout_name):
+                    entry = self.entries.pop(entry_name, None)
+                    if entry:
+                        self.total_bytes -= entry[0]
+            return await self.get_sheet(key, tiles, width, fmt)
+
+    def touch(self, name: str) -> bool:
+        """Mark a cached file as used; False if it is not cached"""
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None:
+                return False
+            self.entries[name] = (entry[0], time.time())
+            return True
+
+    @staticmethod
+    def _sheet_layout(tiles: List[SheetTile], width: int) -> Tuple[int, int, list]:
+        """
+        Shelf layout: rows of up to SHEET_MAX_WIDTH / width cells, tiles of the
+        same aspect grouped so rows do not waste space
+
+        Returns:
+            (sheet width, sheet height, [(tile, x, y, w, h)])
+        """
+        columns = max(1, SHEET_MAX_WIDTH // width)
+        placed = []
+        x = y = row_height = 0
+        for tile in sorted(tiles, key=lambda tile: tile.aspect):
+            height = max(1, round(width * tile.aspect))
+            if x and (x + width > columns * width or height != row_height):
+                y += row_height
+                x = row_height = 0
+            if y + height > SHEET_MAX_HEIGHT:
+                break
+            placed.append((tile, x, y, width, height))
+            x += width
+            row_height = max(row_height, height)
+        sheet_width = min(len(placed), columns) * width
+        return sheet_width, y + row_height, placed
+
+    def _generate_sheet(
+        self, tiles: List[SheetTile], width: int, fmt: str, name: str, layout_name: str
+    ) -> dict:
+        """Worker: render the sheet, write it and its layout atomically"""
+        try:
+            sheet_width, sheet_height, placed = self._sheet_layout(tiles, width)
+            layout = {"width": sheet_width, "height": sheet_height, "tiles": {}}
+            pil_format = THUMBNAIL_FORMATS[fmt][0]
+
+            sheet = Image.new("RGB", (max(1, sheet_width), max(1, sheet_height)))
+            for tile, x, y, w, h in placed:
+                try:
+                    with Image.open(tile.source) as img:
+                        img.draft("RGB", (w * 2, h * 2))
+                        img = ImageOps.exif_transpose(img)
+                        if img.mode != "RGB":
+                            img = img.convert("RGB")
+                        sheet.paste(ImageOps.fit(img, (w, h), Image.LANCZOS), (x, y))
+                    layout["tiles"][tile.path] = [x, y, w, h]
+                except Exception as e:
+                    # The client shows the image itself for tiles without coordinates
+                    logger.debug(f"Could not add {tile.source} to a contact sheet: {e}")
+            layout["omitted"] = len(tiles) - len(layout["tiles"])
+
+            target = self.cache_dir / name
+            tmp_path = target.with_name(name + ".tmp")
+            options = {"quality": THUMBNAIL_QUALITY}
+            if pil_format == "WEBP":
+                options["method"] = 4
+            else:
+                options.update(optimize=True, progressive=True)
+            sheet.save(tmp_path, pil_format, **options)
+            os.replace(tmp_path, target)
+
+            layout_target = self.cache_dir / layout_name
+            tmp_path = layout_target.with_name(layout_name + ".tmp")
+            tmp_path.write_text(json.dumps(layout, separators=(",", ":")), "utf-8")
+            os.replace(tmp_path, layout_target)
+
+            now = time.time()
+            with self.lock:
+                for entry_name, path in ((name, target), (layout_name, layout_target)):
+                    size = path.stat().st_size
+                    previous = self.entries.get(entry_name)
+                    if previous is not None:
+                        self.total_bytes -= previous[0]
+                    self.entries[entry_name] = (size, now)
+                    self.total_bytes += size
+                self.generated += 1
+                self._evict(keep=(name, layout_name))
+            return layout
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        finally:
+            with self.lock:
+                self.pending.pop(name, None)
+
+    def _evict(self, keep: Tuple[str, ...] = ()):
+        """Delete least recently used thumbnails until the cache fits (lock held)"""
+        if self.total_bytes <= self.max_bytes:
+            return
+
+        # Shrink to 90% so eviction does not run for every new thumbnail
+        goal = self.max_bytes * 0.9
+        for name, (size, _used) in sorted(self.entries.items(), key=lambda item: item[1][1]):
+            if self.total_bytes <= goal:
+                break
+            if name in keep:
+                continue
+            try:
+                (self.cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not delete thumbnail {name}: {e}")
+                continue
+            del self.entries[name]
+            self.total_bytes -= size
+            self.evicted += 1
+
+    def status(self) -> dict:
+        with self.lock:
+            return {
+                "cache_dir": str(self.cache_dir),
+                "cached": len(self.entries),
+                "size_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "pending": len(self.pending),
+                "generated": self.generated,
+                "hits": self.hits,
+                "evicted": self.evicted,
+                "errors": self.errors,
+            }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def create_placeholder(source: Path) -> bytes:
+    """
+    Low-quality placeholder of an image: PLACEHOLDER_WIDTH pixels wide WebP
+
+    Raises:
+        OSError: If the image cannot be read
+    """
+    with Image.open(source) as img:
+        img.draft("RGB", (PLACEHOLDER_WIDTH * 8, PLACEHOLDER_WIDTH * 32))
+        img = ImageOps.exif_transpose(img)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        height = max(1, round(img.height * PLACEHOLDER_WIDTH / img.width))
+        img = img.resize((PLACEHOLDER_WIDTH, height), Image.BILINEAR, reducing_gap=2.0)
+
+        buffer = io.BytesIO()
+        img.save(buffer, "WEBP", quality=PLACEHOLDER_QUALITY, method=6)
+        return buffer.getvalue()
+
+
+def create_thumbnail_service(
+    cache_dir: Path, max_bytes: int, workers: int = 2
+) -> ThumbnailService:
+    """
+    Factory function to create a ThumbnailService
+
+    Args:
+        cache_dir: Directory for the generated thumbnails
+        max_bytes: Upper bound for the size of the cache directory
+        workers: Thumbnails generated in parallel
+
+    Returns:
+        Configured ThumbnailService instance
+    """
+    return ThumbnailService(cache_dir=cache_dir, max_bytes=max_bytes, workers=workers)
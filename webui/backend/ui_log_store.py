@@ -0,0 +1,188 @@
+"""
+Parsed Store for the Unified UI Log View
+
+/api/logs/ui/unified used to read and regex-parse all of FrontendUI.log on
+every request. UILogStore keeps the most recent entries parsed in memory and
+only parses lines appended since the last request, so a request costs about
+as much as the page it returns.
+
+Features:
+- Ring buffer of the last 'capacity' entries, seeded from the end of the file
+- Incremental reads from the last byte offset; after a rotation the rest of
+  the rotated file is read from its backup, truncation starts over
+- Newest-first filtering by level, source and component that stops as soon
+  as the page is full
+"""
+
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from log_tail import complete_lines_end, find_log, open_log, read_lines_after, read_lines_before
+
+# Backend format: [TIMESTAMP] [LEVEL] [BACKEND:module:function:line] - MESSAGE
+# Frontend format: [TIMESTAMP] [LEVEL] [UI:Component] - MESSAGE
+ENTRY_PATTERN = re.compile(r"^\[([^\]]+)\]\s+\[([^\]]+)\]\s+\[(BACKEND|UI):([^\]]+)\]\s+-\s+(.*)$")
+
+# Request value -> stored "source"
+SOURCE_ALIASES = {"backend": "backend", "ui": "frontend", "frontend": "frontend", "unknown": "unknown"}
+
+# Lines parsed per read while catching up with the file
+READ_BATCH_LINES = 5000
+
+# Bytes compared to recognize the rotated backup of the file being read
+HEAD_SIZE = 256
+
+
+def parse_entry(line: str) -> Dict:
+    """Parse one FrontendUI.log line into a unified log entry"""
+    match = ENTRY_PATTERN.match(line)
+    if match:
+        timestamp, level, prefix, component, message = match.groups()
+        return {
+            "timestamp": timestamp,
+            "level": level.strip(),
+            "source": "backend" if prefix == "BACKEND" else "frontend",
+            "component": component,
+            "message": message,
+            "raw": line,
+        }
+    # If no pattern matches, include as raw log
+    return {
+        "timestamp": "",
+        "level": "UNKNOWN",
+        "source": "unknown",
+        "component": "",
+        "message": line,
+        "raw": line,
+    }
+
+
+class UILogStore:
+    """Last 'capacity' parsed entries of a log file, updated from its byte offset"""
+
+    def __init__(self, path: Path, capacity: int = 10000):
+        self.path = Path(path)
+        self.capacity = capacity
+        self.entries: deque = deque(maxlen=capacity)
+        self.offset: Optional[int] = None  # None = not loaded yet
+        self.total = 0  # Entries parsed, including those dropped from the buffer
+        self.has_older = False  # File has entries from before the buffer was seeded
+        self.identity: Optional[tuple] = None  # (st_dev, st_ino) of the file being read
+        self.head = b""  # First bytes of that file
+        self.lock = threading.Lock()
+
+    def _append(self, lines: Iterable[str]):
+        for line in lines:
+            line = line.strip()
+            if line:
+                self.entries.append(parse_entry(line))
+                self.total += 1
+
+    def _read_from(self, path: Path, size: Optional[int] = None):
+        """Parse complete lines of 'path' from the current offset up to 'size' (None = the end)"""
+        while size is None or self.offset < size:
+            lines, offset, _ = read_lines_after(path, self.offset, READ_BATCH_LINES)
+            if not lines:
+                break  # Only an incomplete line left
+            self._append(lines)
+            self.offset = offset
+
+    def _finish_rotated(self) -> bool:
+        """
+        Read the rest of the previous file from its rotated backup (<name>.1,
+        plain or compressed); False if the backup is not that file
+        """
+        backup = find_log(self.path.parent, self.path.name + ".1")
+        if backup is None or not self.head:
+            return False
+        try:
+            with open_log(backup) as f:
+                if f.read(len(self.head)) != self.head:
+                    return False
+            self._read_from(backup)
+        except (OSError, EOFError):
+            return False
+        return True
+
+    def refresh(self) -> bool:
+        """Parse lines appended since the last call; False if the file does not exist"""
+        with self.lock:
+            try:
+                with open(self.path, "rb") as f:
+                    st = os.fstat(f.fileno())
+                    head = f.read(HEAD_SIZE)
+                size = st.st_size
+            except OSError:
+                self.entries.clear()
+                self.offset = None
+                self.total = 0
+                self.has_older = False
+                self.identity = None
+                self.head = b""
+                return False
+
+            identity = (st.st_dev, st.st_ino)
+            length = min(len(head), len(self.head))
+            # A compressing rotation deletes the old file, so the new one can
+            # get the same inode: the first bytes tell them apart
+            rotated = identity != self.identity or head[:length] != self.head[:length]
+            if self.offset is not None and rotated:
+                # Rotated: finish the old file, then read the new one from the start
+                if self._finish_rotated():
+                    self.offset = 0
+                else:
+                    self.offset = None
+            self.identity = identity
+            self.head = head
+
+            if self.offset is None or size < self.offset:
+                # First load or truncated: seed the buffer from the end of the file
+                self.entries.clear()
+                self.total = 0
+                end = complete_lines_end(self.path)
+                lines, start, _ = read_lines_before(self.path, self.capacity, end)
+                self._append(lines)
+                self.offset = end
+                self.has_older = start > 0
+
+            self._read_from(self.path, size)
+            return True
+
+    def query(
+        self,
+        tail: int = 500,
+        levels: Optional[Iterable[str]] = None,
+        sources: Optional[Iterable[str]] = None,
+        component: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        Newest matching entries, returned oldest first
+
+        Args:
+            tail: Maximum number of entries (0 = all buffered)
+            levels: Levels to include (case-insensitive)
+            sources: "backend", "ui"/"frontend" or "unknown"
+            component: Case-insensitive substring of the component
+        """
+        levels = {level.strip().upper() for level in levels or [] if level.strip()}
+        sources = {SOURCE_ALIASES.get(source.strip().lower(), source) for source in sources or [] if source.strip()}
+        component = component.lower() if component else None
+
+        result = []
+        with self.lock:
+            for entry in reversed(self.entries):
+                if levels and entry["level"].upper() not in levels:
+                    continue
+                if sources and entry["source"] not in sources:
+                    continue
+                if component and component not in entry["component"].lower():
+                    continue
+                result.append(entry)
+                if tail and len(result) >= tail:
+                    break
+        result.reverse()
+        return result
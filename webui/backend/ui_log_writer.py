@@ -0,0 +1,172 @@
+"""
+Buffered Writer for FrontendUI.log
+
+FrontendUI.log receives every backend log record plus the entries the
+frontend posts to /api/logs/ui. Both used to be written separately: backend
+records through a QueueListener, UI entries by opening the file on every
+request inside the event loop. This module gives the file a single owner.
+
+Features:
+- One background thread writes all records from an in-memory queue
+- Callers only enqueue; UI entries are timestamped and formatted in the
+  writer thread
+- Writes are buffered and flushed at least every 'flush_interval' seconds
+- Size-based rotation (FrontendUI.log.1, .2, ...) with a fixed number of
+  backups, optionally stored compressed (FrontendUI.log.1.gz, ...)
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, RotatingFileHandler
+from pathlib import Path
+from typing import Optional
+
+from log_archive import archive_name, rotate_compressed
+
+BACKEND_FORMAT = "[%(asctime)s] [%(levelname)-8s] [BACKEND:%(name)s:%(funcName)s:%(lineno)d] - %(message)s"
+UI_FORMAT = "[%(asctime)s] [%(levelname)-8s] [UI:%(ui_component)s] - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Logger name of records created for /api/logs/ui entries
+UI_RECORD_NAME = "frontend.ui"
+
+
+class UILogFormatter(logging.Formatter):
+    """Backend format for log records, UI format for entries posted by the frontend"""
+
+    def __init__(self):
+        super().__init__(BACKEND_FORMAT, datefmt=DATE_FORMAT)
+        self.ui_formatter = logging.Formatter(UI_FORMAT, datefmt=DATE_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        if hasattr(record, "ui_component"):
+            return self.ui_formatter.format(record)
+        return super().format(record)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that leaves flushing to its owner
+
+    The stock handler calls tell() (which flushes) and stat() for every
+    record to decide on rotation; this one tracks the size of the file itself.
+    """
+
+    size = 0
+
+    def _open(self):
+        stream = super()._open()
+        self.size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self.size and self.size + len(msg) > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self.size += len(msg)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        pass
+
+    def flush_buffer(self):
+        super().flush()
+
+
+class UILogWriter:
+    """Background thread writing queued records to a rotating log file"""
+
+    def __init__(
+        self,
+        path: Path,
+        level: int = logging.INFO,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+        flush_interval: float = 1.0,
+        compress: bool = False,
+    ):
+        """
+        Args:
+            path: Log file (FrontendUI.log)
+            level: Minimum level of backend records (UI entries are always written)
+            max_bytes: Rotate when the file would exceed this size (0 = never)
+            backup_count: Rotated files kept
+            flush_interval: Maximum seconds a written record stays buffered
+            compress: Store rotated files as gzip archives
+        """
+        self.path = Path(path)
+        self.level = level
+        self.flush_interval = flush_interval
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handler = BufferedRotatingFileHandler(
+            self.path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        self.handler.setFormatter(UILogFormatter())
+        if compress:
+            self.handler.namer = archive_name
+            self.handler.rotator = rotate_compressed
+        self.thread: Optional[threading.Thread] = None
+        self._stop = object()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="UILogWriter", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Write everything queued so far and close the file"""
+        if self.thread is None:
+            return
+        self.queue.put(self._stop)
+        self.thread.join(timeout=10)
+        self.thread = None
+        self.handler.close()
+
+    def queue_handler(self) -> QueueHandler:
+        """Logging handler feeding backend records into the writer"""
+        handler = QueueHandler(self.queue)
+        handler.setLevel(self.level)
+        return handler
+
+    def write_ui(self, level: str, component: str, message: str):
+        """Queue an entry posted by the frontend; the current time is its timestamp"""
+        self.queue.put(
+            logging.makeLogRecord(
+                {
+                    "name": UI_RECORD_NAME,
+                    "levelname": level.upper(),
+                    "msg": message,
+                    "ui_component": component,
+                }
+            )
+        )
+
+    def _run(self):
+        last_flush = time.monotonic()
+        pending = False
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval if pending else None)
+            except queue.Empty:
+                record = None
+
+            if record is self._stop:
+                break
+            if record is not None:
+                self.handler.emit(record)
+                pending = True
+
+            now = time.monotonic()
+            if pending and (record is None or now - last_flush >= self.flush_interval):
+                self.handler.flush_buffer()
+                pending = False
+                last_flush = now
@@ -24,6 +24,7 @@ import AssetReplacer from "./AssetReplacer";
 import ScrollToButtons from "./ScrollToButtons";
 import ImagePreviewModal from "./ImagePreviewModal";
 import { buildResponsiveGridClass } from "../utils/gridClass";
+import { placeholderStyle, withCacheBuster } from "../utils/assetUrl";
 
 const API_URL = "/api";
 
@@ -231,7 +232,7 @@ function BackgroundsGallery() {
   };
 
   // Cache busting timestamp for force-reloading images after replacement
-  const [cacheBuster, setCacheBuster] = useState(Date.now());
+  const [cacheBuster, setCacheBuster] = useState(0);
 
   // Image size state with localStorage (2-20 range, default 5)
   const [imageSize, setImageSize] = useState(() => {
@@ -1043,7 +1044,8 @@ function BackgroundsGallery() {
                       onClick={() => toggleImageSelection(image.path)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
@@ -1102,7 +1104,8 @@ function BackgroundsGallery() {
                       onClick={() => setSelectedImage(image)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
@@ -690,7 +690,7 @@ function BackupAssets() {
                     }
                   >
                     <img
-                      src={asset.url}
+                      src={asset.thumbnail_url || asset.url}
                       alt={asset.name}
                       className="w-full h-full object-cover transition-transform group-hover:scale-105"
                       loading="lazy"
@@ -1083,7 +1083,7 @@ function BackupAssets() {
                           }
                         >
                           <img
-                            src={asset.url}
+                            src={asset.thumbnail_url || asset.url}
                             className="w-full h-full object-cover transition-transform group-hover:scale-105"
                             loading="lazy"
                             alt={asset.name}
@@ -252,9 +252,10 @@ function Dashboard() {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          if (data.type === "log") {
-            setAllLogs((prev) => [...prev, data.content]);
-            setStatus((prev) => ({ ...prev, last_logs: [...prev.last_logs.slice(-24), data.content] }));
+          if (data.type === "log_batch" || data.type === "log_resync") {
+            const lines = data.lines;
+            setAllLogs((prev) => (data.type === "log_resync" ? lines : [...prev, ...lines]));
+            setStatus((prev) => ({ ...prev, last_logs: [...prev.last_logs, ...lines].slice(-25) }));
           } else if (data.type === "log_file_changed") {
             setAllLogs([]);
             disconnectDashboardWebSocket();
@@ -24,8 +24,21 @@ import ImagePreviewModal from "./ImagePreviewModal";
 import ScrollToButtons from "./ScrollToButtons";
 import AssetReplacer from "./AssetReplacer";
 import { buildResponsiveGridClass } from "../utils/gridClass";
+import {
+  placeholderStyle,
+  sheetTileStyle,
+  withCacheBuster,
+} from "../utils/assetUrl";
 
 const API_URL = "/api";
+// Folders with at least this many images load them as one contact sheet
+const SHEET_MIN_ASSETS = 12;
+// Sheet tile width: 300px like the thumbnails of the other galleries while
+// the folder fits on one sheet at that size (6 columns, 8192px high), 150px
+// for larger folders so every image stays on the sheet
+const SHEET_TILE_WIDTH = 300;
+const SHEET_SMALL_TILE_WIDTH = 150;
+const SHEET_LARGE_TILES_MAX_ASSETS = 96;
 
 function FolderView() {
   const { t } = useTranslation();
@@ -40,7 +53,9 @@ function FolderView() {
   // UI state
   const [searchTerm, setSearchTerm] = useState("");
   const [selectedImage, setSelectedImage] = useState(null);
-  const [cacheBuster, setCacheBuster] = useState(Date.now());
+  const [cacheBuster, setCacheBuster] = useState(0);
+  const [sheet, setSheet] = useState(null); // Contact sheet of the current folder
+  const sheetPathRef = useRef(null);
 
   // Search history to preserve filters per folder
   const searchHistoryRef = useRef({});
@@ -117,6 +132,36 @@ function FolderView() {
     localStorage.setItem("gallery-folder-size", imageSize);
   }, [imageSize]);
 
+  // Load the contact sheet of a folder (one request instead of one per image)
+  const fetchSheet = async (path, assetCount) => {
+    sheetPathRef.current = path;
+    if (assetCount < SHEET_MIN_ASSETS) {
+      setSheet(null);
+      return;
+    }
+    const width =
+      assetCount > SHEET_LARGE_TILES_MAX_ASSETS
+        ? SHEET_SMALL_TILE_WIDTH
+        : SHEET_TILE_WIDTH;
+    try {
+      const response = await fetch(
+        `${API_URL}/folder-view/sheet?path=${encodeURIComponent(
+          path
+        )}&width=${width}`
+      );
+      const data = response.ok ? await response.json() : null;
+      // Ignore responses for a folder the user already left
+      if (sheetPathRef.current === path) {
+        setSheet(data?.success ? data : null);
+      }
+    } catch (err) {
+      console.error("Error fetching contact sheet:", err);
+      if (sheetPathRef.current === path) {
+        setSheet(null);
+      }
+    }
+  };
+
   // Fetch data from the new recursive API
   const fetchData = async (
     path,
@@ -143,6 +188,10 @@ function FolderView() {
       if (data.success) {
         setItems(data.items || []);
         setCurrentPath(data.path || "");
+        fetchSheet(
+          data.path || "",
+          (data.items || []).filter((item) => item.type === "asset").length
+        );
         if (showToast) {
           showSuccess(`Loaded content for ${data.path || "root"}`);
         }
@@ -664,12 +713,22 @@ function FolderView() {
                         }
                       }}
                     >
-                      <img
-                        src={`${asset.url}?t=${cacheBuster}`}
-                        alt={asset.name}
-                        className="w-full h-full object-cover transition-transform group-hover:scale-105"
-                        loading="lazy"
-                      />
+                      {sheetTileStyle(sheet, asset.path) ? (
+                        <div
+                          role="img"
+                          aria-label={asset.name}
+                          style={sheetTileStyle(sheet, asset.path)}
+                          className="w-full h-full transition-transform group-hover:scale-105"
+                        />
+                      ) : (
+                        <img
+                          src={withCacheBuster(asset.thumbnail_url || asset.url, cacheBuster)}
+                          style={placeholderStyle(asset.placeholder)}
+                          alt={asset.name}
+                          className="w-full h-full object-cover transition-transform group-hover:scale-105"
+                          loading="lazy"
+                        />
+                      )}
                       <div className="absolute inset-0 bg-black/50 opacity-0 group-hover:opacity-100 transition-opacity flex items-center justify-center">
                         <Eye className="w-6 h-6 text-white drop-shadow-lg" />
                       </div>
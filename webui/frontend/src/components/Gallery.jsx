@@ -23,6 +23,7 @@ import AssetReplacer from "./AssetReplacer";
 import ScrollToButtons from "./ScrollToButtons";
 import ImagePreviewModal from "./ImagePreviewModal";
 import { buildResponsiveGridClass } from "../utils/gridClass";
+import { placeholderStyle, withCacheBuster } from "../utils/assetUrl";
 
 const API_URL = "/api";
 
@@ -239,7 +240,7 @@ function Gallery() {
   const itemsPerPageDropdownRef = useRef(null);
 
   // Cache busting timestamp for force-reloading images after replacement
-  const [cacheBuster, setCacheBuster] = useState(Date.now());
+  const [cacheBuster, setCacheBuster] = useState(0);
 
   // Image size state with localStorage (2-20 range, default 5)
   const [imageSize, setImageSize] = useState(() => {
@@ -1042,7 +1043,8 @@ function Gallery() {
                       onClick={() => toggleImageSelection(image.path)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
@@ -1101,7 +1103,8 @@ function Gallery() {
                       onClick={() => setSelectedImage(image)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
@@ -8,6 +8,7 @@ import {
   ImageIcon,
 } from "lucide-react";
 import { useTranslation } from "react-i18next";
+import { withCacheBuster } from "../utils/assetUrl";
 
 /**
  * Global Image Preview Modal Component
@@ -19,7 +20,7 @@ import { useTranslation } from "react-i18next";
  * @param {Function} props.onDelete - Callback when delete button is clicked
  * @param {Function} props.onReplace - Callback when replace button is clicked
  * @param {boolean} props.isDeleting - Whether delete operation is in progress
- * @param {number} props.cacheBuster - Timestamp for cache busting
+ * @param {number} props.cacheBuster - Timestamp for cache busting (0 keeps cached images)
  * @param {Function} props.formatDisplayPath - Function to format the display path
  * @param {Function} props.formatTimestamp - Function to format the timestamp
  * @param {Function} props.getMediaType - Function to get media type from path/name
@@ -31,7 +32,7 @@ function ImagePreviewModal({
   onDelete,
   onReplace,
   isDeleting = false,
-  cacheBuster = Date.now(),
+  cacheBuster = 0,
   formatDisplayPath,
   formatTimestamp,
   getMediaType,
@@ -91,7 +92,7 @@ function ImagePreviewModal({
           {/* Image */}
           <div className="flex-1 flex items-center justify-center bg-black p-4">
             <img
-              src={`${selectedImage.url}?t=${cacheBuster}`}
+              src={withCacheBuster(selectedImage.url, cacheBuster)}
               alt={selectedImage.name}
               className="max-w-full max-h-[80vh] object-contain"
               onError={(e) => {
@@ -428,10 +428,16 @@ function LogViewer() {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          if (data.type === "log") {
-            const parsedLine = parseLogLine(data.content);
-            if (parsedLine.raw) {
-              logBufferRef.current.push(parsedLine);
+          if (data.type === "log_batch" || data.type === "log_resync") {
+            const parsedLines = data.lines
+              .map((line) => parseLogLine(line))
+              .filter((parsedLine) => parsedLine.raw);
+            if (data.type === "log_resync") {
+              // Fell behind and the backend dropped lines: start over from its tail
+              logBufferRef.current = [];
+              setLogs(parsedLines);
+            } else {
+              logBufferRef.current.push(...parsedLines);
             }
           } else if (data.type === "log_file_changed") {
             console.log(`Backend wants to switch to: ${data.log_file}`);
@@ -1031,7 +1031,7 @@ function ManualAssets() {
                     }}
                   >
                     <img
-                      src={asset.url}
+                      src={asset.thumbnail_url || asset.url}
                       alt={asset.name}
                       className="w-full h-full object-cover"
                       loading="lazy"
@@ -1598,7 +1598,7 @@ function ManualAssets() {
                           }}
                         >
                           <img
-                            src={asset.url}
+                            src={asset.thumbnail_url || asset.url}
                             alt={asset.name}
                             className="w-full h-full object-cover transition-transform group-hover:scale-105"
                             loading="lazy"
@@ -24,6 +24,7 @@ import AssetReplacer from "./AssetReplacer";
 import ScrollToButtons from "./ScrollToButtons";
 import ImagePreviewModal from "./ImagePreviewModal";
 import { buildResponsiveGridClass } from "../utils/gridClass";
+import { placeholderStyle, withCacheBuster } from "../utils/assetUrl";
 
 const API_URL = "/api";
 
@@ -217,7 +218,7 @@ function SeasonGallery() {
   const [assetToReplace, setAssetToReplace] = useState(null);
 
   // Cache busting timestamp for force-reloading images after replacement
-  const [cacheBuster, setCacheBuster] = useState(Date.now());
+  const [cacheBuster, setCacheBuster] = useState(0);
 
   // Dropdown state
   const [itemsPerPageDropdownOpen, setItemsPerPageDropdownOpen] =
@@ -1009,7 +1010,8 @@ function SeasonGallery() {
                       onClick={() => toggleImageSelection(image.path)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
@@ -1068,7 +1070,8 @@ function SeasonGallery() {
                       onClick={() => setSelectedImage(image)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
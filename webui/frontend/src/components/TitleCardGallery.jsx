@@ -24,6 +24,7 @@ import AssetReplacer from "./AssetReplacer";
 import ScrollToButtons from "./ScrollToButtons";
 import ImagePreviewModal from "./ImagePreviewModal";
 import { buildResponsiveGridClass } from "../utils/gridClass";
+import { placeholderStyle, withCacheBuster } from "../utils/assetUrl";
 
 const API_URL = "/api";
 
@@ -217,7 +218,7 @@ function TitleCardGallery() {
   const [assetToReplace, setAssetToReplace] = useState(null);
 
   // Cache-busting state to force image reload after replacement
-  const [cacheBuster, setCacheBuster] = useState(Date.now());
+  const [cacheBuster, setCacheBuster] = useState(0);
 
   // Helper to encode path segments but keep slashes
   const safeEncodePath = (path) => {
@@ -1006,7 +1007,8 @@ function TitleCardGallery() {
                       onClick={() => toggleImageSelection(image.path)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
@@ -1069,7 +1071,8 @@ function TitleCardGallery() {
                       onClick={() => setSelectedImage(image)}
                     >
                       <img
-                        src={`${image.url}?t=${cacheBuster}`}
+                        src={withCacheBuster(image.thumbnail_url || image.url, cacheBuster)}
+                        style={placeholderStyle(image.placeholder)}
                         alt={image.name}
                         className="w-full h-full object-cover rounded"
                         loading="lazy"
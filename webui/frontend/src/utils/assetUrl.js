@@ -0,0 +1,50 @@
+// Asset URLs from the API are versioned (?t=<mtime>) and served as immutable,
+// so the browser only refetches an image when the file actually changed.
+
+/**
+ * Append a cache buster to an asset URL.
+ * A falsy cacheBuster keeps the URL as is, so cached images are reused; set it
+ * to Date.now() after replacing assets to force a reload.
+ * @param {string} url - Asset URL, may already carry a query string
+ * @param {number} cacheBuster - Timestamp, or 0 for none
+ * @returns {string}
+ */
+export const withCacheBuster = (url, cacheBuster) => {
+  if (!url || !cacheBuster) return url;
+  return `${url}${url.includes("?") ? "&" : "?"}cb=${cacheBuster}`;
+};
+
+/**
+ * Inline style showing an asset's low-quality placeholder until the image loads.
+ * The browser scales the tiny image up, which blurs it.
+ * @param {string} placeholder - Data URI from the API, may be missing
+ * @returns {object|undefined}
+ */
+export const placeholderStyle = (placeholder) =>
+  placeholder
+    ? {
+        backgroundImage: `url("${placeholder}")`,
+        backgroundSize: "cover",
+        backgroundPosition: "center",
+      }
+    : undefined;
+
+/**
+ * Inline style that shows one tile of a contact sheet (sprite) as the
+ * element's background. The element must have the tile's aspect ratio.
+ * @param {object} sheet - Response of /api/folder-view/sheet
+ * @param {string} path - Asset path (key of sheet.tiles)
+ * @returns {object|undefined} Style, or undefined if the asset is not on the sheet
+ */
+export const sheetTileStyle = (sheet, path) => {
+  const tile = sheet?.sheet_url && sheet.tiles?.[path];
+  if (!tile) return undefined;
+  const [x, y, w, h] = tile;
+  const offset = (position, tileSize, sheetSize) =>
+    sheetSize > tileSize ? (position / (sheetSize - tileSize)) * 100 : 0;
+  return {
+    backgroundImage: `url("${sheet.sheet_url}")`,
+    backgroundSize: `${(sheet.width / w) * 100}% ${(sheet.height / h) * 100}%`,
+    backgroundPosition: `${offset(x, w, sheet.width)}% ${offset(y, h, sheet.height)}%`,
+  };
+};